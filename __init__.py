@@ -1,80 +1,72 @@
 import sys
-import os
 import time as TM
-import tqdm
-import contextlib
 from .condition import *
-from .database import DataBase
+from .database import DataBase, Items
+from .cache import TableCache
+from .timing import StartupReport, phase
+from .shared import SharedMirror
+from .database_lib import register_driver, get_driver, drivers
+from .scheduler import Scheduler, Job, get_scheduler
+from .migrate import copy_table
 from pandas import Series, DataFrame
 from functools import partial
-from threading import Thread, Timer
-import asyncio
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, Future
 import types
 from typing import Union
 
-if sys.version_info >= (3, 7) and sys.version_info < (3, 12):
-	import imp
-	def load_source(method, module_path):
-		"""
-		 Load a module and return its queryPY. This is a wrapper around imp. load_source that allows you to pass an absolute path to the module without having to worry about the path being relative to the Python interpreter.
-		 
-		 @param method - The name of the method to load. For example'py'or'cpython '.
-		 @param module_path - The absolute path to the module.
-		 
-		 @return The : class : ` ~pyspark. sql. RowProxy ` that was loaded from the module
-		"""
-		try:
-			module = imp.load_source(method, module_path)
-			return module.queryPY
-		except BaseException as e:
-			raise e
-elif sys.version_info >= (3, 12):
-	import importlib
-	def load_source(method, module_path):
-		"""
-		 Load a module and return its queryPY. This is a convenience function for calling : func : ` importlib. util. module_from_file_location ` with
-		 
-		 @param method - Name of the method to use
-		 @param module_path - Path to the module to load
-		 
-		 @return A : class : ` pytest. queryPY. QueryPy ` object or None if the module could not be
-		"""
-		spec = importlib.util.spec_from_file_location(method, module_path)
-		module = importlib.util.module_from_spec(spec)
-		try:
-			spec.loader.exec_module(module)
-			return module.queryPY
-		except BaseException as e:
-			raise e
-else:
+if sys.version_info < (3, 6):
 	raise ImportError('The Python version does not support this module. Module available since Python >= 3.6.x')
 
-class RunInterval(Timer):
+class RunInterval:
 
-	def __init__(self,obj,args=None, kwargs=None,t=1,to=None):
+	def __init__(self,obj,args=None, kwargs=None,t=1,to=None,jitter=0.0,timeout=None,on_error=None):
 		"""
-		 Initialize the timer. This is called by __init__ and should not be called directly. Instead use start () and cancel () to start the timer
+		 Initialize a periodic call of a function. The call runs on the shared scheduler (see get_scheduler) instead of a thread of its own. Use start () and cancel () to start and stop it
 		 
-		 @param obj - The object that will be used to run the timer
-		 @param args - Positional arguments to pass to the object's __init__ method
-		 @param kwargs - Keyword arguments to pass to the object's __init__ method
-		 @param t - Time in seconds to wait before starting the timer
-		 @param to - Time in seconds to wait before canceling the
-		"""
-		super(RunInterval,self).__init__(t,obj,args,kwargs)
-		# sleeps to the given time.
+		 @param obj - The function that will be called
+		 @param args - Positional arguments to pass to the function
+		 @param kwargs - Keyword arguments to pass to the function
+		 @param t - Time in seconds between the calls
+		 @param to - Time in seconds after which the calls are canceled. If given the calls are started at once; the caller is not blocked
+		 @param jitter - Up to this many seconds are added at random to every wait
+		 @param timeout - A call that takes longer is reported to on_error as TimeoutError
+		 @param on_error - Called as on_error(exception) when a call fails
+		"""
+		self.function = obj
+		self.args = args if args is not None else []
+		self.kwargs = kwargs if kwargs is not None else {}
+		self.interval = t
+		self.jitter = jitter
+		self.timeout = timeout
+		self.on_error = on_error
+		self.job = None
+		# Cancels the calls after the given time.
 		if to != None:
 			self.start()
-			TM.sleep(to)
-			self.cancel()
+			get_scheduler().once(to, self.cancel, name='RunInterval.cancel')
+
+	def start(self):
+		"""
+		 Start calling the function every interval seconds. The first call is made after one interval
+		"""
+		self.cancel()
+		self.job = get_scheduler().every(self.interval, self.function, self.args, self.kwargs, jitter=self.jitter, timeout=self.timeout, on_error=self.on_error)
 
-	def run(self):
+	def cancel(self):
 		"""
-		 Run the function until self. finished is set to False. This is a blocking call so you don't have to worry about this
+		 Stop the calls. A call that is running is finished
 		"""
-		# Wait for the interval to finish.
-		while not self.finished.wait(self.interval):
-			self.function(*self.args,**self.kwargs)
+		if self.job is not None:
+			self.job.cancel()
+
+	def is_alive(self):
+		"""
+		 Check if the calls are still scheduled
+		 
+		 @return True if the function will be called again
+		"""
+		return self.job is not None and self.job.is_active()
 
 class ProgressBar:
 	def __init__(self, max_value, desc="Loading: ", disable=True):
@@ -97,6 +89,7 @@ class ProgressBar:
 		 
 		 @return A : class : ` ~kivy. graph_objs. ProgressBar ` object that can be used to draw the progress bar
 		"""
+		import tqdm
 		return tqdm.tqdm(
 			total=self.max_value,
 			desc=self.desc,
@@ -119,7 +112,7 @@ class ProgressBar:
 
 class QueryRead:
 
-	__DATA_DIR__ = os.path.dirname(__file__)
+	__WRITES__ = ['INSERT','BULK_INSERT','COPY','UPDATE','DELETE','UPSERT','UPDATE_MANY','DELETE_KEYS','DROP','CREATE','RENAME_TABLE','ALTER_COLUMN','ADD_COLUMN','DROP_COLUMN','RENAME_COLUMN']
 
 	__METHODS__ = ['sqlite','mysql','_1c','excel','postgresql','sqlserver','googlesheet','access','oracle']
 
@@ -127,6 +120,8 @@ class QueryRead:
 			bd:dict={},
 			thread:bool=False, limit:int=0, prog:bool=False,
 			auto_commit:bool=True, 
+			parallel:int=1, split:int=100000,
+			cache_dir:str=None, report:Union[bool,str]=False,
 			**data
 		):
 		"""
@@ -137,17 +132,32 @@ class QueryRead:
 			 @param limit - maximum number of records to read
 			 @param prog - if True print progress to stdout ( default False )
 			 @param auto_commit - if True auto commit to database ( default False
+			 @param parallel - number of connections used to load one large table ( default 1
+			 @param split - minimum number of rows of a table loaded over several connections ( default 100000
+			 @param cache_dir - directory of the on-disk snapshot cache, unchanged tables are read from it on start ( default None
+			 @param report - if True collect a per-phase startup report in STARTUP, if a path also append it to that file as JSON lines ( default False
 		"""
 		super(QueryRead, self).__init__()
 		self.limit = max(int(limit),0)
 		self.prog = prog
 		self.thread = thread
+		self.parallel = max(int(parallel),1)
+		self.split = max(int(split),1)
+		self.cache = TableCache(cache_dir) if cache_dir is not None else None
 		self.parameters = {
 			'auto_commit':auto_commit
 		}
 		self.LENGTH = 0
 		self.WORKING_TIME = TM.time()
 		self.__bd = bd if len(bd)>0 else data
+		self.report = StartupReport(report if isinstance(report, str) else None) if report else None
+		self.STARTUP = None
+		self.__loaded = 0
+		self.__markers = {}
+		self.__written = set()
+		self.__futures = {}
+		self.__progress = {}
+		self.__lock = Lock()
 		self.step = 0
 		self.finished = lambda : len(self.__bd)==self.step
 		self.__threads = []
@@ -162,7 +172,7 @@ class QueryRead:
 		# Set the data for the given method and data.
 		for method, data in self.__bd.items():
 			# Raise a QueryException if the method is not defined
-			if method.lower().strip() not in self.__METHODS__:
+			if method.lower().strip() not in self.__METHODS__ and method.lower().strip() not in drivers():
 				raise QueryException(f"'{method}' method does not exist. You entered it incorrectly or it does not exist yet")
 			# Raise a QueryException if data is not a list or tuple.
 			if not isinstance(data, (list,tuple) ):
@@ -176,13 +186,171 @@ class QueryRead:
 
 	def __set_object(self,method,data):
 		"""
-		 Set object to be used by methods. This is a wrapper around __get_full to make it easier to use
+		 Set object to be used by methods. This is a wrapper around __get_full to make it easier to use. On the first load the DataBase object is set at once and every table is added to it as soon as it is loaded; a reload builds a new object and replaces the old one when it is complete
 		 
 		 @param method - Name of method to call
 		 @param data - Data to send to method ( sans headers
 		"""
-		res = asyncio.run(self.__get_full(method,data))
-		setattr(self,method,DataBase(method,res))
+		first = not isinstance(getattr(self, method, None), DataBase)
+		base = DataBase(method, Series(dtype=object))
+		if first:
+			setattr(self, method, base)
+		try:
+			self.__get_full(method,data,base)
+		except BaseException as e:
+			self.__fail(method, e)
+			raise e
+		if not first:
+			setattr(self, method, base)
+		self.__loaded += 1
+		# The report covers the first load only; reloads after changes are not added to it.
+		if self.__collecting() is not None and self.__loaded == len(self.__bd):
+			self.report.finish()
+			self.STARTUP = self.report.as_dict()
+		self.__resolve((method,), base)
+		self.__fail(method, None)
+		if all(self.future(m).done() for m in self.__bd):
+			self.__resolve((None,), self)
+
+	def __resolve(self, key, value):
+		"""
+		 Set the result of a readiness future unless it is already done
+		 
+		 @param key - The key of the future, see future
+		 @param value - The result
+		"""
+		with self.__lock:
+			future = self.__futures.setdefault(key, Future())
+			if not future.done():
+				future.set_result(value)
+
+	def __fail(self, method, error):
+		"""
+		 Fail the readiness futures of a method that are still pending
+		 
+		 @param method - The DBMS name
+		 @param error - The exception of the failed load, or None when the load has finished and the remaining futures name tables that do not exist
+		"""
+		with self.__lock:
+			for key, future in self.__futures.items():
+				if future.done() or (key[0] != method and not (error is not None and key[0] is None)):
+					continue
+				if error is not None:
+					future.set_exception(error)
+				elif len(key) > 1:
+					future.set_exception(QueryException(f"The '{key[1]}' table does not exist in {method}" + (f" '{key[2]}'" if key[2] is not None else '')))
+
+	def future(self, method:str=None, table:str=None, database:str=None) -> Future:
+		"""
+		 Return the readiness future of all databases, of one DBMS or of one table. The future can be requested before the object is loaded and completes as soon as the requested part is loaded
+		 
+		 @param method - The DBMS name, e.g. 'mysql'. None for everything
+		 @param table - The table name. None for the whole DBMS
+		 @param database - The database name of the table. None for the first database that has it
+		 
+		 @return A concurrent.futures.Future whose result is this object, the DataBase object or the Items object of the table. It fails with the exception of the load, or with QueryException if the table does not exist
+		"""
+		if method is not None and method not in self.__bd:
+			raise QueryException(f"'{method}' is not loaded by this object")
+		if method is None and table is not None:
+			raise QueryException("The method must be given together with the table")
+		key = (method,) if table is None else (method, table, database)
+		with self.__lock:
+			future = self.__futures.setdefault(key, Future())
+			loaded = method is not None and self.__futures.get((method,), Future()).done()
+		# Tables requested after their DBMS has finished loading are looked up at once.
+		if loaded and not future.done():
+			base = getattr(self, method)
+			for name, tables in zip(base.names, base.data_bases):
+				if (database is None or database == name) and tables.is_table(table):
+					self.__resolve(key, getattr(tables, f'tc_{table}'))
+					break
+			self.__fail(method, None)
+		return future
+
+	async def ready(self, method:str=None, table:str=None, database:str=None):
+		"""
+		 Wait in a coroutine until all databases, one DBMS or one table is loaded, e.g. await DATA_BASE.ready('mysql', 'orders')
+		 
+		 @param method - The DBMS name. None for everything
+		 @param table - The table name. None for the whole DBMS
+		 @param database - The database name of the table. None for the first database that has it
+		 
+		 @return This object, the DataBase object or the Items object of the table
+		"""
+		import asyncio
+		return await asyncio.wrap_future(self.future(method, table, database))
+
+	def wait(self, method:str=None, table:str=None, database:str=None, timeout:float=None):
+		"""
+		 Block until all databases, one DBMS or one table is loaded
+		 
+		 @param method - The DBMS name. None for everything
+		 @param table - The table name. None for the whole DBMS
+		 @param database - The database name of the table. None for the first database that has it
+		 @param timeout - The maximum time to wait in seconds. Raises TimeoutError when it is exceeded
+		 
+		 @return This object, the DataBase object or the Items object of the table
+		"""
+		return self.future(method, table, database).result(timeout)
+
+	def progress(self) -> dict:
+		"""
+		 Return how far the loading has got
+		 
+		 @return A dictionary per DBMS with 'ready' and, per database, the number of loaded 'tables' of 'total'
+		"""
+		with self.__lock:
+			return {
+				method: {
+					'ready': self.__futures.get((method,), Future()).done(),
+					'databases': {name: dict(value) for name, value in self.__progress.get(method, {}).items()}
+				} for method in self.__bd
+			}
+
+	def __query(self, connect, method:str, que={}, req={}, connection=None):
+		"""
+		 Run a query on a connection and remember the tables written by it. Change markers of some DBMS (PostgreSQL statistics) can lag behind a commit, so tables written through this object are always fetched again by the next reload
+		 
+		 @param connect - The connection to run the query on
+		 @param method - The method to be executed (e.g. 'SELECT', 'INSERT')
+		 @param que - The query parameters
+		 @param req - Additional request options
+		 @param connection - Another connection to the same database to run the query on, e.g. a clone of the asyncio pool
+		 
+		 @return The result of the query
+		"""
+		if method == 'EXECUTE':
+			# The SQL text of a script can change any table, so no table of the database keeps its mirror on the next reload.
+			self.__written.add((connect.DB_NAME, None))
+		elif method in self.__WRITES__:
+			tables = que.keys() if isinstance(que, dict) else que if isinstance(que, (list, tuple)) else [que]
+			self.__written.update((connect.DB_NAME, str(tab)) for tab in tables)
+		return (connect if connection is None else connection).query_f(method, que, req)
+
+	def __previous(self, method, name, tab, marker):
+		"""
+		 Return the current mirror of a table if it can be kept on a reload because its change marker is unchanged
+		 
+		 @param method - The DBMS name
+		 @param name - The database name
+		 @param tab - The name of the table
+		 @param marker - The change marker read for this reload
+		 
+		 @return The Items object of the table or None if the table has to be fetched
+		"""
+		if marker is None or self.__markers.get((method, name, tab)) != marker or (name, tab) in self.__written or (name, None) in self.__written:
+			return None
+		items = getattr(getattr(getattr(self, method, None), f'tc_{name}', None), f'tc_{tab}', None)
+		return items if isinstance(items, Items) and not items.is_empty() else None
+
+	def __collecting(self):
+		"""
+		 Return the startup report while the first load is running
+		 
+		 @return The StartupReport or None if no report is collected or the first load has finished
+		"""
+		return self.report if self.report is not None and self.STARTUP is None else None
 
 	def __start_thread(self,func,*args,**kwargs):
 		"""
@@ -193,7 +361,15 @@ class QueryRead:
 		current_thread = Thread(target=func, args=args, kwargs=kwargs, daemon=True)
 		current_thread.start()
 
-	async def __load_table(self, connect, tab, cols, method):
+	def __reload(self):
+		"""
+		 Reload the databases after a change on the shared scheduler. Reloads requested while one is waiting are merged into it, and a request made while one is running makes it run once more afterwards, so a burst of writes costs at most two reloads
+		 
+		 @return The Job of the reload
+		"""
+		return get_scheduler().submit(('reload', id(self)), self.__enjoin, name='QueryRead.reload')
+
+	def __load_table(self, connect, tab, cols, method, marker=None):
 		"""
 		 Load data from a table. This is a wrapper around : meth : ` ~pysnmp. i3s. I3S. query_f ` and
 		 
@@ -201,6 +377,7 @@ class QueryRead:
 		 @param tab - The name of the table
 		 @param cols - The columns to load from the table
 		 @param method - The method to use for loading the table.
+		 @param marker - The change marker of the table, used to reuse the on-disk snapshot cache
 		 
 		 @return A DataFrame with the data loaded from the table and the number of rows loaded ( self. LENGTH +
 		"""
@@ -219,80 +396,173 @@ class QueryRead:
 			if self.prog: p1.update(1)
 			return a
 		cqr = ['_query_', '_upgraded_', '_connection_']
-		vqr = [connect.query_f, partial(self.__start_thread, self.__enjoin), partial(lambda: connect)]
-		value = connect.query_f('SELECT', {tab: cols}, Condition())
-		value = tuple(value.values())[0] if self.limit==0 else tuple(value.values())[0][:self.limit]
+		vqr = [partial(self.__query, connect), self.__reload, partial(lambda: connect)]
+		report = self.__collecting()
+		previous = self.__previous(method, connect.DB_NAME, tab, marker)
+		self.__markers[(method, connect.DB_NAME, tab)] = marker
+		# Tables whose change marker did not move since the last load keep their rows.
+		if previous is not None and list(previous.ALL_COLUMNS) == list(cols):
+			data = DataFrame(previous)[list(cols)].copy()
+			self.LENGTH += len(data)
+			for c, v in zip(cqr, vqr):
+				data[c] = [v] * len(data)
+			return data
+		if self.cache is not None:
+			with phase(report, method, connect.DB_NAME, 'fetch', tab):
+				fingerprint = self.cache.fingerprint(connect.query_f('FIELDS', [tab]))
+				data = self.cache.load(method, connect.DB_NAME, tab, fingerprint, marker)
+			# Unchanged tables are taken from the cache without querying their rows.
+			if data is not None and list(data.columns) == list(cols):
+				data = data if self.limit==0 else data.iloc[:self.limit]
+				self.LENGTH += len(data)
+				if report is not None:
+					report.count(method, connect.DB_NAME, tab, rows=len(data), bytes=int(data.memory_usage(deep=True, index=False).sum()), cached=True)
+				for c, v in zip(cqr, vqr):
+					data[c] = [v] * len(data)
+				return data
+		with phase(report, method, connect.DB_NAME, 'fetch', tab):
+			value = tuple(self.__select(connect, tab, cols).values())[0]
+		if self.cache is not None and len(value) > 0:
+			self.cache.save(method, connect.DB_NAME, tab, DataFrame(list(value), columns=list(cols)), fingerprint, marker)
+		value = value if self.limit==0 else value[:self.limit]
 		# If the program is not running in progress.
 		if self.prog: p1 = ProgressBar(len(value), f'Loading "{tab}" from {method}', not self.prog)
 		# Return a DataFrame with the values of the value.
 		if len(value) >0:
 			self.LENGTH += len(value)
-			data = DataFrame(list(map(lambda x: dict(zip(add(cols,cqr),add(x,vqr))),value)))
+			with phase(report, method, connect.DB_NAME, 'build', tab):
+				data = DataFrame(list(map(lambda x: dict(zip(add(cols,cqr),add(x,vqr))),value)))
+			if report is not None:
+				report.count(method, connect.DB_NAME, tab, rows=len(value), bytes=int(data[list(cols)].memory_usage(deep=True, index=False).sum()))
 			# close the program if it s a program
 			if self.prog: p1.close()
 			return data
 		cols, val = list(cols), [NoneValue()] * len(cols)
 		cols.extend(['_query_', '_upgraded_', '_connection_'])
-		val.extend([connect.query_f, partial(self.__start_thread, self.__enjoin), partial(lambda: connect)])
+		val.extend([partial(self.__query, connect), self.__reload, partial(lambda: connect)])
 		return DataFrame([dict(zip(cols, val))])
 
-	async def __tables(self, connect, method):
+	def __select(self, connect, tab, cols):
+		"""
+		 Select all rows of a table. Large tables with an integer primary key are split into key ranges that are fetched over several connections reading the same snapshot and concatenated in key order.
+		 
+		 @param connect - A connection to the database
+		 @param tab - The name of the table
+		 @param cols - The columns to load from the table
+		 
+		 @return A dictionary with the table name as key and the list of rows as value
+		"""
+		if self.parallel < 2 or not getattr(connect, 'PARALLEL_LOAD', False):
+			return connect.query_f('SELECT', {tab: cols}, Condition())
+		key = [FIELD[1] for FIELD in connect.query_f('FIELDS', [tab]) if FIELD[5]]
+		if len(key) != 1:
+			return connect.query_f('SELECT', {tab: cols}, Condition())
+		key = key[0]
+		low, high, count = tuple(connect.query_f('KEY_RANGE', {tab: key}).values())[0]
+		if count < self.split or not all(isinstance(v, int) and not isinstance(v, bool) for v in (low, high)):
+			return connect.query_f('SELECT', {tab: cols}, Condition())
+		parts = min(self.parallel, high - low + 1)
+		step = (high - low + parts) // parts
+		ranges = [(low + i * step, min(low + (i + 1) * step, high + 1)) for i in range(parts)]
+		connections = []
+		try:
+			# The coordinating connection exports the snapshot (PostgreSQL) or blocks commits until every snapshot is started (MySQL).
+			for _ in range(parts + 1):
+				conn = connect.clone()
+				conn.paramets['auto_commit'] = False
+				connections.append(conn)
+			try:
+				snapshot = connections[0].query_f('SNAPSHOT', None)
+			except BaseException:
+				# Without the right to synchronise the snapshots (RELOAD on MySQL) the table is read with one query.
+				return connect.query_f('SELECT', {tab: cols}, Condition())
+			try:
+				for conn in connections[1:]:
+					conn.query_f('SNAPSHOT', snapshot)
+			finally:
+				connections[0].query_f('SNAPSHOT', snapshot, {'release': True})
+			def fetch(conn, start, stop):
+				return tuple(conn.query_f('SELECT', {tab: cols}, f'WHERE {tab}.{key} >= {start} AND {tab}.{key} < {stop} ORDER BY {tab}.{key}').values())[0]
+			with ThreadPoolExecutor(max_workers=parts) as pool:
+				values = list(pool.map(lambda arg: fetch(*arg), [(conn, *rng) for conn, rng in zip(connections[1:], ranges)]))
+			return {tab: [row for value in values for row in value]}
+		except BaseException as e:
+			raise e
+		finally:
+			for conn in connections:
+				try:
+					conn.rollback()
+					conn.close()
+				except BaseException:
+					pass
+
+	def __tables(self, connect, method, base):
 		"""
-		 Loads and returns tables. This is a generator that yields all tables and their data. The method determines which methods are used to load the data.
+		 Loads the tables of a database into a DataBase object. Every table is added as soon as its rows are loaded and its readiness future is completed
 		 
 		 @param connect - A DB API 2 connection to the database.
 		 @param method - The method used to load the data. Can be one of'get'' post_load'or'get_all '.
+		 @param base - The DataBase object the database is added to
 		 
-		 @return A Series with the tables and their data. Each row in the Series is a dict with the keys'_tablename'and'_upgraded_ '
-		"""
-		data_base = Series()
-		tables = connect.query_f('SHOW_TABLE')
-		columns = connect.query_f('SHOW_COLUMNS', tables).items()
+		 @return The Tables object of the database
+		"""
+		report = self.__collecting()
+		data_base = Series(dtype=object)
+		with phase(report, method, connect.DB_NAME, 'catalog'):
+			tables = connect.query_f('SHOW_TABLE')
+			columns = connect.query_f('SHOW_COLUMNS', tables).items()
+			# Change markers are read before any rows, so a table changed while loading is fetched again next time.
+			# A full table checksum only pays off when it can save fetching the table from the database.
+			markers = connect.query_f('CHANGE_MARKER', [tab for tab, _ in columns], {'checksum': self.cache is not None})
+		data_base['_query_'] = partial(self.__query, connect)
+		data_base['_upgraded_'] = self.__reload
+		data_base['_connection_'] = partial(lambda: connect)
+		tables = base.__attach__(connect.DB_NAME, data_base, report)
+		with self.__lock:
+			progress = self.__progress.setdefault(method, {})[connect.DB_NAME] = {'tables': 0, 'total': len(columns)}
 		# Load the data for each tab in columns.
 		for tab, cols in columns:
-			data_base[tab] = await self.__load_table(connect, tab, cols, method)
-		data_base['_query_'] = connect.query_f
-		data_base['_upgraded_'] = partial(self.__start_thread, self.__enjoin)
-		data_base['_connection_'] = partial(lambda: connect)
-		return data_base
+			data = self.__load_table(connect, tab, cols, method, markers.get(tab))
+			items = tables.__add_table__(tab, data, report)
+			items.MARKER = markers.get(tab)
+			progress['tables'] += 1
+			self.__resolve((method, tab, None), items)
+			self.__resolve((method, tab, connect.DB_NAME), items)
+		self.__written -= {(connect.DB_NAME, tab) for tab, _ in columns} | {(connect.DB_NAME, None)}
+		return tables
 
-	async def __get_full(self, method, data):
+	def __get_full(self, method, data, base):
 		"""
-		 Get a Series object from a list of data. This is a wrapper around : meth : ` __connect ` and
+		 Connect to every database of a method and load it into a DataBase object
 		 
 		 @param method - The method to call.
 		 @param data - The list of data to fetch. It must be a list of dicts.
+		 @param base - The DataBase object the databases are added to
 		 
-		 @return An object with the DB_NAME as key and a list of tables as value. Example :. from iota import iota_client sage : await sage. get_full ('db'data
+		 @return The DataBase object
 		"""
-		obj = Series()
 		# Add the tables to the object.
 		for o in data:
-			connect = await self.__connect(method,o)
-			obj[connect.DB_NAME] = await self.__tables(connect,method)
-		return obj
+			started = TM.perf_counter()
+			connect = self.__connect(method,o)
+			if self.__collecting() is not None:
+				self.report.count(method, connect.DB_NAME, connect=TM.perf_counter() - started)
+			self.__tables(connect,method,base)
+		return base
 
-	async def __load(self, method:str):
+	def __load(self, method:str):
 		"""
-		 Load a method from database_lib. py. This is a generator that yields instances of the method
+		 Return the connection class of a method from the driver registry. Each driver module is imported once per process
 		 
 		 @param method - Name of the method to load
 		 
-		 @return Instance of the method or None if not found or error while loading the module >>> from pycldf. sql import Database >>> db = Database
+		 @return The connection class of the method
 		"""
-		lib_path = os.path.join(self.__DATA_DIR__, 'database_lib')
-		# Raise QueryException if module directory is not found
-		if not os.path.isdir(lib_path):
-			raise QueryException('Module directory not found')
-		module_path = os.path.join(lib_path, method + ".py")
-		# Raise QueryException if module is not found
-		if not os.path.isfile(module_path):
-			raise QueryException('Module not found')
-		return load_source(method, module_path)
+		return get_driver(method)
 
-	async def __connect(self,method:str, data:dict ):
+	def __connect(self,method:str, data:dict ):
 		"""
-		 Connect to method and return object. This is a coroutine. It will be called by __init__ when a connection is made
+		 Connect to method and return object. It will be called by __init__ when a connection is made
 		 
 		 @param method - Name of method to connect
 		 @param data - Data to pass to method
@@ -302,6 +572,6 @@ class QueryRead:
 		# Prints out the connection to the server.
 		if self.prog:
 			print(f'Connection to {method}...')
-		module = await self.__load(method)
+		module = self.__load(method)
 		return module(data,self.parameters)
 
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .condition import QueryException
+
+class AsyncPool:
+	"""
+	A class representing the executor of the asyncio API of one database.
+
+	The drivers are blocking, so every query of a coroutine runs on one of 'workers' threads and
+	the event loop keeps serving other requests in the meantime. Every thread queries over a
+	connection of its own, cloned from the main connection on first use, so concurrent queries
+	never share a cursor and at most 'workers' connections are opened. Streams hold a further
+	connection each until they are exhausted or closed.
+
+	Args:
+		query (callable): The query function of the database, called as query(method, que, req, connection=...).
+		connection: The main connection of the database, used to clone the pool connections.
+		workers (int, optional): The number of threads and pool connections. Defaults to 4.
+
+	Raises:
+		QueryException: If the connection cannot be cloned, e.g. for an attached shared mirror.
+	"""
+
+	def __init__(self, query, connection, workers: int = 4):
+		if not callable(getattr(connection, 'clone', None)):
+			raise QueryException(f"'{connection}' does not support the asyncio API")
+		self.query_function = query
+		self.connection = connection
+		self.workers = max(int(workers), 1)
+		self.closed = False
+		self.__local = threading.local()
+		self.__connections = []
+		self.__lock = threading.Lock()
+		self.__executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='pytopconnect-aio')
+
+	def __str__(self):
+		return f'AsyncPool ({getattr(self.connection, "DB_NAME", self.connection)}) => {len(self.__connections)}/{self.workers} connections'
+
+	def __connection__(self):
+		"""
+		Return the connection of the current worker thread, cloning it on first use.
+		"""
+		connection = getattr(self.__local, 'connection', None)
+		if connection is None:
+			connection = self.__local.connection = self.connection.clone()
+			with self.__lock:
+				self.__connections.append(connection)
+		return connection
+
+	async def run(self, func, *args, **kwargs):
+		"""
+		Run a blocking function on a worker thread.
+
+		Args:
+			func (callable): The function to run.
+			*args: Positional arguments of the function.
+			**kwargs: Keyword arguments of the function.
+
+		Returns:
+			The result of the function.
+		"""
+		if self.closed:
+			raise QueryException('The asyncio pool is closed')
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(self.__executor, lambda: func(*args, **kwargs))
+
+	def submit(self, func, *args, **kwargs):
+		"""
+		Run a blocking function on a worker thread from synchronous code.
+
+		Args:
+			func (callable): The function to run, called as func(connection, *args, **kwargs) with the 
+							 pool connection of the worker thread.
+			*args: Positional arguments of the function.
+			**kwargs: Keyword arguments of the function.
+
+		Returns:
+			concurrent.futures.Future: The future of the result.
+		"""
+		if self.closed:
+			raise QueryException('The asyncio pool is closed')
+		return self.__executor.submit(lambda: func(self.__connection__(), *args, **kwargs))
+
+	async def query(self, method: str, que={}, req={}):
+		"""
+		Run a query on the connection of a worker thread.
+
+		Args:
+			method (str): The method to be executed (e.g., 'SELECT', 'INSERT').
+			que (optional): The query parameters.
+			req (optional): Additional request options.
+
+		Returns:
+			The result of the query.
+		"""
+		return await self.run(lambda: self.query_function(method, que, req, connection=self.__connection__()))
+
+	async def stream(self, que: dict, req={}, size: int = 1000):
+		"""
+		Read the rows of a SELECT in batches with a server-side cursor.
+
+		The stream runs over a connection of its own, which is closed when the stream is exhausted
+		or closed, e.g. by leaving an 'async for' loop with break.
+
+		Args:
+			que (dict): The table as key and the list of columns as value.
+			req (optional): The condition of the SELECT.
+			size (int, optional): The number of rows per batch. Defaults to 1000.
+
+		Yields:
+			list: The next batch of rows as tuples.
+		"""
+		connection = await self.run(self.connection.clone)
+		batches = None
+		try:
+			batches = await self.run(connection.query_f, 'STREAM', que, {'condition': req, 'size': max(int(size), 1)})
+			while True:
+				batch = await self.run(next, batches, None)
+				if batch is None:
+					break
+				yield batch
+		finally:
+			if batches is not None:
+				await self.run(batches.close)
+			await self.run(connection.close)
+
+	def close(self):
+		"""
+		Stop the worker threads and close the pool connections.
+		"""
+		self.closed = True
+		self.__executor.shutdown(wait=True)
+		with self.__lock:
+			for connection in self.__connections:
+				try:
+					connection.close()
+				except BaseException:
+					pass
+			self.__connections = []
+
+__POOLS__ = {}
+
+__LOCK__ = threading.Lock()
+
+def get_pool(query, connection, workers: int = None) -> AsyncPool:
+	"""
+	Return the asyncio pool of a database, creating it on first use.
+
+	Pools are shared by all tables of a database and are kept across reloads, because they are
+	looked up by the connection data rather than by the connection object.
+
+	Args:
+		query (callable): The query function of the database.
+		connection: The main connection of the database.
+		workers (int, optional): The number of threads, only used when the pool is created. Defaults to 4.
+
+	Returns:
+		AsyncPool: The pool of the database.
+	"""
+	data = getattr(connection, 'DATA_CONNECT', None)
+	key = (type(connection).__name__, repr(sorted(data.items(), key=str)) if isinstance(data, dict) else id(connection))
+	with __LOCK__:
+		pool = __POOLS__.get(key)
+		if pool is None or pool.closed:
+			pool = __POOLS__[key] = AsyncPool(query, connection, 4 if workers is None else workers)
+		else:
+			# A reload replaces the main connection; new pool connections are cloned from the current one.
+			pool.query_function, pool.connection = query, connection
+		return pool
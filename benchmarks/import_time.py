@@ -0,0 +1,68 @@
+"""
+Import-time benchmark of the package.
+
+Runs `python -X importtime -c "import <package>"` in a fresh interpreter several times and reports
+the cumulative import time of the package, of every module of the package and of the heaviest
+third-party modules. Use --json to write one JSON line per run for tracking between versions.
+
+	python benchmarks/import_time.py --runs 5 --top 15
+	python benchmarks/import_time.py --json >> import_time.jsonl
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from statistics import median
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(PACKAGE_DIR)
+LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+def measure() -> dict:
+	"""
+	Import the package once in a new interpreter.
+
+	Returns:
+		dict: The cumulative import time in microseconds of every imported top-level or package module.
+	"""
+	result = subprocess.run(
+		[sys.executable, '-X', 'importtime', '-c', f'import {PACKAGE}'],
+		cwd=os.path.dirname(PACKAGE_DIR), capture_output=True, text=True
+	)
+	if result.returncode != 0:
+		raise RuntimeError(result.stderr.strip().splitlines()[-1])
+	times = {}
+	for line in result.stderr.splitlines():
+		match = LINE.match(line)
+		if match is None:
+			continue
+		cumulative, module = int(match.group(2)), match.group(4)
+		if module == PACKAGE or module.startswith(PACKAGE + '.') or '.' not in module:
+			times[module] = max(times.get(module, 0), cumulative)
+	return times
+
+def main():
+	args = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	args.add_argument('--runs', type=int, default=5, help='number of fresh interpreters (default 5)')
+	args.add_argument('--top', type=int, default=10, help='number of modules listed (default 10)')
+	args.add_argument('--json', action='store_true', help='print one JSON line with the medians')
+	args = args.parse_args()
+	runs = [measure() for _ in range(max(args.runs, 1))]
+	modules = set().union(*runs)
+	medians = {module: median(run.get(module, 0) for run in runs) for module in modules}
+	total = medians.get(PACKAGE, 0)
+	if args.json:
+		print(json.dumps({'package': PACKAGE, 'python': sys.version.split()[0], 'runs': len(runs), 'total_us': total, 'modules_us': medians}))
+		return
+	print(f'import {PACKAGE}: {total / 1000:.1f} ms (median of {len(runs)} runs)')
+	own = sorted((m for m in medians if m.startswith(PACKAGE + '.')), key=medians.get, reverse=True)
+	other = sorted((m for m in medians if m != PACKAGE and not m.startswith(PACKAGE + '.')), key=medians.get, reverse=True)
+	for title, names in (('package modules', own), ('heaviest dependencies', other[:args.top])):
+		print(f'\n{title}:')
+		for module in names:
+			print(f'  {medians[module] / 1000:9.1f} ms  {module}')
+
+if __name__ == '__main__':
+	main()
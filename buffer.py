@@ -0,0 +1,170 @@
+import sys
+import atexit
+import threading
+from pandas import DataFrame
+from .scheduler import get_scheduler
+from .condition import QueryException
+
+class WriteBuffer:
+	"""
+	A class representing a write-behind buffer for high-rate inserts into one table.
+
+	This class collects rows in memory and writes them through the bulk insert path of the table
+	when a row count, an estimated byte size or a time limit is reached. The writes run on the
+	shared scheduler, one at a time and over a connection of their own, so they never share the
+	cursor of the main connection. New keys follow the largest key in the database, and the rows are
+	appended to the mirror of the table under its LOCK, which the write methods of the table take
+	as well. Rows are also written on flush(), on close() and at interpreter exit.
+
+	Args:
+		items: The Items object the rows are inserted into.
+		rows (int, optional): The number of buffered rows that triggers a flush. Defaults to 1000.
+		size (int, optional): The estimated number of buffered bytes that triggers a flush. Defaults to 1 MiB.
+		interval (float, optional): The maximum time in seconds rows wait in the buffer. Defaults to 1.0.
+		chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+		on_error (callable, optional): Called as on_error(exception, rows) for every batch that failed.
+
+	Attributes:
+		closed (bool): True once the buffer has been closed.
+		flushed (int): The number of rows written so far.
+		failed (int): The number of rows in batches that failed.
+		errors (int): The number of batches that failed.
+	"""
+
+	def __init__(self, items, rows: int = 1000, size: int = 1048576, interval: float = 1.0, chunk: int = 1000, on_error=None):
+		self.items = items
+		self.rows = max(int(rows), 1)
+		self.size = max(int(size), 1)
+		self.interval = max(float(interval), 0.001)
+		self.chunk = chunk
+		self.on_error = on_error
+		self.closed = False
+		self.flushed = 0
+		self.failed = 0
+		self.errors = 0
+		self.fields = items.types()
+		self.__rows = []
+		self.__bytes = 0
+		self.__added = 0
+		self.__done = 0
+		self.__connection = None
+		self.__lock = threading.Lock()
+		self.__writing = threading.Lock()
+		self.__cond = threading.Condition()
+		self.__job = get_scheduler().every(self.interval, self.__write, name=f'buffer.{items.table}')
+		atexit.register(self.close)
+
+	def __str__(self):
+		return f'WriteBuffer ({self.items.table}) => {len(self)} rows'
+
+	def __len__(self):
+		return len(self.__rows)
+
+	def add(self, values, columns: list = None) -> bool:
+		"""
+		Collect rows to be written in the background.
+
+		Args:
+			values: A dictionary, a list of dictionaries or a list of lists (together with 'columns').
+			columns (list, optional): Column names for rows given as lists.
+
+		Returns:
+			bool: True if the rows were accepted.
+
+		Raises:
+			ValueError: If the buffer is closed or the rows are given as lists without columns.
+		"""
+		if self.closed:
+			raise ValueError('The write buffer is closed')
+		if isinstance(values, dict):
+			values = [values]
+		elif len(values) > 0 and not isinstance(values[0], dict):
+			if columns is None:
+				raise ValueError('Columns must be passed when rows are not dictionaries')
+			values = [dict(zip(columns, row)) for row in values]
+		size = sum(sys.getsizeof(v) for row in values for v in row.values())
+		with self.__lock:
+			self.__rows.extend(values)
+			self.__bytes += size
+			self.__added += 1
+			full = len(self.__rows) >= self.rows or self.__bytes >= self.size
+		if full:
+			self.__submit__()
+		return True
+
+	def flush(self, timeout: float = None) -> bool:
+		"""
+		Write all rows collected so far and wait for the write to finish.
+
+		Args:
+			timeout (float, optional): The maximum time in seconds to wait. Defaults to no limit.
+
+		Returns:
+			bool: True if every row collected before the call has been processed, False on timeout.
+		"""
+		with self.__lock:
+			target = self.__added
+		if self.closed:
+			return self.__done >= target
+		self.__submit__()
+		with self.__cond:
+			return self.__cond.wait_for(lambda: self.__done >= target, timeout)
+
+	def close(self, timeout: float = None):
+		"""
+		Write the remaining rows in the calling thread and stop the scheduled writes.
+
+		Args:
+			timeout (float, optional): The maximum time in seconds to wait for a write that is running. Defaults to no limit.
+		"""
+		if self.closed:
+			return
+		self.closed = True
+		self.__job.cancel()
+		atexit.unregister(self.close)
+		if not self.__writing.acquire(timeout=-1 if timeout is None else timeout):
+			return
+		try:
+			self.__write_batch__()
+			if self.__connection is not None:
+				self.__connection.close()
+				self.__connection = None
+		finally:
+			self.__writing.release()
+
+	def __submit__(self):
+		"""
+		Ask the scheduler for a write now. Requests made while a write is waiting are merged into it.
+		"""
+		get_scheduler().submit(('flush', id(self)), self.__write, name=f'buffer.{self.items.table}')
+
+	def __write(self):
+		"""
+		Take the buffered rows and insert them as one batch on the buffer connection.
+		"""
+		with self.__writing:
+			self.__write_batch__()
+
+	def __write_batch__(self):
+		"""
+		Insert the buffered rows. The caller holds the write lock, so batches are written in order.
+		"""
+		with self.__lock:
+			batch, self.__rows, self.__bytes = self.__rows, [], 0
+			target = self.__added
+		if len(batch) > 0:
+			try:
+				if self.__connection is None:
+					self.__connection = self.items._connection_().clone()
+				query = lambda *args: self.items._query_(*args, connection=self.__connection)
+				if not self.items.__insert__(DataFrame(batch), self.chunk, query, self.fields, local=False):
+					raise QueryException(f"The rows were not added to '{self.items.table}'")
+				self.flushed += len(batch)
+			except BaseException as e:
+				self.errors += 1
+				self.failed += len(batch)
+				if self.on_error is not None:
+					self.on_error(e, batch)
+		with self.__cond:
+			self.__done = target
+			self.__cond.notify_all()
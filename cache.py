@@ -0,0 +1,117 @@
+import os
+import json
+import hashlib
+from .condition import QueryException
+
+class TableCache:
+	"""
+	A class representing an on-disk cache of loaded table mirrors.
+
+	Every table is stored as an Arrow IPC (Feather) file next to a small manifest with the schema
+	fingerprint and the change marker that were current when the rows were read. A cached table is
+	only used again when both still match. An uncompressed file is read through a memory map
+	without copying it into Arrow buffers, so the rows are copied only once, into the DataFrame;
+	a compressed file is smaller on disk but is decompressed into memory first. Files are written
+	to a temporary name first and moved into place, so a reader never sees a partly written table.
+
+	Args:
+		path (str): The directory that holds the cache. It is created if it does not exist.
+		compression (str, optional): The Feather compression, 'uncompressed', 'zstd' or 'lz4'. Defaults to 'uncompressed'.
+
+	Raises:
+		QueryException: If pyarrow is not installed.
+	"""
+
+	def __init__(self, path: str, compression: str = 'uncompressed'):
+		try:
+			import pyarrow
+			import pyarrow.feather
+		except ImportError:
+			raise QueryException("The snapshot cache requires the 'pyarrow' package")
+		self.pa = pyarrow
+		self.path = os.path.abspath(path)
+		self.compression = compression
+		os.makedirs(self.path, exist_ok=True)
+
+	def __str__(self):
+		return f'TableCache ({self.path})'
+
+	@staticmethod
+	def fingerprint(fields) -> str:
+		"""
+		Build a fingerprint of a table schema.
+
+		Args:
+			fields: The field description of the table as returned by the FIELDS method of a driver.
+
+		Returns:
+			str: A hexadecimal digest that changes with any column name, type, key or default.
+		"""
+		return hashlib.sha1(repr([list(map(str, field)) for field in fields]).encode()).hexdigest()
+
+	def __files__(self, method: str, db: str, table: str) -> tuple:
+		"""
+		Return the data and manifest file names of a cached table.
+		"""
+		folder = os.path.join(self.path, method, db)
+		return os.path.join(folder, f'{table}.arrow'), os.path.join(folder, f'{table}.json')
+
+	def load(self, method: str, db: str, table: str, fingerprint: str, marker):
+		"""
+		Read a cached table if its schema and change marker are unchanged.
+
+		Args:
+			method (str): The DBMS name.
+			db (str): The database name.
+			table (str): The table name.
+			fingerprint (str): The current schema fingerprint of the table.
+			marker: The current change marker of the table. None never matches.
+
+		Returns:
+			DataFrame: The cached rows, or None if the table has to be fetched again.
+		"""
+		data, manifest = self.__files__(method, db, table)
+		if marker is None or not os.path.isfile(data) or not os.path.isfile(manifest):
+			return None
+		try:
+			with open(manifest, 'r', encoding='utf-8') as file:
+				meta = json.load(file)
+			if meta.get('fingerprint') != fingerprint or meta.get('marker') != str(marker):
+				return None
+			with self.pa.memory_map(data, 'r') as source:
+				return self.pa.ipc.open_file(source).read_all().to_pandas()
+		except BaseException:
+			return None
+
+	def save(self, method: str, db: str, table: str, frame, fingerprint: str, marker) -> bool:
+		"""
+		Write the rows of a table together with its schema fingerprint and change marker.
+
+		Args:
+			method (str): The DBMS name.
+			db (str): The database name.
+			table (str): The table name.
+			frame (DataFrame): The rows of the table without service columns.
+			fingerprint (str): The schema fingerprint of the table.
+			marker: The change marker read before the rows were fetched. Nothing is written for None.
+
+		Returns:
+			bool: True if the table was cached, False if it could not be converted or written.
+		"""
+		if marker is None:
+			return False
+		data, manifest = self.__files__(method, db, table)
+		tmp = f'.{os.getpid()}.tmp'
+		os.makedirs(os.path.dirname(data), exist_ok=True)
+		try:
+			self.pa.feather.write_feather(frame.reset_index(drop=True), data + tmp, compression=self.compression)
+			with open(manifest + tmp, 'w', encoding='utf-8') as file:
+				json.dump({'fingerprint': fingerprint, 'marker': str(marker), 'rows': len(frame)}, file)
+			os.replace(data + tmp, data)
+			os.replace(manifest + tmp, manifest)
+			return True
+		except BaseException:
+			for file in (data + tmp, manifest + tmp):
+				if os.path.isfile(file):
+					os.remove(file)
+			return False
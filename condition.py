@@ -314,6 +314,8 @@ class OrderBy:
 			column = column.key
 		elif isinstance(column,str):
 			col = column
+		self.column = column.split('.')[-1]
+		self.reverse = reverse
 		self.params = f'''ORDER BY {col} {'DESC' if reverse else ''}'''.strip()
 		self.func = lambda x: x.constructor(x.sort_values(column, ascending=reverse))
 	def __str__(self):
@@ -335,6 +337,8 @@ class LimitOffset:
 		"""
 		limit = abs(int(limit))
 		offset = abs(int(offset))
+		self.limit = limit
+		self.offset = offset
 		self.params = ''
 		# limit is the number of results to return
 		if limit>0:					self.params += f'''LIMIT {limit} '''
@@ -392,20 +396,125 @@ class Join:
 		self.NaN = NaN
 		self.params = f'''{self.__hows__[self.how]} {self.table2.table} ON {self.table1.get_column(column).column}={self.table2.get_column(column).column}'''
 
-	def func(self,*args) -> dict:
+	def __columns__(self, columns:list=None) -> list:
 		"""
-		 Merge two DataFrames and return a dict. This is a wrapper for DataFrame. merge that does not handle NaNs.
+		 Return the result columns of the join as (name, SQL expression) pairs. The names follow pandas.merge: the join column appears once and other columns present in both tables get the "_x" and "_y" suffixes.
 		 
+		 @param columns - The names of the result columns to return. Default is all
 		 
-		 @return A dict with the result of the merge. Keys are the column names
+		 @return A list of ( name, expression ) tuples
+		"""
+		t1, t2, key = self.table1.table, self.table2.table, self.column
+		left = list(self.table1.ALL_COLUMNS)
+		right = [col for col in self.table2.ALL_COLUMNS if col != key]
+		common = set(left) & set(right)
+		# The join column of unmatched rows is NULL on the missing side.
+		on = {'right':f'{t2}.{key}','outer':f'COALESCE({t1}.{key},{t2}.{key})'}.get(self.how, f'{t1}.{key}')
+		result = [(key, on) if col == key else (f'{col}_x' if col in common else col, f'{t1}.{col}') for col in left]
+		result += [(f'{col}_y' if col in common else col, f'{t2}.{col}') for col in right]
+		# Return all columns of the join.
+		if columns is None:
+			return result
+		names = dict(result)
+		missing = [col for col in columns if col not in names]
+		# Raise a QueryException if a column is not a result column of the join.
+		if len(missing) > 0:
+			raise QueryException(f'Columns {missing} do not exist. Existing columns in the join {list(names.keys())}')
+		return [(col, names[col]) for col in columns]
+
+	def __joins__(self, condition) -> str:
+		"""
+		 Return the SQL clauses of a condition without this join. Raises QueryException if the condition contains another join
+		 
+		 @param condition - A Condition, a string of SQL clauses or None
+		 
+		 @return The WHERE, GROUP BY, ORDER BY and LIMIT clauses as a string
+		"""
+		# Return an empty string if there is no condition.
+		if condition is None:
+			return ''
+		sql = str(condition)
+		# Remove this join from the clauses of the condition.
+		for jo in getattr(condition, 'course', []):
+			if isinstance(jo, Join):
+				if jo is not self and jo.params != self.params:
+					raise QueryException('Only one join per condition is supported')
+				sql = sql.replace(jo.params, '', 1)
+		return sql.strip()
+
+	def fetch(self, columns:list=None, condition=None) -> Union[list, None]:
+		"""
+		 Run the join in the database when both tables share a connection. Only the joined rows are transferred.
+		 
+		 @param columns - The names of the result columns to return. Default is all
+		 @param condition - A Condition or a string of SQL clauses applied to the joined rows
+		 
+		 @return A list of row tuples or None if the tables are in different databases or the DBMS cannot run the join
+		"""
+		# Tables of different databases are joined locally.
+		if self.table1._connection_() is not self.table2._connection_():
+			return None
+		result = self.__columns__(columns)
+		que = {
+			'left':self.table1.table,
+			'right':self.table2.table,
+			'on':self.column,
+			'how':self.how,
+			'columns':[f'{expression} AS {name}' for name, expression in result]
+		}
+		return self.table1._query_('JOIN', que, self.__joins__(condition))
+
+	def get(self, columns:list=None, condition=None):
+		"""
+		 Join the two tables. If both tables share a connection the join, the projection and the condition are run in the database, otherwise the local mirrors are merged and the condition is applied to the result.
+		 
+		 @param columns - The names of the result columns to return. Default is all
+		 @param condition - A Condition or, for tables of the same database, a string of SQL clauses
+		 
+		 @return An Items object of the first table with the joined rows
+		"""
+		names = [name for name, _ in self.__columns__(columns)]
+		rows = self.fetch(columns, condition)
+		if rows is not None:
+			return self.__items__(pd.DataFrame(list(rows), columns=names))
+		# Raise a QueryException if a string condition would have to be applied locally.
+		if condition is not None and not hasattr(condition, 'functions'):
+			raise QueryException('Tables of different databases can only be joined with a Condition')
+		self.__joins__(condition)
+		left = pd.DataFrame(self.table1)[list(self.table1.ALL_COLUMNS)]
+		right = pd.DataFrame(self.table2)[list(self.table2.ALL_COLUMNS)]
+		data = self.__items__(pd.merge(left, right, on=self.column, how=self.how)[[name for name, _ in self.__columns__()]])
+		# The condition is applied before the projection, so it can use every column of the join.
+		for func in getattr(condition, 'functions', []):
+			if not isinstance(getattr(func, '__self__', None), Join):
+				data = func(data)
+		return data if columns is None else self.__items__(pd.DataFrame(data)[names])
+
+	def __items__(self, merge:pd.DataFrame):
+		"""
+		 Return the joined rows as an Items object of the first table.
+		 
+		 @param merge - The joined rows
+		 
+		 @return An Items object with the service columns of the first table
 		"""
-		merge = pd.merge(self.table1.values(), self.table2.values(), on=self.column, how=self.how)
 		# Replace NaN with NoneValue.
 		if self.NaN:
-			merge = merge.fillna('NaN')
-			merge = merge.replace('NaN', NoneValue)
+			merge = merge.astype(object).where(merge.notna(), NoneValue())
+		# An empty result keeps its columns through a row of NoneValue, which enjoin drops.
+		if len(merge) == 0:
+			merge = pd.DataFrame([dict.fromkeys(merge.columns, NoneValue())])
 		return self.table1.constructor(merge)
 
+	def func(self,*args):
+		"""
+		 Join the two tables for a Condition. This is a wrapper for get that runs the join in the database when both tables share a connection.
+		 
+		 
+		 @return An Items object of the first table with the joined rows
+		"""
+		return self.get()
+
 
 class Condition:
 
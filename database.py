@@ -1,18 +1,46 @@
 from .condition import *
 from .datatypes import DataTypes, Index
 from .storage import Procedure, Function, Trigger
+from .timing import phase as __phase__
 from pandas import Series, DataFrame
-from fuzzywuzzy import fuzz, process
 from datetime import *
 from decimal import Decimal
-from dateutil import parser as dps
 import importlib
 import inspect
+import heapq
+import queue
+import itertools
+import threading
 
 import types
 from typing import Union
 import json
 
+def __fuzz__():
+	"""
+	Import the fuzzywuzzy scorers on first use.
+
+	fuzzywuzzy is only needed by Items.search, so it is not imported together with the package.
+
+	Returns:
+	module: The fuzzywuzzy.fuzz module.
+	"""
+	from fuzzywuzzy import fuzz
+	return fuzz
+
+def __parse_date__(value):
+	"""
+	Parse a date with dateutil, importing it on first use.
+
+	Parameters:
+	value (str): The text to parse.
+
+	Returns:
+	datetime: The parsed date.
+	"""
+	from dateutil import parser
+	return parser.parse(value)
+
 def __default_values__(key, args, n, t=False):
 	"""
 	Generate default values for a database column based on its constraints and specifications.
@@ -53,7 +81,7 @@ def __default_values__(key, args, n, t=False):
 	if args is None:
 		return [None]*n
 	try:
-		return [dps.parse(args)]*n
+		return [__parse_date__(args)]*n
 	except:
 		try:
 			return [json.loads(args)]*n
@@ -92,7 +120,7 @@ def __default_to_value__(key, val):
 		elif val in ['TRUE', 'FALSE']:
 			return True if val == 'TRUE' else False
 		try:
-			return dps.parse(val[1:-1])
+			return __parse_date__(val[1:-1])
 		except:
 			try:
 				return json.loads(val[1:-1])
@@ -147,13 +175,144 @@ class DataBase:
 			self.names.append(name)
 			if not __check_variable_name__(f'tc_{name}'):
 				raise QueryException(f"The '{name}' data base name must follow the variable creation rules")
-			data_bases = Tables(method,name,tables)
+			data_bases = Tables(method,name,tables,report=kwargs.get('report', None))
 			self.data_bases.append(data_bases)
 			setattr(self, f'tc_{name}', data_bases)
 	
 	def get(self,name:str,default=None):
 		return getattr(self,name,default)
 
+	def fan_out(self, table: str, columns: list = None, condition: Union[Condition, str] = '', source: str = '_source_', stream: bool = False, size: int = 1000):
+		"""
+		Read one table from every database of this object at once and merge the rows.
+
+		The SELECT runs concurrently on every database that has the table, each over a connection 
+		of its asyncio pool (see Items.pool) with a server-side cursor, and the batches are merged 
+		while they arrive. Every row is tagged with the name of its database. With an OrderBy in the 
+		condition every database returns its rows sorted and they are merged with a k-way merge, so 
+		the result is sorted as a whole. A LimitOffset applies to the merged result: every database 
+		is asked for at most limit + offset rows, and the offset and limit are applied after the merge.
+
+		Args:
+			table (str): The name of the table.
+			columns (list, optional): A list of column names to read. If None, reads all columns.
+			condition (Condition or str, optional): The condition of the SELECT. Defaults to no condition.
+			source (str, optional): The name of the column holding the database name. Defaults to '_source_'.
+			stream (bool, optional): If True, a generator of DataFrames of 'size' rows is returned 
+									 instead of one DataFrame. Defaults to False.
+			size (int, optional): The number of rows per batch. Defaults to 1000.
+
+		Returns:
+			DataFrame or generator: The merged rows, or a generator of batches if 'stream' is True.
+
+		Raises:
+			QueryException: If no database has the table, a column does not exist or the OrderBy 
+							column is not selected.
+		"""
+		shards = [(name, tables) for name, tables in zip(self.names, self.data_bases) if tables.is_table(table)]
+		if len(shards) == 0:
+			raise QueryException(f"The '{table}' table does not exist in any {self.method} database")
+		items = getattr(shards[0][1], f'tc_{table}')
+		columns = list(items.ALL_COLUMNS if columns is None else columns)
+		if not items.is_column(*columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {items.ALL_COLUMNS}")
+		sql = str(condition)
+		order = [c for c in getattr(condition, 'course', []) if isinstance(c, OrderBy)]
+		limits = [c for c in getattr(condition, 'course', []) if isinstance(c, LimitOffset)]
+		order = order[-1] if len(order) > 0 else None
+		limit, offset = (limits[-1].limit, limits[-1].offset) if len(limits) > 0 else (0, 0)
+		if len(limits) > 0:
+			head, _, tail = sql.rpartition(limits[-1].params)
+			sql = head + tail + (f' LIMIT {limit + offset}' if limit > 0 else '')
+		if order is not None and order.column not in columns:
+			raise QueryException(f"The ORDER BY column '{order.column}' must be selected")
+		batches = self.__fan_out__(table, columns, sql, shards, order, limit, offset, source, max(int(size), 1))
+		if stream:
+			return batches
+		frames = list(batches)
+		return pd.concat(frames, ignore_index=True) if len(frames) > 0 else DataFrame(columns=columns + [source])
+
+	def __fan_out__(self, table, columns, sql, shards, order, limit, offset, source, size):
+		"""
+		Generator of fan_out(): stream every database on its pool and merge the batches.
+		"""
+		from .aio import get_pool
+		stop = threading.Event()
+		end = object()
+		channels = [queue.Queue(maxsize=4) for _ in shards] if order is not None else [queue.Queue(maxsize=4 * len(shards))] * len(shards)
+		def send(channel, item):
+			# A consumer that stopped early no longer empties the queue, so waiting ends with it.
+			while not stop.is_set():
+				try:
+					channel.put(item, timeout=0.1)
+					return True
+				except queue.Full:
+					pass
+			return False
+		def produce(connection, name, channel):
+			try:
+				batches = connection.query_f('STREAM', {table: columns}, {'condition': sql, 'size': size})
+				try:
+					for batch in batches:
+						if not send(channel, [tuple(row) + (name,) for row in batch]):
+							return
+				finally:
+					batches.close()
+				send(channel, end)
+			except BaseException as e:
+				send(channel, e)
+		def rows(channel, count):
+			while count > 0:
+				batch = channel.get()
+				if batch is end:
+					count -= 1
+				elif isinstance(batch, BaseException):
+					raise batch
+				else:
+					yield from batch
+		futures = [get_pool(tables._query_, tables._connection_()).submit(produce, name, channel) for (name, tables), channel in zip(shards, channels)]
+		try:
+			if order is None:
+				merged = rows(channels[0], len(shards))
+			else:
+				i = columns.index(order.column)
+				# NULLs are placed where the DBMS sorts them: first in an ascending order on MySQL and SQLite, last on PostgreSQL.
+				null = (False,) if getattr(shards[0][1]._connection_(), 'NULLS_FIRST', True) else (True,)
+				merged = heapq.merge(*[rows(channel, 1) for channel in channels], key=lambda row: null if row[i] is None else (not null[0], row[i]), reverse=order.reverse)
+			merged = itertools.islice(merged, offset, offset + limit if limit > 0 else None)
+			while True:
+				batch = list(itertools.islice(merged, size))
+				if len(batch) == 0:
+					break
+				yield DataFrame(batch, columns=columns + [source])
+		finally:
+			stop.set()
+			for future in futures:
+				future.result()
+
+	def __attach__(self, name: str, data: Series, report=None):
+		"""
+		Add a database to this object before its tables are loaded.
+
+		Args:
+			name (str): The database name.
+			data (Series): The service entries of the database ('_query_', '_upgraded_', '_connection_').
+			report (StartupReport, optional): The startup report the construction is timed in.
+
+		Returns:
+			Tables: The new, still empty database. Tables are added with Tables.__add_table__().
+
+		Raises:
+			QueryException: If the database name doesn't follow variable creation rules.
+		"""
+		if not __check_variable_name__(f'tc_{name}'):
+			raise QueryException(f"The '{name}' data base name must follow the variable creation rules")
+		data_bases = Tables(self.method, name, data, report=report)
+		self.names.append(name)
+		self.data_bases.append(data_bases)
+		setattr(self, f'tc_{name}', data_bases)
+		return data_bases
+
 	def create_index(self, table):
 		"""
 		Create an index for the given table.
@@ -301,27 +460,60 @@ class Tables(Series, DataBase):
 		self.method = method
 		self.parent = kwargs.get('parent', None)
 		self.dataTypes = DataTypes(self.method)
-		self.enjoin()
-		self.version = self._connection_().version()
-		self.db_name = self._connection_().DB_NAME_ORG
+		report = kwargs.get('report', None)
+		with __phase__(report, self.method, self.name, 'introspection'):
+			self.db_name = self._connection_().DB_NAME_ORG
+			self.catalog = self._query_('CATALOG', self.db_name)
+			self.version = self.catalog['version']
+		self.enjoin(report)
+		self.__set_routines__()
+
+	def __set_routines__(self):
+		"""
+		Create the Procedure and Function attributes from the cached catalog.
+		"""
 		if self.method in ['mysql', 'postgresql']:
-			procedures = self._query_('SHOW_PROCEDURE', self.db_name)
-			functions = self._query_('SHOW_FUNCTION', self.db_name)
-			for procedure, value in procedures.items():
+			for procedure, value in self.catalog['procedures'].items():
 				proc = Procedure(self)
 				proc.name = procedure
 				proc.list_paramets = list(filter(None, value))
 				setattr(self, f'ptc_{procedure}', proc)
-			for function, value in functions.items():
+			for function, value in self.catalog['functions'].items():
 				func = Function(self)
 				func.name = function
 				func.list_paramets = list(filter(None, value))
 				setattr(self, f'ftc_{function}', func)
 
-	def enjoin(self):
+	def refresh_catalog(self) -> dict:
+		"""
+		Reload the routines and triggers of the database.
+
+		The catalog is read once when the database is loaded and every Items object, including the 
+		ones derived from it, takes its triggers from it. This method fetches it again, for example 
+		after routines or triggers were changed outside of this module, and rebuilds the Procedure, 
+		Function and Trigger attributes.
+
+		Returns:
+			dict: The new catalog with 'version', 'procedures', 'functions' and 'triggers'.
+		"""
+		self.catalog = self._query_('CATALOG', self.db_name)
+		self.version = self.catalog['version']
+		for name in [key for key in self.__dict__.keys() if key.startswith(('ptc_', 'ftc_'))]:
+			delattr(self, name)
+		self.__set_routines__()
+		for table in self.ALL_TABLES:
+			items = getattr(self, f'tc_{table}', None)
+			if isinstance(items, Items):
+				items.__set_triggers__()
+		return self.catalog
+
+	def enjoin(self, report=None):
 		"""
 		Join tables and set attributes for each table.
 
+		Args:
+			report (StartupReport, optional): The startup report the construction of every table is timed in.
+
 		Raises:
 			QueryException: If a table name doesn't follow variable creation rules.
 		"""
@@ -331,10 +523,33 @@ class Tables(Series, DataBase):
 				raise QueryException(f"The '{key}' table name must follow the variable creation rules")
 			if not isinstance(val, (types.LambdaType, types.FunctionType, types.MethodType, partial)):
 				if not self.is_table(key):
-					setattr(self, f'tc_{key}', Items(key, val, parent=self))
+					setattr(self, f'tc_{key}', Items(key, val, parent=self, report=report))
 			else:
 				setattr(self, key, val)
 
+	def __add_table__(self, table: str, data: DataFrame, report=None):
+		"""
+		Add a loaded table to the database.
+
+		Args:
+			table (str): The name of the table.
+			data (DataFrame): The rows of the table together with the service columns.
+			report (StartupReport, optional): The startup report the construction is timed in.
+
+		Returns:
+			Items: The new table.
+
+		Raises:
+			QueryException: If the table name doesn't follow variable creation rules.
+		"""
+		if not __check_variable_name__(f'tc_{table}'):
+			raise QueryException(f"The '{table}' table name must follow the variable creation rules")
+		self[table] = data
+		items = Items(table, data, parent=self, report=report)
+		setattr(self, f'tc_{table}', items)
+		self.ALL_TABLES = self.get_tables()
+		return items
+
 	def is_active(self) -> bool:
 		"""
 		Check if the database connection is active.
@@ -544,11 +759,31 @@ class Items(DataFrame):
 		super(Items, self).__init__(data)
 		self.table = table
 		self.parent = kwargs.get('parent', None)
-		self.enjoin()
+		# Background syncs and write buffers change the mirror under this lock, like the write methods do.
+		self.LOCK = threading.RLock()
+		report = kwargs.get('report', None)
+		with __phase__(report, self.parent.method, self.parent.name, 'enjoin', self.table):
+			self.enjoin()
 		self.LENGTH = self.get_count_row()
 		self.dataTypes = self.parent.dataTypes
+		if report is not None:
+			memory = DataFrame(self).memory_usage(deep=True).sum()
+			memory += sum(col.memory_usage(deep=True) + col.__copy_data__.memory_usage(deep=True) for col in map(self.get_column, self.ALL_COLUMNS) if col is not None)
+			report.count(self.parent.method, self.parent.name, self.table, memory=int(memory))
+		self.__set_triggers__()
+
+	def __set_triggers__(self):
+		"""
+		Create the Trigger attributes of the table from the catalog of the parent database.
+
+		Derived Items objects share the catalog of their parent, so they do not query the database 
+		again. Tables.refresh_catalog() reloads the catalog on demand.
+		"""
+		for name in [key for key in self.__dict__.keys() if key.startswith('ttc_')]:
+			del self.__dict__[name]
 		if self.parent.method in ['mysql', 'postgresql']:
-			triggers = self._query_('SHOW_TRIGGER', self.table)
+			catalog = getattr(self.parent, 'catalog', None)
+			triggers = catalog['triggers'].get(self.table, {}) if catalog is not None else self._query_('SHOW_TRIGGER', self.table)
 			for trigger, val in triggers.items():
 				trig = Trigger(self, val.get('time'), val.get('event'))
 				trig.name = trigger
@@ -600,14 +835,17 @@ class Items(DataFrame):
 			return isinstance(value, NoneValue)
 		self.ALL_COLUMNS = self.getColumns()
 		self.LENGTH = self.get_count_row()
-		for key, val in self.to_dict(orient='list').items():
+		connection = self['_connection_'].iloc[0] if '_connection_' in self.columns and len(self) > 0 else getattr(self, '_connection_', None)
+		# The columns of an attached shared mirror are views of its memory map, so they are not copied into lists.
+		shared = callable(connection) and getattr(connection(), 'SHARED', False)
+		for key, val in list(((key, self[key]) for key in self.columns) if shared else self.to_dict(orient='list').items()):
 			if len(val) > 0:
 				if not all(isinstance(v, (types.LambdaType, types.FunctionType, types.MethodType, partial)) for v in val):
 					if not __check_variable_name__(f'tc_{key}'):
 						raise QueryException(f"The '{key}' column name must follow the variable creation rules")
-					setattr(self, f'tc_{key}', Column(self.table, key, val, parent=self))
+					setattr(self, f'tc_{key}', Column(self.table, key, val, parent=self, shared=shared))
 				else:
-					setattr(self, key, val[0])
+					setattr(self, key, next(iter(val)))
 					del self[key]
 		mask = self.apply(lambda col: col.apply(is_noneValue))
 		indexs = list(self[mask.all(axis=1)].index)
@@ -639,6 +877,29 @@ class Items(DataFrame):
 		else:
 			return "NULL"
 
+	def to_value(self, x):
+		"""
+		Convert a value to a plain Python object that can be bound as a query parameter.
+
+		Args:
+			x: The value to convert.
+
+		Returns:
+			None for missing values, a JSON string for lists, tuples and dictionaries, 
+			a datetime for timestamps, a native scalar for numpy values, otherwise the value itself.
+		"""
+		if isinstance(x, NoneValue) or x is NoneValue:
+			return None
+		elif isinstance(x, (list, tuple, dict)):
+			return json.dumps(x, ensure_ascii=False)
+		elif pd.api.types.is_scalar(x) and pd.isna(x):
+			return None
+		elif isinstance(x, pd.Timestamp):
+			return x.to_pydatetime()
+		elif isinstance(x, np.generic):
+			return x.item()
+		return x
+
 	def is_empty(self) -> bool:
 		"""
 		Check if the Items object is empty.
@@ -743,14 +1004,14 @@ class Items(DataFrame):
 		"""
 		return column in self.required_columns()
 	
-	def search_by_type(self, x, value=None, func: Union[types.FunctionType, types.MethodType, types.LambdaType, str] = fuzz.WRatio, similarity: Union[int, float] = 75, is_none: bool = False) -> bool:
+	def search_by_type(self, x, value=None, func: Union[types.FunctionType, types.MethodType, types.LambdaType, str] = None, similarity: Union[int, float] = 75, is_none: bool = False) -> bool:
 		"""
 		Search for a value in a given data type using a specified function and similarity threshold.
 	
 		Args:
 			x: The value to search in.
 			value: The value to search for. Defaults to None.
-			func: The function to use for comparison. Can be a function, method, lambda, or string. Defaults to fuzz.WRatio.
+			func: The function to use for comparison. Can be a function, method, lambda, or string. Defaults to fuzzywuzzy fuzz.WRatio.
 			similarity: The similarity threshold for string comparisons. Defaults to 75.
 			is_none: Whether to consider None values as a match. Defaults to False.
 	
@@ -760,9 +1021,11 @@ class Items(DataFrame):
 		Raises:
 			QueryException: If the func, similarity, or is_none arguments are of incorrect types.
 		"""
-		if not isinstance(func, [types.FunctionType, types.MethodType, types.LambdaType, str]):
+		if func is None:
+			func = __fuzz__().WRatio
+		if not isinstance(func, (types.FunctionType, types.MethodType, types.LambdaType, types.BuiltinFunctionType, str)):
 			raise QueryException('The "func" argument must be FunctionType, MethodType, LambdaType or str')
-		if not isinstance(similarity, [int, float]):
+		if not isinstance(similarity, (int, float)):
 			raise QueryException('The "similarity" argument must be int or float')
 		if not isinstance(is_none, bool):
 			raise QueryException('The "is_none" argument must be bool')
@@ -773,7 +1036,7 @@ class Items(DataFrame):
 			if hasattr(mod, func[1]):
 				func = getattr(mod, func[1])
 			else:
-				func = fuzz.WRatio
+				func = __fuzz__().WRatio
 	
 		if isinstance(x, str) and isinstance(value, str):
 			return func(x, value) >= similarity
@@ -806,7 +1069,7 @@ class Items(DataFrame):
 			DataFrame: A DataFrame containing the rows that match the search criteria.
 		"""
 		def change_params(val):
-			obj = {'value': None, 'func': fuzz.WRatio, 'similarity': 75, 'is_none': False}
+			obj = {'value': None, 'func': None, 'similarity': 75, 'is_none': False}
 			if isinstance(val, dict):
 				obj.update(val)
 			elif isinstance(val, tuple):
@@ -910,8 +1173,14 @@ class Items(DataFrame):
 			dict: A dictionary containing field types and attributes. If a specific column is requested, 
 				returns its details; otherwise, returns details for all columns.
 		"""
-		FIELDS = self._query_('FIELDS',[self.table])
-		FIELDS = { FIELD[1]:{
+		FIELDS = self.__types__(self._query_('FIELDS',[self.table]))
+		return FIELDS.get(column, FIELDS)
+
+	def __types__(self, FIELDS) -> dict:
+		"""
+		Build the field types and attributes returned by types() from the rows of a FIELDS query.
+		"""
+		return { FIELD[1]:{
 			"number":FIELD[0],
 			"values":self.get_column(FIELD[1]),
 			"type":FIELD[2],
@@ -919,9 +1188,8 @@ class Items(DataFrame):
 			"default": __default_to_value__(FIELD[1],FIELD[4]),
 			"is_primary":bool(FIELD[5])
 		} for FIELD in FIELDS if self.is_column(FIELD[1]) }
-		return FIELDS.get(column, FIELDS)
 
-	def added(self, values: list, columns: list) -> list:
+	def added(self, values: list, columns: list, fields: dict = None) -> list:
 		"""
 		Add values to the specified columns in the database.
 
@@ -932,6 +1200,7 @@ class Items(DataFrame):
 		Args:
 			values (list): A list of values to be added to the specified columns.
 			columns (list): A list of column names corresponding to the values.
+			fields (dict, optional): The result of types(). Defaults to querying it.
 
 		Returns:
 			list: The updated list of values after processing.
@@ -940,12 +1209,13 @@ class Items(DataFrame):
 			QueryException: If the lengths of values and columns do not match, or if required columns are missing.
 		"""
 		n = -1
+		fields = self.types() if fields is None else fields
 		for i in range(len(values)):
 			if len(values[i])!=len(columns):
 				raise QueryException(f"Column and value lengths are not equal")
 			value = dict(zip(columns,values[i]))
-			for k,v in self.types().items():
-				if self.is_required(k) and k not in value.keys() and not v.get('is_primary'):
+			for k,v in fields.items():
+				if v.get('required') and k not in value.keys() and not v.get('is_primary'):
 					raise QueryException(f"The '{k}' column must be required")
 				if k not in value.keys():
 					if v.get('is_primary'):
@@ -959,6 +1229,220 @@ class Items(DataFrame):
 			values[i] = value
 		return values
 
+	def __rows_frame__(self, rows, columns: list = None) -> DataFrame:
+		"""
+		Normalize incoming rows into a DataFrame of existing table columns.
+
+		Args:
+			rows: A DataFrame, a dictionary, a list of dictionaries or a list of lists.
+			columns (list, optional): Column names for rows given as lists.
+
+		Returns:
+			DataFrame: The rows with a fresh index and without the service columns.
+
+		Raises:
+			QueryException: If the data types do not match or if a column does not exist.
+		"""
+		if isinstance(rows, DataFrame):
+			frame = DataFrame(rows)
+		elif isinstance(rows, dict):
+			frame = DataFrame([rows])
+		elif isinstance(rows, (list, tuple)):
+			if len(rows) > 0 and not isinstance(rows[0], dict):
+				if columns is None:
+					raise QueryException("Columns must be passed when rows are not dictionaries")
+				frame = DataFrame(list(map(list, rows)), columns=list(columns))
+			else:
+				frame = DataFrame(list(rows))
+		else:
+			raise QueryException(f"Data types do not match")
+		frame = frame[[c for c in frame.columns if c not in ['_query_', '_upgraded_', '_connection_']]]
+		if not self.is_column(*frame.columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		return frame.reset_index(drop=True)
+
+	def __key__(self, key: Union[str, list, tuple] = None) -> list:
+		"""
+		Resolve the key columns used to match rows, defaulting to the primary key.
+
+		Args:
+			key (Union[str, list, tuple], optional): A column name or a list of column names.
+
+		Returns:
+			list: The key column names.
+
+		Raises:
+			QueryException: If the table has no primary key or a key column does not exist.
+		"""
+		if key is None:
+			key = [k for k, v in self.types().items() if v.get('is_primary')]
+		key = [key] if isinstance(key, str) else list(key)
+		if len(key) == 0:
+			raise QueryException(f"Table '{self.table}' has no primary key, the 'key' argument must be passed")
+		if not self.is_column(*key):
+			raise QueryException(f"Key column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		return key
+
+	def __key_index__(self, data: DataFrame, key: list) -> pd.Index:
+		"""
+		Build an index over the key columns of the given data.
+
+		Args:
+			data (DataFrame): The data to index.
+			key (list): The key column names.
+
+		Returns:
+			pd.Index: An Index for a single key column, a MultiIndex for a composite key.
+		"""
+		if len(key) == 1:
+			return pd.Index(data[key[0]])
+		return pd.MultiIndex.from_frame(DataFrame(data)[key])
+
+	def __merge_rows__(self, rows: DataFrame, key: list, columns: list = None, append: bool = True):
+		"""
+		Merge rows into the local data by key without reloading the table.
+
+		Rows whose key already exists have the given columns overwritten, the remaining rows are 
+		appended with table defaults for the columns they do not carry. All matching is done with 
+		one hash lookup over the key index.
+
+		Args:
+			rows (DataFrame): The rows to merge.
+			key (list): The key column names.
+			columns (list, optional): The columns overwritten on existing rows. Defaults to all non-key columns of rows.
+			append (bool, optional): If False, rows whose key does not exist are ignored. Defaults to True.
+
+		Raises:
+			QueryException: If the key is not unique in the local data.
+		"""
+		if len(rows) == 0:
+			return
+		rows = rows.drop_duplicates(subset=key, keep='last')
+		columns = [c for c in (rows.columns if columns is None else columns) if c in rows.columns and c not in key]
+		current = self.__key_index__(self, key)
+		if not current.is_unique:
+			raise QueryException(f"Key {key} is not unique in table '{self.table}'")
+		positions = current.get_indexer(self.__key_index__(rows, key))
+		found = positions >= 0
+		if found.any():
+			for column in columns:
+				values = rows[column].values[found]
+				try:
+					self.iloc[positions[found], self.columns.get_loc(column)] = values
+				except (TypeError, ValueError):
+					# A NULL or a value of another type does not fit the dtype of the column, e.g. int64, so it holds objects from now on.
+					self[column] = self[column].astype(object)
+					self.iloc[positions[found], self.columns.get_loc(column)] = values
+		if append and not found.all():
+			self.__append_rows__(rows[~found])
+
+	def __append_rows__(self, rows: DataFrame, fields: dict = None):
+		"""
+		Append rows to the local data in one concatenation.
+
+		Args:
+			rows (DataFrame): The rows to append.
+			fields (dict, optional): The result of types() used for the defaults of the columns 
+									the rows do not carry. Queried when needed and not provided.
+		"""
+		if len(rows) == 0:
+			return
+		new = rows.reindex(columns=self.ALL_COLUMNS)
+		missing = [c for c in self.ALL_COLUMNS if c not in rows.columns]
+		if len(missing) > 0:
+			fields = self.types() if fields is None else fields
+			for column in missing:
+				new[column] = [fields.get(column, {}).get('default')] * len(new)
+		start = int(self.index.max()) + 1 if len(self) > 0 else 0
+		new.index = pd.RangeIndex(start, start + len(new))
+		self._update_inplace(pd.concat([DataFrame(self), new]))
+
+	def __insert__(self, frame: DataFrame, chunk: int = 1000, query=None, fields: dict = None, local: bool = True) -> bool:
+		"""
+		Insert rows through the bulk path and append them to the local data.
+
+		Primary key columns missing from the rows are numbered after the largest local value, 
+		the same way add() does, so the appended rows can be matched by key later. Writers in the 
+		background (local=False) number them after the largest key in the database instead, since 
+		the mirror may be behind it. The rows are appended under LOCK.
+
+		Args:
+			frame (DataFrame): The rows to insert.
+			chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+			query (callable, optional): The query function to run the statement with. Defaults to _query_.
+			fields (dict, optional): The result of types(). Queried when not provided.
+			local (bool, optional): If False, missing keys follow the database instead of the local data. Defaults to True.
+
+		Returns:
+			bool: True if the rows were successfully inserted, False otherwise.
+
+		Raises:
+			QueryException: If a required column without a default value is missing.
+		"""
+		query = self._query_ if query is None else query
+		fields = self.types() if fields is None else fields
+		frame = frame.copy()
+		for k, v in fields.items():
+			if k in frame.columns:
+				continue
+			if v.get('is_primary'):
+				if local:
+					values = self[k] if k in self.columns else []
+					start = int(np.nanmax(values)) + 1 if len(values) > 0 else 1
+				else:
+					high = tuple(query('KEY_RANGE', {self.table: k}).values())[0][1]
+					start = int(high) + 1 if high is not None else 1
+				frame[k] = range(start, start + len(frame))
+			elif v.get('required') and v.get('default') is None:
+				raise QueryException(f"The '{k}' column must be required")
+		if not query('BULK_INSERT', {self.table: {
+			'columns': list(frame.columns),
+			'values': [list(map(self.to_value, row)) for row in frame.itertuples(index=False, name=None)]
+		}}, {'chunk': chunk}):
+			return False
+		with self.LOCK:
+			self.__append_rows__(frame, fields)
+			self.enjoin()
+		return True
+
+	def __keys_frame__(self, keys, key: list) -> DataFrame:
+		"""
+		Normalize a list of key values into a DataFrame of key columns.
+
+		Args:
+			keys: A list of values for a single key, a list of tuples for a composite key, 
+				a Series or a DataFrame carrying the key columns.
+			key (list): The key column names.
+
+		Returns:
+			DataFrame: The distinct key rows.
+
+		Raises:
+			QueryException: If the data types do not match.
+		"""
+		if isinstance(keys, DataFrame):
+			frame = DataFrame(keys)[key]
+		elif isinstance(keys, (list, tuple, set, range, pd.Series, pd.Index, np.ndarray)):
+			keys = list(keys)
+			frame = DataFrame({key[0]: keys}) if len(key) == 1 else DataFrame(list(map(list, keys)), columns=key)
+		else:
+			raise QueryException(f"Data types do not match")
+		return frame.drop_duplicates().reset_index(drop=True)
+
+	def __drop_keys__(self, keys: DataFrame, key: list):
+		"""
+		Drop rows from the local data by key without evaluating a condition.
+
+		Args:
+			keys (DataFrame): The key rows to drop.
+			key (list): The key column names.
+		"""
+		if len(keys) == 0 or self.is_empty():
+			return
+		mask = self.__key_index__(self, key).isin(self.__key_index__(keys, key))
+		if mask.any():
+			self.drop(self.index[mask], inplace=True)
+
 	def get(self, columns: list = None, condition: Condition = Condition(), distinct: bool = False, sql: bool = False) -> DataFrame:
 		"""
 		Retrieve data from the database based on specified columns and conditions.
@@ -971,7 +1455,8 @@ class Items(DataFrame):
 			columns (list, optional): A list of column names to retrieve. If None, retrieves all columns.
 			condition (Condition, optional): A condition object to filter the results. Defaults to an empty condition.
 			distinct (bool, optional): If True, retrieves only distinct rows. Defaults to False.
-			sql (bool, optional): If True, executes a raw SQL query. Defaults to False.
+			sql (bool, optional): If True, executes a raw SQL query. A Join in the condition is run by the 
+								database when both tables share a connection. Defaults to False.
 
 		Returns:
 			DataFrame: The retrieved data as a DataFrame.
@@ -981,11 +1466,18 @@ class Items(DataFrame):
 		"""
 		if not isinstance(columns,(list, tuple, type(None))) and not isinstance(condition,Condition):
 			raise QueryException(f"Data types do not match")
+		joins = [jo for jo in condition.course if isinstance(jo, Join)]
+		if sql and len(joins) > 0:
+			# The join runs in the database when both tables share a connection.
+			data = DataFrame(joins[0].get(columns, condition))
+			if distinct:
+				data = data.drop_duplicates()
+			return data.to_dict('records')
 		if columns is None:
 			columns = self.ALL_COLUMNS
 		if sql:
 			data = self._query_('SELECT_DISTINCT' if distinct else 'SELECT',{self.table:columns},condition)
-			return list(map(lambda x: dict(zip(columns,x)),data))
+			return list(map(lambda x: dict(zip(columns,x)),tuple(data.values())[0]))
 		data = self.getColumns(*columns)
 		for func in condition.functions:
 			data = list(func(data))
@@ -1015,21 +1507,121 @@ class Items(DataFrame):
 			raise QueryException(f"Data types do not match")
 		if not self.is_column(*columns):
 			raise QueryException(f"Column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		if getattr(self, 'BUFFER', None) is not None and not self.BUFFER.closed:
+			return self.BUFFER.add(values, columns)
 		try:
 			self.added(values,columns)
-			if not self._query_('INSERT',{self.table:{
-				'columns':columns,
-				'values':[map(self.to_str ,val) for val in [[i for col, i in v.items() if col in columns] for v in values]]
-			}}):
+			if not self._query_('INSERT',self.__add_query__(values,columns)):
 				return False
+			self.__add_apply__(values)
+			return True
+		except BaseException as e:
+			raise e
+
+	def __add_query__(self, values: list, columns: list) -> dict:
+		"""
+		Build the INSERT parameters of add() from rows processed by added().
+		"""
+		return {self.table:{
+			'columns':columns,
+			'values':[map(self.to_str ,val) for val in [[i for col, i in v.items() if col in columns] for v in values]]
+		}}
+
+	def __add_apply__(self, values: list):
+		"""
+		Append rows written by add() to the DataFrame and reload the databases.
+		"""
+		with self.LOCK:
 			for value in values:
 				self.loc[self.index.max() + 1] = value
 			self.enjoin()
-			self._upgraded_()
-			return True
+		self._upgraded_()
+
+	def insert_many(self, rows, columns: list = None, chunk: int = 1000) -> bool:
+		"""
+		Add many rows through the bulk insert path of the DBMS.
+
+		This function sends the rows with bound parameters in chunks (execute_values on PostgreSQL, 
+		batched executemany on MySQL and SQLite) and appends them to the local data without 
+		reloading the tables.
+
+		Args:
+			rows: A DataFrame, a list of dictionaries or a list of lists (together with 'columns').
+			columns (list, optional): Column names for rows given as lists.
+			chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+
+		Returns:
+			bool: True if the rows were successfully added, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the specified columns do not exist.
+		"""
+		try:
+			frame = self.__rows_frame__(rows, columns)
+			if len(frame) == 0:
+				return True
+			return self.__insert__(frame, chunk)
 		except BaseException as e:
 			raise e
 
+	def buffer(self, rows: int = 1000, size: int = 1048576, interval: float = 1.0, chunk: int = 1000, on_error=None):
+		"""
+		Enable a write-behind buffer for high-rate inserts into this table.
+
+		Once enabled, add() collects rows in memory instead of running one INSERT per call. 
+		The rows are written through the bulk insert path on the shared scheduler when the row 
+		count, the estimated byte size or the time limit is reached, on flush() and at interpreter exit.
+
+		Args:
+			rows (int, optional): The number of buffered rows that triggers a flush. Defaults to 1000.
+			size (int, optional): The estimated number of buffered bytes that triggers a flush. Defaults to 1 MiB.
+			interval (float, optional): The maximum time in seconds rows wait in the buffer. Defaults to 1.0.
+			chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+			on_error (callable, optional): Called as on_error(exception, rows) for every batch that failed.
+
+		Returns:
+			WriteBuffer: The buffer of this table. An already active buffer is returned as is.
+		"""
+		from .buffer import WriteBuffer
+		if getattr(self, 'BUFFER', None) is None or self.BUFFER.closed:
+			self.BUFFER = WriteBuffer(self, rows=rows, size=size, interval=interval, chunk=chunk, on_error=on_error)
+		return self.BUFFER
+
+	def flush(self, timeout: float = None) -> bool:
+		"""
+		Write the rows collected by the write-behind buffer.
+
+		Args:
+			timeout (float, optional): The maximum time in seconds to wait for the write. Defaults to no limit.
+
+		Returns:
+			bool: True if the buffer is empty after the call, False if no buffer is active or the wait timed out.
+		"""
+		if getattr(self, 'BUFFER', None) is None:
+			return False
+		return self.BUFFER.flush(timeout=timeout)
+
+	def replicate(self, *targets, workers: int = 4, retry: float = 5.0, max_retries: int = None, on_error=None):
+		"""
+		Write this table and tables of other databases at once, e.g. during a migration.
+
+		The returned object runs add, update and delete on this table and replays them on the 
+		targets concurrently in the background. Failed writes of a target are retried without 
+		blocking this table.
+
+		Args:
+			*targets (Items): The tables of the other databases, with the same name and columns.
+			workers (int, optional): The number of threads writing the targets. Defaults to 4.
+			retry (float, optional): The seconds before a failed write is tried again. Defaults to 5.
+			max_retries (int, optional): A write that failed this many times more is dropped. Defaults to retrying forever.
+			on_error (callable, optional): Called as on_error(exception, items, method) on every failed attempt.
+
+		Returns:
+			ReplicatedTable: The replicated table. Its metrics() report the lag and the error counters of every target.
+		"""
+		from .replica import ReplicatedTable
+		return ReplicatedTable(self, *targets, workers=workers, retry=retry, max_retries=max_retries, on_error=on_error)
+
 	def update(self, items: dict, condition: Condition = Condition()) -> bool:
 		"""
 		Update existing records in the database based on specified conditions.
@@ -1052,9 +1644,19 @@ class Items(DataFrame):
 		if not isinstance(items,dict) and not isinstance(condition,Condition):
 			raise QueryException(f"Data types do not match")
 		try:
-			indexs = self.index
 			if not self._query_('UPDATE',{self.table:{k:self.to_str(v) for k,v in items.items() if k in self.ALL_COLUMNS}},condition):
 				return False
+			self.__update_apply__(items, condition)
+			return True
+		except BaseException as e:
+			raise e
+
+	def __update_apply__(self, items: dict, condition: Condition):
+		"""
+		Apply values written by update() to the DataFrame and reload the databases.
+		"""
+		with self.LOCK:
+			indexs = self.index
 			if len(condition.functions)>0:
 				if not isinstance(condition.course[0],Where):
 					raise QueryException("The condition is not suitable. The condition must only be 'WHERE'")
@@ -1062,10 +1664,7 @@ class Items(DataFrame):
 			for key, val in items.items():
 				self.loc[indexs, key] = val
 			self.enjoin()
-			self._upgraded_()
-			return True
-		except BaseException as e:
-			raise e
+		self._upgraded_()
 
 	def delete(self, condition: Condition = Condition()) -> bool:
 		"""
@@ -1090,6 +1689,16 @@ class Items(DataFrame):
 		try:
 			if not self._query_('DELETE',[self.table], condition):
 				return False
+			self.__delete_apply__(condition)
+			return True
+		except BaseException as e:
+			raise e
+
+	def __delete_apply__(self, condition: Condition):
+		"""
+		Drop rows deleted by delete() from the DataFrame and reload the databases.
+		"""
+		with self.LOCK:
 			if len(condition.functions)==0:
 				self.drop(self.index,inplace=True)
 			else:
@@ -1099,11 +1708,424 @@ class Items(DataFrame):
 				if type(indexs) is pd.Index:
 					self.drop(indexs,inplace=True) 
 			self.enjoin()
-			self._upgraded_()
+		self._upgraded_()
+
+	def upsert(self, rows, key: Union[str, list, tuple] = None, update_columns: list = None, columns: list = None, chunk: int = 1000) -> bool:
+		"""
+		Insert new rows and update existing ones with the native conflict handling of the DBMS.
+
+		This function writes the rows in chunked bulk statements using ON CONFLICT DO UPDATE on 
+		PostgreSQL and SQLite, or ON DUPLICATE KEY UPDATE on MySQL, so an insert-or-update costs 
+		one round trip per chunk and is resolved atomically by the server. The local data is then 
+		merged by key instead of being reloaded.
+
+		Args:
+			rows: A DataFrame, a list of dictionaries or a list of lists (together with 'columns').
+			key (Union[str, list, tuple], optional): The conflict key columns. Defaults to the primary key. 
+													MySQL resolves conflicts on any primary or unique key.
+			update_columns (list, optional): The columns overwritten when the row already exists. 
+											Defaults to all non-key columns; an empty list keeps existing rows untouched.
+			columns (list, optional): Column names for rows given as lists.
+			chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+
+		Returns:
+			bool: True if the rows were successfully written, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the key or update columns are not suitable.
+		"""
+		try:
+			frame = self.__rows_frame__(rows, columns)
+			if len(frame) == 0:
+				return True
+			key = self.__key__(key)
+			if not all(k in frame.columns for k in key):
+				raise QueryException(f"Rows must contain the key columns {key}")
+			frame = frame.drop_duplicates(subset=key, keep='last')
+			if update_columns is None:
+				update_columns = [c for c in frame.columns if c not in key]
+			if not all(c in frame.columns and c not in key for c in update_columns):
+				raise QueryException("Update columns must be non-key columns present in the rows")
+			if not self._query_('UPSERT', {self.table: {
+				'columns': list(frame.columns),
+				'values': [list(map(self.to_value, row)) for row in frame.itertuples(index=False, name=None)],
+				'key': key,
+				'update_columns': list(update_columns)
+			}}, {'chunk': chunk}):
+				return False
+			with self.LOCK:
+				self.__merge_rows__(frame, key, update_columns)
+				self.enjoin()
+			return True
+		except BaseException as e:
+			raise e
+
+	def update_many(self, rows, key: Union[str, list, tuple] = None, columns: list = None, chunk: int = 1000) -> bool:
+		"""
+		Update existing records by key, each with its own values.
+
+		This function sends the rows in chunked bulk statements that join the table to the 
+		incoming values on the key columns: UPDATE ... FROM (VALUES ...) on PostgreSQL, a joined 
+		derived table on MySQL and a temporary table join on SQLite. Rows whose key does not exist 
+		are ignored. The local data is patched by key in one vectorized pass instead of scanning 
+		it once per row.
+
+		Args:
+			rows: A DataFrame, a list of dictionaries or a list of lists (together with 'columns') 
+				containing the key columns and the new values.
+			key (Union[str, list, tuple], optional): The key columns. Defaults to the primary key.
+			columns (list, optional): Column names for rows given as lists.
+			chunk (int, optional): The maximum number of rows per statement. Defaults to 1000.
+
+		Returns:
+			bool: True if the records were successfully updated, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the rows do not carry the key and values.
+		"""
+		try:
+			frame = self.__rows_frame__(rows, columns)
+			if len(frame) == 0:
+				return True
+			key = self.__key__(key)
+			if not all(k in frame.columns for k in key):
+				raise QueryException(f"Rows must contain the key columns {key}")
+			if len(frame.columns) == len(key):
+				raise QueryException("Rows must contain at least one column to update")
+			frame = frame.drop_duplicates(subset=key, keep='last')
+			if not self._query_('UPDATE_MANY', {self.table: {
+				'columns': list(frame.columns),
+				'values': [list(map(self.to_value, row)) for row in frame.itertuples(index=False, name=None)],
+				'key': key
+			}}, {'chunk': chunk}):
+				return False
+			with self.LOCK:
+				self.__merge_rows__(frame, key, append=False)
+				self.enjoin()
+			return True
+		except BaseException as e:
+			raise e
+
+	def delete_keys(self, keys, key: Union[str, list, tuple] = None, chunk: int = None, temp: int = 100000) -> bool:
+		"""
+		Remove records whose key is in the given list.
+
+		This function deletes the records in chunks sized to the parameter limit of the DBMS, 
+		so large key lists do not require building IN (...) strings by hand. Lists longer than 
+		'temp' are loaded into a temporary table and deleted with one joined statement. The rows 
+		are removed from the local data through the key index instead of a condition scan.
+
+		Args:
+			keys: A list of key values, a list of tuples for a composite key, a Series or a DataFrame.
+			key (Union[str, list, tuple], optional): The key columns. Defaults to the primary key.
+			chunk (int, optional): The maximum number of keys per statement. Defaults to the DBMS parameter limit.
+			temp (int, optional): The number of keys above which a temporary table is used. Defaults to 100000.
+
+		Returns:
+			bool: True if the records were successfully deleted, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the key does not exist.
+		"""
+		try:
+			key = self.__key__(key)
+			frame = self.__keys_frame__(keys, key)
+			if len(frame) == 0:
+				return True
+			if not self._query_('DELETE_KEYS', {self.table: {
+				'key': key,
+				'values': [list(map(self.to_value, row)) for row in frame.itertuples(index=False, name=None)]
+			}}, {'chunk': chunk, 'temp': temp}):
+				return False
+			with self.LOCK:
+				self.__drop_keys__(frame, key)
+				self.enjoin()
 			return True
 		except BaseException as e:
 			raise e
 
+	def sync_policy(self, column: str, key: list = None):
+		"""
+		Set a watermark-based delta sync policy for the table.
+
+		After this call refresh() only fetches the rows whose watermark column is at or past the 
+		highest value already in the mirror and merges them by key, instead of reloading the table.
+
+		Args:
+			column (str): A monotonically growing column, e.g. an auto-increment id or an 'updated_at' timestamp.
+			key (list, optional): The key columns used for the merge. Defaults to the primary key.
+
+		Returns:
+			WatermarkSync: The policy. Its metrics() report the watermark, the sync lag and the rows per sync.
+
+		Raises:
+			QueryException: If the column or the key does not exist.
+		"""
+		from .sync import WatermarkSync
+		self.SYNC = WatermarkSync(self, column, key)
+		return self.SYNC
+
+	def capture_changes(self, key: list = None, log: str = '_tc_changelog', prune: bool = True, install: bool = True):
+		"""
+		Keep the table in sync through a trigger-backed changelog.
+
+		AFTER INSERT, UPDATE and DELETE triggers append the key of every changed row to a changelog 
+		table. After this call refresh() applies only those keys to the mirror, including deletes 
+		and updates of any column, and prunes the consumed entries.
+
+		Args:
+			key (list, optional): The key columns logged by the triggers. Defaults to the primary key.
+			log (str, optional): The name of the changelog table. Defaults to '_tc_changelog'.
+			prune (bool, optional): If True, consumed entries are deleted from the changelog. Defaults to True.
+			install (bool, optional): If True, the changelog table and the triggers are created. Defaults to True.
+
+		Returns:
+			ChangeCapture: The sync policy. Its remove() drops the triggers again.
+
+		Raises:
+			QueryException: If the key does not exist.
+		"""
+		from .sync import ChangeCapture
+		capture = ChangeCapture(self, key, log, prune)
+		if install and not capture.install():
+			raise QueryException(f"The change capture triggers of '{self.table}' could not be installed")
+		self.SYNC = capture
+		return self.SYNC
+
+	def refresh(self, force: bool = False) -> int:
+		"""
+		Bring the mirror of the table up to date with the database.
+
+		With a sync policy or change capture only the changed rows are fetched and merged, otherwise 
+		all rows of the table are selected again and replace the mirror. Other tables are not reloaded.
+		Before a full reload the change marker of the table (see CHANGE_MARKER) is compared with the 
+		one of the last load, and the table is not read at all if it is unchanged.
+
+		Args:
+			force (bool, optional): If True, the table is reloaded even if its change marker is unchanged. Defaults to False.
+
+		Returns:
+			int: The number of fetched rows, 0 if the table was unchanged.
+		"""
+		if getattr(self, 'SYNC', None) is not None:
+			return self.SYNC.sync()
+		try:
+			marker = self._query_('CHANGE_MARKER', [self.table]).get(self.table)
+			if not force and marker is not None and marker == getattr(self, 'MARKER', None):
+				return 0
+			self.MARKER = marker
+			columns = list(self.ALL_COLUMNS)
+			rows = tuple(self._query_('SELECT', {self.table: columns}, '').values())[0]
+			frame = DataFrame(list(rows), columns=columns)
+			if len(frame) == 0:
+				frame = DataFrame([dict.fromkeys(columns, NoneValue())])
+			with self.LOCK:
+				self._update_inplace(frame)
+				self.enjoin()
+			return len(rows)
+		except BaseException as e:
+			raise e
+
+	def stream(self, columns: list = None, condition: Union[Condition, str] = '', size: int = 1000):
+		"""
+		Read the rows of the table from the database in batches, without loading them into the DataFrame.
+
+		The rows are read with a server-side cursor over a connection of its own, which is closed 
+		when the generator is exhausted or closed.
+
+		Args:
+			columns (list, optional): A list of column names to read. If None, reads all columns.
+			condition (Condition or str, optional): The condition of the SELECT. Defaults to no condition.
+			size (int, optional): The number of rows per batch. Defaults to 1000.
+
+		Yields:
+			DataFrame: The next batch of rows.
+		"""
+		columns = list(self.ALL_COLUMNS if columns is None else columns)
+		if not self.is_column(*columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		connection = self._connection_().clone()
+		batches = None
+		try:
+			batches = connection.query_f('STREAM', {self.table: columns}, {'condition': condition, 'size': max(int(size), 1)})
+			for batch in batches:
+				yield DataFrame(batch, columns=columns)
+		finally:
+			if batches is not None:
+				batches.close()
+			connection.close()
+
+	def hash_join(self, table, column: str, how: str = 'inner', NaN: bool = False, **kwargs):
+		"""
+		Join this table with a table of any database by a streaming hash join.
+
+		Unlike Join.get, which merges the mirrors of tables of different databases, the rows of both 
+		tables are streamed from their databases and the build side spills to disk above a memory budget.
+
+		Args:
+			table (Items): The second table of the join.
+			column (str): The column both tables are joined on.
+			how (str, optional): 'inner', 'left', 'right' or 'outer'. Defaults to 'inner'.
+			NaN (bool, optional): If True, missing values of the result of get() are replaced by NoneValue. Defaults to False.
+			**kwargs: The options of HashJoin, e.g. memory, partitions, size, build, keys, max_keys, conditions and path.
+
+		Returns:
+			HashJoin: The join. Iterate over it for batches of joined rows, or call get() for all of them.
+		"""
+		from .hashjoin import HashJoin
+		return HashJoin(Join(self, table, column, how, NaN), **kwargs)
+
+	def pool(self, workers: int = None):
+		"""
+		Return the executor of the asyncio methods of this table.
+
+		The pool is shared by all tables of the database. Its queries run on worker threads over 
+		connections cloned from the main connection, so coroutines never block the event loop.
+
+		Args:
+			workers (int, optional): The number of threads and connections, only used when the pool is created. Defaults to 4.
+
+		Returns:
+			AsyncPool: The pool of the database.
+		"""
+		from .aio import get_pool
+		return get_pool(self._query_, self._connection_(), workers)
+
+	async def aget(self, columns: list = None, condition: Condition = Condition(), distinct: bool = False, sql: bool = False):
+		"""
+		Retrieve data like get() from a coroutine.
+
+		Without 'sql' the data is taken from the DataFrame as by get(), which does not block. With 
+		'sql' the SELECT runs on the asyncio pool.
+
+		Args:
+			columns (list, optional): A list of column names to retrieve. If None, retrieves all columns.
+			condition (Condition, optional): A condition object to filter the results. Defaults to an empty condition.
+			distinct (bool, optional): If True, retrieves only distinct rows. Defaults to False.
+			sql (bool, optional): If True, the rows are selected from the database. Defaults to False.
+
+		Returns:
+			DataFrame or list: The retrieved data, with 'sql' a list of dictionaries.
+
+		Raises:
+			QueryException: If the data types of columns and condition do not match.
+		"""
+		if not sql:
+			return self.get(columns, condition, distinct)
+		if not isinstance(columns,(list, tuple, type(None))) and not isinstance(condition,Condition):
+			raise QueryException(f"Data types do not match")
+		columns = list(self.ALL_COLUMNS if columns is None else columns)
+		data = await self.pool().query('SELECT_DISTINCT' if distinct else 'SELECT',{self.table:columns},condition)
+		return list(map(lambda x: dict(zip(columns,x)),tuple(data.values())[0]))
+
+	async def aadd(self, values: list, columns: list) -> bool:
+		"""
+		Add new rows like add() from a coroutine. The INSERT runs on the asyncio pool.
+
+		Args:
+			values (list): A list of rows, each a list of values in the order of 'columns'.
+			columns (list): A list of column names corresponding to the values.
+
+		Returns:
+			bool: True if the data was successfully added, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the specified columns do not exist.
+		"""
+		if not isinstance(columns,(list, tuple)) and not isinstance(values,(list, tuple)):
+			raise QueryException(f"Data types do not match")
+		if not self.is_column(*columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		if getattr(self, 'BUFFER', None) is not None and not self.BUFFER.closed:
+			return self.BUFFER.add(values, columns)
+		try:
+			pool = self.pool()
+			self.added(values, columns, self.__types__(await pool.query('FIELDS',[self.table])))
+			if not await pool.query('INSERT',self.__add_query__(values,columns)):
+				return False
+			self.__add_apply__(values)
+			return True
+		except BaseException as e:
+			raise e
+
+	async def aupdate(self, items: dict, condition: Condition = Condition()) -> bool:
+		"""
+		Update records like update() from a coroutine. The UPDATE runs on the asyncio pool.
+
+		Args:
+			items (dict): A dictionary containing the fields and their new values to be updated.
+			condition (Condition, optional): A condition object to filter which records to update. 
+											Defaults to an empty condition.
+
+		Returns:
+			bool: True if the records were successfully updated, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the condition is not suitable.
+		"""
+		if not isinstance(items,dict) and not isinstance(condition,Condition):
+			raise QueryException(f"Data types do not match")
+		try:
+			if not await self.pool().query('UPDATE',{self.table:{k:self.to_str(v) for k,v in items.items() if k in self.ALL_COLUMNS}},condition):
+				return False
+			self.__update_apply__(items, condition)
+			return True
+		except BaseException as e:
+			raise e
+
+	async def adelete(self, condition: Condition = Condition()) -> bool:
+		"""
+		Remove records like delete() from a coroutine. The DELETE runs on the asyncio pool.
+
+		Args:
+			condition (Condition, optional): A condition object to filter which records to delete. 
+											Defaults to an empty condition.
+
+		Returns:
+			bool: True if the records were successfully deleted, False otherwise.
+
+		Raises:
+			QueryException: If the data types do not match or if the condition is not suitable.
+		"""
+		if not isinstance(condition,Condition):
+			raise QueryException(f"Data types do not match")
+		try:
+			if not await self.pool().query('DELETE',[self.table], condition):
+				return False
+			self.__delete_apply__(condition)
+			return True
+		except BaseException as e:
+			raise e
+
+	async def astream(self, columns: list = None, condition: Union[Condition, str] = '', size: int = 1000):
+		"""
+		Read the rows of the table from the database in batches, without loading them into the DataFrame.
+
+		The rows are read with a server-side cursor on a connection of the asyncio pool, so a 
+		table larger than memory can be processed batch by batch:
+
+			async for batch in table.astream(size=5000):
+				...
+
+		Args:
+			columns (list, optional): A list of column names to read. If None, reads all columns.
+			condition (Condition or str, optional): The condition of the SELECT. Defaults to no condition.
+			size (int, optional): The number of rows per batch. Defaults to 1000.
+
+		Yields:
+			DataFrame: The next batch of rows.
+		"""
+		columns = list(self.ALL_COLUMNS if columns is None else columns)
+		if not self.is_column(*columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {self.ALL_COLUMNS}")
+		stream = self.pool().stream({self.table: columns}, condition, size)
+		try:
+			async for batch in stream:
+				yield DataFrame(batch, columns=columns)
+		finally:
+			# Leaving the loop early closes the cursor and the connection of the stream at once.
+			await stream.aclose()
+
 	def get_foreigns(self) -> list:
 		"""
 		Retrieve foreign key constraints for the database table.
@@ -1366,7 +2388,8 @@ class Column(Series):
 		key (str): The name of the column.
 		values (list): The initial values for the column.
 		*args: Variable length argument list for additional parameters.
-		**kwargs: Arbitrary keyword arguments for additional attributes.
+		**kwargs: Arbitrary keyword arguments for additional attributes, e.g. shared=True to 
+				  use the values of an attached shared mirror without copying them.
 
 	Attributes:
 		_name (str): The name of the column.
@@ -1413,13 +2436,15 @@ class Column(Series):
 
 		def is_noneValue(value):
 			return isinstance(value,NoneValue)
-		super(Column, self).__init__(values)
+		shared = kwargs.get('shared',False)
+		super(Column, self).__init__(values, copy=False) if shared else super(Column, self).__init__(values)
 		self._name = key
 		self.table = table
 		self.parent = kwargs.get('parent',None)
 		self.key = key
 		self.column = f'{self.table}.{self.key}'
-		self.__copy_data__ = self.copy()
+		# The data of a shared mirror is read-only, so it is its own restore point.
+		self.__copy_data__ = self if shared else self.copy()
 		self.default = lambda : self.parent.types(self.key).get('default', None)
 		self.number = lambda : self.parent.types(self.key).get('number', -1)
 		self.type = lambda : self.parent.types(self.key).get('type', None)
@@ -0,0 +1,65 @@
+import sys
+import importlib
+from ..condition import QueryException
+
+ENTRY_POINT_GROUP = 'pytopconnect.drivers'
+
+__BUILTIN__ = ['sqlite', 'mysql', 'postgresql']
+
+__DRIVERS__ = {}
+
+def __entry_points__() -> dict:
+	"""
+	 Collect the drivers that installed packages advertise in the 'pytopconnect.drivers' entry point group.
+
+	 @return A dictionary with the method name as key and the entry point as value
+	"""
+	try:
+		from importlib.metadata import entry_points
+	except ImportError:
+		return {}
+	if sys.version_info >= (3, 10):
+		points = entry_points(group=ENTRY_POINT_GROUP)
+	else:
+		points = entry_points().get(ENTRY_POINT_GROUP, [])
+	return {point.name.lower(): point for point in points}
+
+def register_driver(method:str, driver):
+	"""
+	 Register a connection class for a method. A registered driver replaces a built-in one with the same name.
+
+	 @param method - The method name used in the QueryRead configuration, e.g. 'oracle'
+	 @param driver - The connection class. It is called as driver(data, parameters) and must provide query_f like the built-in queryPY classes
+	"""
+	if not callable(driver):
+		raise QueryException(f"The driver for '{method}' must be a class")
+	__DRIVERS__[method.lower().strip()] = driver
+
+def drivers() -> list:
+	"""
+	 List the methods for which a driver is built in, registered or advertised by an entry point.
+
+	 @return A sorted list of method names
+	"""
+	return sorted(set(__BUILTIN__) | set(__DRIVERS__) | set(__entry_points__()))
+
+def get_driver(method:str):
+	"""
+	 Return the connection class of a method. Every driver module is imported once per process and the class is cached, so later connections and reconnects do not execute the module again.
+
+	 @param method - The method name, e.g. 'mysql'
+
+	 @return The queryPY class of the built-in driver, or the class registered for the method
+	"""
+	method = method.lower().strip()
+	if method in __DRIVERS__:
+		return __DRIVERS__[method]
+	if method in __BUILTIN__:
+		driver = importlib.import_module(f'.{method}', __name__).queryPY
+	else:
+		point = __entry_points__().get(method)
+		if point is None:
+			raise QueryException('Module not found')
+		driver = point.load()
+	__DRIVERS__[method] = driver
+	return driver
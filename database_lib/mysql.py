@@ -18,6 +18,10 @@ class queryPY(pymysql.connections.Connection):
 		functinon_list (dict, optional): A dictionary containing the methods for executing SQL queries. Defaults to a predefined list.
 		"""
 
+	MAX_PARAMETERS = 65535
+	PARALLEL_LOAD = True
+	NULLS_FIRST = True
+
 	def __init__(self, data, paramets):
 		"""
 		Initialize a database connection with specified parameters.
@@ -76,6 +80,17 @@ class queryPY(pymysql.connections.Connection):
 		"""
 		self.close_cur()
 		self.__init__(self.DATA_CONNECT,self.paramets)
+	def clone(self):
+		"""
+		Open a new connection with the same connection data and parameters.
+
+		This function is used by background workers that must not share the cursor state of the 
+		main connection. The new connection is independent and must be closed by the caller.
+
+		Returns:
+			queryPY: A new connection to the same database.
+		"""
+		return queryPY(self.DATA_CONNECT, dict(self.paramets, attempts=0))
 	def is_active(self):
 		"""
 		Check if the database connection is active.
@@ -150,9 +165,23 @@ class queryPY(pymysql.connections.Connection):
 			"VERSION":self.version_f,
 			"SELECT":self.selection_f,
 			"SELECT_DISTINCT":self.selection_distinct_f,
+			"STREAM":self.stream_f,
+			"JOIN":self.join_f,
 			"INSERT":self.insert_f,
+			"BULK_INSERT":self.bulk_insert_f,
+			"EXECUTE":self.execute_f,
 			"UPDATE":self.update_f,
 			"DELETE":self.delete_f,
+			"UPSERT":self.upsert_f,
+			"UPDATE_MANY":self.update_many_f,
+			"DELETE_KEYS":self.delete_keys_f,
+			"KEY_RANGE":self.key_range_f,
+			"CHANGE_MARKER":self.change_marker_f,
+			"CATALOG":self.catalog_f,
+			"CAPTURE":self.capture_f,
+			"READ_CHANGES":self.read_changes_f,
+			"PRUNE_CHANGES":self.prune_changes_f,
+			"SNAPSHOT":self.snapshot_f,
 			"SHOW_TABLE":self.show_table_f,
 			"SHOW_COLUMNS":self.show_coll_f,
 			"FIELDS":self.show_field_f,
@@ -255,6 +284,74 @@ class queryPY(pymysql.connections.Connection):
 			self.cur.execute(select)
 			q[tab] = self.cur.fetchall()
 		return q
+	def stream_f(self, q, r):
+		"""
+		Read the rows of a SELECT in batches with an unbuffered server-side cursor.
+
+		The rows are read with a cursor of its own, so the result is not held in memory as a whole. 
+		The returned generator must be exhausted or closed before the connection runs other queries.
+
+		Args:
+			q (dict): A dictionary with one table name as key and the list of columns to select as value.
+			r (dict): Additional options, including 'condition' (SQL clauses appended to the query, 
+					e.g. WHERE conditions) and 'size' (the number of rows per batch, default 1000).
+
+		Returns:
+			generator: A generator of lists of row tuples.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		tab, cols = list(q.items())[0]
+		columns = ','.join(map(lambda x: f'{tab}.{x}', cols)) if len(cols)>0 else f'{tab}.*'
+		size = int(r.get('size',1000))
+		def batches():
+			cur = self.cursor(pymysql.cursors.SSCursor)
+			try:
+				cur.execute(f"""SELECT {columns} FROM {tab} {r.get('condition','')}""")
+				while True:
+					rows = cur.fetchmany(size)
+					if len(rows)==0:
+						break
+					yield [tuple(row) for row in rows]
+			finally:
+				cur.close()
+		return batches()
+	def join_f(self, q, r):
+		"""
+		Execute a SELECT over two tables joined on a common column.
+
+		MySQL has no FULL JOIN, so an outer join is emulated as a LEFT JOIN followed by the 
+		unmatched rows of a RIGHT JOIN. The emulation only supports WHERE conditions; for other 
+		clauses None is returned and the caller joins the tables itself.
+
+		Args:
+			q (dict): The join, with 'left' and 'right' (the table names), 'on' (the common column), 
+					'how' ('inner', 'left', 'right' or 'outer') and 'columns' (the select expressions).
+			r: Additional SQL clauses to append to the query (e.g., WHERE conditions).
+
+		Returns:
+			list: The joined rows as tuples, or None if the join cannot be run by the database.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		left, right, on = q['left'], q['right'], q['on']
+		columns = ','.join(q['columns'])
+		r = str(r).strip()
+		hows = {'inner':'INNER JOIN','left':'LEFT JOIN','right':'RIGHT JOIN'}
+		if q['how'] in hows:
+			self.cur.execute(f"""SELECT {columns} FROM {left} {hows[q['how']]} {right} ON {left}.{on}={right}.{on} {r}""")
+			return list(self.cur.fetchall())
+		if r!='' and (not r.upper().startswith('WHERE') or re.search(r'\b(GROUP\s+BY|HAVING|ORDER\s+BY|LIMIT|OFFSET)\b', r, re.I)):
+			return None
+		unmatched = f"WHERE {left}.{on} IS NULL" + (f" AND ({r[5:].strip()})" if r!='' else '')
+		self.cur.execute(f"""SELECT {columns} FROM {left} LEFT JOIN {right} ON {left}.{on}={right}.{on} {r} UNION ALL SELECT {columns} FROM {left} RIGHT JOIN {right} ON {left}.{on}={right}.{on} {unmatched}""")
+		return list(self.cur.fetchall())
 	def insert_f(self, q, r):
 		"""
 		Execute an INSERT query to add new records to the specified tables.
@@ -284,6 +381,58 @@ class queryPY(pymysql.connections.Connection):
 			return True
 		except BaseException as e:
 			raise e
+	def execute_f(self, q, r):
+		"""
+		Execute SQL statements as they are written, e.g. the statements of a script.
+
+		Args:
+			q (Union[str, list]): A single statement or a list of statements, each without its delimiter.
+			r: Not used.
+
+		Returns:
+			int: The number of rows changed by the statements, as far as the driver reports it.
+
+		Raises:
+			Exception: If an error occurs during the execution of a statement.
+		"""
+		try:
+			count = 0
+			for statement in ([q] if isinstance(q,str) else q):
+				self.cur.execute(statement)
+				count += max(self.cur.rowcount,0)
+			return count
+		except BaseException as e:
+			raise e
+	def bulk_insert_f(self, q, r):
+		"""
+		Execute chunked bulk INSERT statements with bound parameters.
+
+		This function writes the provided rows in chunks that stay within the parameter limit of 
+		the server, using the fastest batch path of the driver. It is the bulk counterpart of the 
+		INSERT method and does not render values into the statement text.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns' and 'values' (a list of rows) for the insert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully inserted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the insert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				insert = f"""INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join(['%s']*len(columns))})"""
+				for i in range(0,len(values),chunk):
+					self.cur.executemany(insert,values[i:i+chunk])
+			return True
+		except BaseException as e:
+			raise e
 	def update_f(self, q, r):
 		"""
 		Execute an UPDATE query to modify existing records in the specified tables.
@@ -336,6 +485,327 @@ class queryPY(pymysql.connections.Connection):
 		except BaseException as e:
 			raise e
 		return True
+	def upsert_f(self, q, r):
+		"""
+		Execute chunked INSERT ... ON DUPLICATE KEY UPDATE statements.
+
+		This function writes the provided rows in chunks that stay within the server parameter 
+		limit and lets MySQL resolve conflicts on the primary key or any unique key of the table. 
+		Columns listed in 'update_columns' are overwritten with the incoming values; when the list 
+		is empty the conflicting rows are left untouched.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values', 'key' and 'update_columns' for the upsert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully written.
+
+		Raises:
+			Exception: If an error occurs during the execution of the upsert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				update = [f'{c}=VALUES({c})' for c in cols.get('update_columns',[])] or [f'{key[0]}={key[0]}']
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				upsert = f"""INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join(['%s']*len(columns))}) ON DUPLICATE KEY UPDATE {','.join(update)}"""
+				for i in range(0,len(values),chunk):
+					self.cur.executemany(upsert,values[i:i+chunk])
+			return True
+		except BaseException as e:
+			raise e
+	def update_many_f(self, q, r):
+		"""
+		Execute chunked UPDATE statements joined to a derived table of per-row values.
+
+		This function sends each chunk of rows as a UNION ALL derived table and joins it to the 
+		target table on the key columns, so rows receive different values in one statement per 
+		chunk instead of one statement per row.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values' and 'key' for the update operation. The key columns are part of 'columns'.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully updated.
+
+		Raises:
+			Exception: If an error occurs during the execution of the update statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				first = 'SELECT '+','.join([f'%s AS {c}' for c in columns])
+				other = 'SELECT '+','.join(['%s']*len(columns))
+				on = ' AND '.join([f'{table}.{k}=v.{k}' for k in key])
+				sets = ','.join([f'{table}.{c}=v.{c}' for c in columns if c not in key])
+				for i in range(0,len(values),chunk):
+					part = values[i:i+chunk]
+					derived = ' UNION ALL '.join([first]+[other]*(len(part)-1))
+					self.cur.execute(f"""UPDATE {table} JOIN ({derived}) AS v ON {on} SET {sets}""",[v for row in part for v in row])
+			return True
+		except BaseException as e:
+			raise e
+	def delete_keys_f(self, q, r):
+		"""
+		Execute chunked DELETE statements for a list of key values.
+
+		This function deletes the rows whose key matches one of the given values with IN lists 
+		sized to stay within the parameter limit of the server. Lists longer than the 'temp' 
+		option are loaded into a temporary table first and removed with a single joined DELETE.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key column names) and 'values' (a list of key rows).
+			r (dict): Additional options, including 'chunk' for the maximum number of keys per statement 
+					and 'temp' for the number of keys above which a temporary table is used.
+
+		Returns:
+			bool: True if the records were successfully deleted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the delete statements.
+		"""
+		try:
+			for table, cols in q.items():
+				key = list(cols.get('key',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,min(int(r.get('chunk') or self.MAX_PARAMETERS),self.MAX_PARAMETERS//len(key)))
+				match = key[0] if len(key)==1 else f"({','.join(key)})"
+				row = '%s' if len(key)==1 else f"({','.join(['%s']*len(key))})"
+				if len(values)>int(r.get('temp',100000)):
+					temp = f'_tc_delete_{table}'
+					self.cur.execute(f"""DROP TEMPORARY TABLE IF EXISTS {temp}""")
+					self.cur.execute(f"""CREATE TEMPORARY TABLE {temp} (PRIMARY KEY ({','.join(key)})) SELECT {','.join(key)} FROM {table} LIMIT 0""")
+					for i in range(0,len(values),chunk):
+						self.cur.executemany(f"""INSERT IGNORE INTO {temp} VALUES ({','.join(['%s']*len(key))})""",values[i:i+chunk])
+					self.cur.execute(f"""DELETE {table} FROM {table} JOIN {temp} ON {' AND '.join([f'{table}.{k}={temp}.{k}' for k in key])}""")
+					self.cur.execute(f"""DROP TEMPORARY TABLE {temp}""")
+					continue
+				for i in range(0,len(values),chunk):
+					part = values[i:i+chunk]
+					self.cur.execute(f"""DELETE FROM {table} WHERE {match} IN ({','.join([row]*len(part))})""",[v for val in part for v in val])
+			return True
+		except BaseException as e:
+			raise e
+	def key_range_f(self, q, r):
+		"""
+		Retrieve the lowest and highest value of a key column and the number of rows of a table.
+
+		This function is used to split a table into key ranges that can be loaded over several 
+		connections at once.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are the key column.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary mapping each table name to a (min, max, count) tuple.
+		"""
+		for table, key in q.items():
+			self.cur.execute(f"""SELECT MIN({key}), MAX({key}), COUNT(*) FROM {table}""")
+			q[table] = tuple(self.cur.fetchone())
+		return q
+	def snapshot_f(self, q, r):
+		"""
+		Start a transaction with a consistent snapshot on this connection.
+
+		MySQL cannot hand a snapshot over to another session, so every connection that takes part 
+		in a parallel load starts its own consistent snapshot. The coordinating connection (q is None) 
+		takes FLUSH TABLES WITH READ LOCK first, which needs the RELOAD privilege, so no commit lands 
+		between the starts of the snapshots, and releases it once they have all started. The connection 
+		must not auto commit while the snapshot is in use.
+
+		Args:
+			q: The identifier returned by the coordinating connection, or None to take the read lock.
+			r: Additional parameters for the query. {'release': True} releases the read lock.
+
+		Returns:
+			int: The id of the session holding the read lock for the coordinating connection, otherwise None.
+		"""
+		if isinstance(r, dict) and r.get('release', False):
+			self.cur.execute("UNLOCK TABLES")
+			return None
+		if q is None:
+			self.cur.execute("FLUSH TABLES WITH READ LOCK")
+			return self.thread_id()
+		self.cur.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT")
+		return None
+	def change_marker_f(self, q, r):
+		"""
+		Retrieve a cheap change marker for each of the specified tables.
+
+		The marker combines UPDATE_TIME, AUTO_INCREMENT and the data length from INFORMATION_SCHEMA.TABLES, 
+		read without the statistics cache where the server allows it. TABLE_ROWS is left out because 
+		InnoDB only estimates it. UPDATE_TIME has a resolution of one second, so a table written in the 
+		second of the read may change again without moving its marker; such a table, like a table 
+		without an UPDATE_TIME (older InnoDB versions or after a restart), gets no marker and is 
+		treated as changed. With 'checksum' in r the latter fall back to CHECKSUM TABLE instead, which 
+		reads the whole table but is exact.
+
+		Args:
+			q: A list or tuple containing the names of the tables to check.
+			r: Additional parameters for the query. {'checksum': True} allows CHECKSUM TABLE.
+
+		Returns:
+			dict: A dictionary mapping each table name to its change marker, or None if it is unknown.
+		"""
+		try:
+			self.cur.execute("SET SESSION information_schema_stats_expiry = 0")
+		except pymysql.Error:
+			pass
+		checksum = isinstance(r, dict) and r.get('checksum', False)
+		tables = list(map(str,q))
+		self.cur.execute("SELECT `TABLE_NAME`,`UPDATE_TIME`,`AUTO_INCREMENT`,`DATA_LENGTH`,NOW() FROM INFORMATION_SCHEMA.TABLES WHERE `TABLE_SCHEMA` = DATABASE()")
+		stats = {row[0]: row[1:] for row in self.cur.fetchall()}
+		markers = {}
+		for table in tables:
+			stat = stats.get(table)
+			if stat is None:
+				markers[table] = None
+			elif stat[0] is not None:
+				# Only an UPDATE_TIME strictly older than the second of the read cannot move within that second.
+				markers[table] = '|'.join(map(str, stat[:-1])) if stat[0] < stat[-1] else None
+			elif checksum:
+				self.cur.execute(f"CHECKSUM TABLE `{table}`")
+				value = self.cur.fetchone()
+				markers[table] = None if value is None or value[1] is None else f'checksum|{value[1]}'
+			else:
+				markers[table] = None
+		return markers
+	def catalog_f(self, q, r):
+		"""
+		Retrieve the version, all routines and all triggers of the database in one query.
+
+		The routine parameters and the triggers are read from INFORMATION_SCHEMA with a single UNION ALL 
+		statement instead of one round trip per database and per table.
+
+		Args:
+			q (str): The name of the database (schema) to query.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary with 'version', 'procedures' and 'functions' (name -> list of parameters, 
+				as SHOW_PROCEDURE and SHOW_FUNCTION return them) and 'triggers' (table -> trigger name -> 
+				dictionary with 'time' and 'event', as SHOW_TRIGGER returns them).
+
+		Raises:
+			Exception: If an error occurs during the execution of the query.
+		"""
+		try:
+			self.cur.execute(f"""SELECT 'VERSION', NULL, VERSION(), NULL, NULL, 0
+				UNION ALL SELECT CAST(`ROUTINE_TYPE` AS CHAR), NULL, CAST(`SPECIFIC_NAME` AS CHAR), CAST(`PARAMETER_NAME` AS CHAR), NULL, `ORDINAL_POSITION`
+					FROM `INFORMATION_SCHEMA`.`PARAMETERS` WHERE `SPECIFIC_SCHEMA`='{q}' AND `ROUTINE_TYPE` IN ('PROCEDURE','FUNCTION')
+				UNION ALL SELECT 'TRIGGER', CAST(`EVENT_OBJECT_TABLE` AS CHAR), CAST(`TRIGGER_NAME` AS CHAR), CAST(`ACTION_TIMING` AS CHAR), CAST(`EVENT_MANIPULATION` AS CHAR), `ACTION_ORDER`
+					FROM `INFORMATION_SCHEMA`.`TRIGGERS` WHERE `TRIGGER_SCHEMA`='{q}'
+				ORDER BY 1, 3, 6;""")
+			data = {'version': None, 'procedures': {}, 'functions': {}, 'triggers': {}}
+			for kind, table, name, first, second, _ in self.cur.fetchall():
+				if kind == 'VERSION':
+					data['version'] = name
+				elif kind == 'TRIGGER':
+					data['triggers'].setdefault(table, {})[name] = {'time': first, 'event': second}
+				else:
+					data['procedures' if kind == 'PROCEDURE' else 'functions'].setdefault(name, []).append(first)
+			return data
+		except BaseException as e:
+			raise e
+	def capture_f(self, q, r):
+		"""
+		Install or remove the change capture triggers of tables.
+
+		The triggers append (table, key, op, seq) rows to a compact changelog table that is created if 
+		it does not exist. An update that changes the key is logged as a delete of the old key followed 
+		by an update of the new one.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key columns) and 'log' (the name of the changelog table).
+			r (dict): Additional options, including 'drop' to remove the triggers instead of installing them.
+
+		Returns:
+			bool: True if the triggers were successfully installed or removed.
+
+		Raises:
+			Exception: If an error occurs during the execution of the statements.
+		"""
+		try:
+			for table, cols in q.items():
+				key, log = list(cols['key']), cols['log']
+				for suffix in ('i', 'u', 'd'):
+					self.cur.execute(f"DROP TRIGGER IF EXISTS `_tc_{table}_{suffix}`")
+				if r.get('drop', False):
+					continue
+				self.cur.execute(f"""CREATE TABLE IF NOT EXISTS {log} (
+					seq BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+					tbl VARCHAR(255) NOT NULL,
+					pk TEXT NOT NULL,
+					op CHAR(1) NOT NULL,
+					INDEX (tbl, seq)
+				)""")
+				new = f"JSON_ARRAY({','.join(map(lambda x: f'NEW.{x}', key))})"
+				old = f"JSON_ARRAY({','.join(map(lambda x: f'OLD.{x}', key))})"
+				same = ' AND '.join(map(lambda x: f'OLD.{x} <=> NEW.{x}', key))
+				self.cur.execute(f"""CREATE TRIGGER `_tc_{table}_i` AFTER INSERT ON `{table}` FOR EACH ROW
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {new}, 'I')""")
+				self.cur.execute(f"""CREATE TRIGGER `_tc_{table}_u` AFTER UPDATE ON `{table}` FOR EACH ROW BEGIN
+					IF NOT ({same}) THEN INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {old}, 'D'); END IF;
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {new}, 'U');
+				END""")
+				self.cur.execute(f"""CREATE TRIGGER `_tc_{table}_d` AFTER DELETE ON `{table}` FOR EACH ROW
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {old}, 'D')""")
+			return True
+		except BaseException as e:
+			raise e
+	def read_changes_f(self, q, r):
+		"""
+		Read entries of a changelog table in sequence order.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and 'tables' (the tables to read entries for).
+			r (dict): Additional options, including 'after' (read entries with a higher sequence number, default 0) 
+					and 'limit' (the maximum number of entries, default 10000).
+
+		Returns:
+			list: A list of (seq, table, key, op) tuples where key is a JSON array of the key values and op is 
+				'I', 'U' or 'D'.
+		"""
+		try:
+			tables = ','.join(map(lambda x: "'"+str(x).replace("'","''")+"'", q.get('tables',[])))
+			self.cur.execute(f"""SELECT seq, tbl, pk, op FROM {q['log']} WHERE tbl IN ({tables}) AND seq > {int(r.get('after',0))} ORDER BY seq LIMIT {int(r.get('limit',10000))}""")
+			return [tuple(row) for row in self.cur.fetchall()]
+		except BaseException as e:
+			raise e
+	def prune_changes_f(self, q, r):
+		"""
+		Delete consumed entries from a changelog table.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and either 'seq' (the sequence numbers 
+					to delete) or 'upto' (delete all entries up to and including this sequence number).
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			bool: True if the entries were successfully deleted.
+		"""
+		try:
+			if 'upto' in q:
+				self.cur.execute(f"""DELETE FROM {q['log']} WHERE seq <= {int(q['upto'])}""")
+				return True
+			seq = list(map(int, q.get('seq',[])))
+			for i in range(0, len(seq), 1000):
+				self.cur.execute(f"""DELETE FROM {q['log']} WHERE seq IN ({','.join(map(str, seq[i:i+1000]))})""")
+			return True
+		except BaseException as e:
+			raise e
 	def drop_f(self, q, r):
 		"""
 		Execute a DROP TABLE query to remove a specified table from the database.
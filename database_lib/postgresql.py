@@ -1,4 +1,6 @@
 import psycopg2
+import psycopg2.extras
+import io
 import sys
 import os
 import re
@@ -39,6 +41,10 @@ class queryPY(psycopg2.extensions.connection):
 			Return a string representation of the procedure.
 	"""
 
+	MAX_PARAMETERS = 65535
+	PARALLEL_LOAD = True
+	NULLS_FIRST = False
+
 	def __init__(self, data, paramets):
 		"""
 		Initialize a connection to a PostgreSQL database with specified parameters.
@@ -98,6 +104,17 @@ class queryPY(psycopg2.extensions.connection):
 		"""
 		self.close_cur()
 		self.__init__(self.DATA_CONNECT)
+	def clone(self):
+		"""
+		Open a new connection with the same connection data and parameters.
+
+		This function is used by background workers that must not share the cursor state of the 
+		main connection. The new connection is independent and must be closed by the caller.
+
+		Returns:
+			queryPY: A new connection to the same database.
+		"""
+		return queryPY(self.DATA_CONNECT, dict(self.paramets, attempts=0))
 	def is_active(self):
 		"""
 		Check if the database connection is active.
@@ -172,9 +189,24 @@ class queryPY(psycopg2.extensions.connection):
 			"VERSION":self.version_f,
 			"SELECT":self.selection_f,
 			"SELECT_DISTINCT":self.selection_distinct_f,
+			"STREAM":self.stream_f,
+			"JOIN":self.join_f,
 			"INSERT":self.insert_f,
+			"BULK_INSERT":self.bulk_insert_f,
+			"EXECUTE":self.execute_f,
+			"COPY":self.copy_f,
 			"UPDATE":self.update_f,
 			"DELETE":self.delete_f,
+			"UPSERT":self.upsert_f,
+			"UPDATE_MANY":self.update_many_f,
+			"DELETE_KEYS":self.delete_keys_f,
+			"KEY_RANGE":self.key_range_f,
+			"CHANGE_MARKER":self.change_marker_f,
+			"CATALOG":self.catalog_f,
+			"CAPTURE":self.capture_f,
+			"READ_CHANGES":self.read_changes_f,
+			"PRUNE_CHANGES":self.prune_changes_f,
+			"SNAPSHOT":self.snapshot_f,
 			"SHOW_TABLE":self.show_table_f,
 			"SHOW_COLUMNS":self.show_coll_f,
 			"FIELDS":self.show_field_f,
@@ -277,6 +309,65 @@ class queryPY(psycopg2.extensions.connection):
 			self.cur.execute(select)
 			q[tab] = self.cur.fetchall()
 		return q
+	def stream_f(self, q, r):
+		"""
+		Read the rows of a SELECT in batches with a named server-side cursor.
+
+		The rows are read with a cursor of its own, so the result is not held in memory as a whole. 
+		The returned generator must be exhausted or closed before the connection runs other queries.
+
+		Args:
+			q (dict): A dictionary with one table name as key and the list of columns to select as value.
+			r (dict): Additional options, including 'condition' (SQL clauses appended to the query, 
+					e.g. WHERE conditions) and 'size' (the number of rows per batch, default 1000).
+
+		Returns:
+			generator: A generator of lists of row tuples.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		tab, cols = list(q.items())[0]
+		columns = ','.join(map(lambda x: f'{tab}.{x}', cols)) if len(cols)>0 else f'{tab}.*'
+		size = int(r.get('size',1000))
+		def batches():
+			cur = self.cursor(name=f'_tc_stream_{id(self)}')
+			cur.itersize = size
+			try:
+				cur.execute(f"""SELECT {columns} FROM {tab} {r.get('condition','')}""")
+				while True:
+					rows = cur.fetchmany(size)
+					if len(rows)==0:
+						break
+					yield [tuple(row) for row in rows]
+			finally:
+				cur.close()
+				# A named cursor lives in a transaction, which is ended with the stream.
+				self.rollback()
+		return batches()
+	def join_f(self, q, r):
+		"""
+		Execute a SELECT over two tables joined on a common column.
+
+		Args:
+			q (dict): The join, with 'left' and 'right' (the table names), 'on' (the common column), 
+					'how' ('inner', 'left', 'right' or 'outer') and 'columns' (the select expressions).
+			r: Additional SQL clauses to append to the query (e.g., WHERE conditions).
+
+		Returns:
+			list: The joined rows as tuples.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		left, right, on = q['left'], q['right'], q['on']
+		hows = {'inner':'INNER JOIN','left':'LEFT JOIN','right':'RIGHT JOIN','outer':'FULL OUTER JOIN'}
+		self.cur.execute(f"""SELECT {','.join(q['columns'])} FROM {left} {hows[q['how']]} {right} ON {left}.{on}={right}.{on} {r}""")
+		return list(self.cur.fetchall())
 	def insert_f(self,q,r):
 		"""
 		Execute an INSERT query to add new records to the specified tables.
@@ -306,6 +397,91 @@ class queryPY(psycopg2.extensions.connection):
 			return True
 		except BaseException as e:
 			raise e
+	def execute_f(self, q, r):
+		"""
+		Execute SQL statements as they are written, e.g. the statements of a script.
+
+		Args:
+			q (Union[str, list]): A single statement or a list of statements, each without its delimiter.
+			r: Not used.
+
+		Returns:
+			int: The number of rows changed by the statements, as far as the driver reports it.
+
+		Raises:
+			Exception: If an error occurs during the execution of a statement.
+		"""
+		try:
+			count = 0
+			for statement in ([q] if isinstance(q,str) else q):
+				self.cur.execute(statement)
+				count += max(self.cur.rowcount,0)
+			return count
+		except BaseException as e:
+			raise e
+	def bulk_insert_f(self, q, r):
+		"""
+		Execute chunked bulk INSERT statements with bound parameters.
+
+		This function writes the provided rows in chunks that stay within the parameter limit of 
+		the server, using the fastest batch path of the driver. It is the bulk counterpart of the 
+		INSERT method and does not render values into the statement text.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns' and 'values' (a list of rows) for the insert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully inserted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the insert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				psycopg2.extras.execute_values(self.cur,f"""INSERT INTO {table} ({','.join(columns)}) VALUES %s""",values,page_size=chunk)
+			return True
+		except BaseException as e:
+			raise e
+	def copy_f(self, q, r):
+		"""
+		Load rows with COPY FROM STDIN in the CSV format.
+
+		This function is the fastest bulk path of the server. The rows are rendered as CSV in chunks, 
+		with missing values as unquoted empty fields (NULL) and every other value quoted.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns' and 'values' (a list of rows) for the copy operation.
+			r (dict): Additional options, including 'chunk' for the number of rows rendered at a time.
+
+		Returns:
+			bool: True if the rows were successfully copied.
+
+		Raises:
+			Exception: If an error occurs during the execution of the copy.
+		"""
+		def field(x):
+			if x is None:
+				return ''
+			if isinstance(x,(bytes,bytearray,memoryview)):
+				x = '\\x'+bytes(x).hex()
+			return '"'+str(x).replace('"','""')+'"'
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,int(r.get('chunk',10000)))
+				for i in range(0,len(values),chunk):
+					data = io.StringIO(''.join(','.join(map(field,row))+'\n' for row in values[i:i+chunk]))
+					self.cur.copy_expert(f"""COPY {table} ({','.join(columns)}) FROM STDIN WITH (FORMAT csv)""",data)
+			return True
+		except BaseException as e:
+			raise e
 	def update_f(self,q,r):
 		"""
 		Execute an UPDATE query to modify existing records in the specified tables.
@@ -358,6 +534,320 @@ class queryPY(psycopg2.extensions.connection):
 		except BaseException as e:
 			raise e
 		return True
+	def upsert_f(self, q, r):
+		"""
+		Execute chunked INSERT ... ON CONFLICT DO UPDATE statements.
+
+		This function writes the provided rows as multi-row VALUES lists in chunks and lets 
+		PostgreSQL resolve conflicts on the given key columns. Columns listed in 'update_columns' 
+		are overwritten from EXCLUDED; when the list is empty conflicting rows are skipped with 
+		DO NOTHING.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values', 'key' and 'update_columns' for the upsert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully written.
+
+		Raises:
+			Exception: If an error occurs during the execution of the upsert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				update = [f'{c}=EXCLUDED.{c}' for c in cols.get('update_columns',[])]
+				action = f"DO UPDATE SET {','.join(update)}" if len(update)>0 else 'DO NOTHING'
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				upsert = f"""INSERT INTO {table} ({','.join(columns)}) VALUES %s ON CONFLICT ({','.join(key)}) {action}"""
+				psycopg2.extras.execute_values(self.cur,upsert,values,page_size=chunk)
+			return True
+		except BaseException as e:
+			raise e
+	def update_many_f(self, q, r):
+		"""
+		Execute chunked UPDATE ... FROM (VALUES ...) statements with per-row values.
+
+		This function sends each chunk of rows as a VALUES list cast to the column types of the 
+		target table and joins it on the key columns, so rows receive different values in one 
+		statement per chunk instead of one statement per row.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values' and 'key' for the update operation. The key columns are part of 'columns'.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully updated.
+
+		Raises:
+			Exception: If an error occurs during the execution of the update statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				self.cur.execute(f"""SELECT a.attname, format_type(a.atttypid, a.atttypmod) FROM pg_attribute a WHERE a.attrelid = '{table}'::regclass AND a.attnum > 0 AND NOT a.attisdropped;""")
+				types = dict(self.cur.fetchall())
+				chunk = max(1,min(int(r.get('chunk',1000)),self.MAX_PARAMETERS//max(len(columns),1)))
+				template = '('+','.join([f'%s::{types[c]}' for c in columns])+')'
+				on = ' AND '.join([f'{table}.{k}=v.{k}' for k in key])
+				sets = ','.join([f'{c}=v.{c}' for c in columns if c not in key])
+				update = f"""UPDATE {table} SET {sets} FROM (VALUES %s) AS v ({','.join(columns)}) WHERE {on}"""
+				psycopg2.extras.execute_values(self.cur,update,values,template=template,page_size=chunk)
+			return True
+		except BaseException as e:
+			raise e
+	def delete_keys_f(self, q, r):
+		"""
+		Execute chunked DELETE statements for a list of key values.
+
+		This function deletes the rows whose key matches one of the given values with IN lists 
+		sized to stay within the parameter limit of the server. Lists longer than the 'temp' 
+		option are loaded into a temporary table first and removed with a single joined DELETE.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key column names) and 'values' (a list of key rows).
+			r (dict): Additional options, including 'chunk' for the maximum number of keys per statement 
+					and 'temp' for the number of keys above which a temporary table is used.
+
+		Returns:
+			bool: True if the records were successfully deleted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the delete statements.
+		"""
+		try:
+			for table, cols in q.items():
+				key = list(cols.get('key',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,min(int(r.get('chunk') or self.MAX_PARAMETERS),self.MAX_PARAMETERS//len(key)))
+				match = key[0] if len(key)==1 else f"({','.join(key)})"
+				row = '%s' if len(key)==1 else f"({','.join(['%s']*len(key))})"
+				if len(values)>int(r.get('temp',100000)):
+					temp = f'_tc_delete_{table}'
+					self.cur.execute(f"""DROP TABLE IF EXISTS pg_temp.{temp}""")
+					self.cur.execute(f"""CREATE TEMP TABLE {temp} AS SELECT {','.join(key)} FROM {table} WITH NO DATA""")
+					psycopg2.extras.execute_values(self.cur,f"""INSERT INTO {temp} VALUES %s""",values,page_size=chunk)
+					self.cur.execute(f"""DELETE FROM {table} USING {temp} WHERE {' AND '.join([f'{table}.{k}={temp}.{k}' for k in key])}""")
+					self.cur.execute(f"""DROP TABLE {temp}""")
+					continue
+				for i in range(0,len(values),chunk):
+					part = values[i:i+chunk]
+					self.cur.execute(f"""DELETE FROM {table} WHERE {match} IN ({','.join([row]*len(part))})""",[v for val in part for v in val])
+			return True
+		except BaseException as e:
+			raise e
+	def key_range_f(self, q, r):
+		"""
+		Retrieve the lowest and highest value of a key column and the number of rows of a table.
+
+		This function is used to split a table into key ranges that can be loaded over several 
+		connections at once.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are the key column.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary mapping each table name to a (min, max, count) tuple.
+		"""
+		for table, key in q.items():
+			self.cur.execute(f"""SELECT MIN({key}), MAX({key}), COUNT(*) FROM {table}""")
+			q[table] = tuple(self.cur.fetchone())
+		return q
+	def snapshot_f(self, q, r):
+		"""
+		Start a repeatable read transaction that shares one snapshot between connections.
+
+		Without an identifier the snapshot of the new transaction is exported with pg_export_snapshot() 
+		and its identifier is returned. With an identifier the transaction imports that snapshot, so 
+		all connections of a parallel load see exactly the same data. The connection must not auto 
+		commit while the snapshot is in use.
+
+		Args:
+			q: The identifier of an exported snapshot, or None to export a new one.
+			r: Additional parameters for the query. {'release': True} does nothing, the exported 
+			   snapshot stays valid until the transaction of the coordinating connection ends.
+
+		Returns:
+			str: The identifier of the exported snapshot, or None when a snapshot was imported.
+		"""
+		if isinstance(r, dict) and r.get('release', False):
+			return None
+		self.rollback()
+		self.set_session(isolation_level='REPEATABLE READ', readonly=True)
+		if q:
+			self.cur.execute("SET TRANSACTION SNAPSHOT %s", (q,))
+			return None
+		self.cur.execute("SELECT pg_export_snapshot()")
+		return self.cur.fetchone()[0]
+	def change_marker_f(self, q, r):
+		"""
+		Retrieve a cheap change marker for each of the specified tables.
+
+		The marker combines the insert, update and delete counters of pg_stat_user_tables with the 
+		file node of the table, which changes on TRUNCATE and table rewrites. The counters are 
+		reported by the statistics collector and can lag behind the last commit by a moment. They 
+		start again from zero after a crash or pg_stat_reset(), so the reset time of the database 
+		statistics and the server start time are part of the marker, and old counters cannot match 
+		a marker read before. A transaction keeps the statistics it read first, so the snapshot is 
+		cleared before they are read.
+
+		Args:
+			q: A list or tuple containing the names of the tables to check.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary mapping each table name to its change marker, or None if it is unknown.
+		"""
+		tables = list(map(str,q))
+		self.cur.execute("SELECT pg_stat_clear_snapshot()")
+		self.cur.execute("""SELECT s.relname, s.n_tup_ins, s.n_tup_upd, s.n_tup_del, pg_relation_filenode(s.relid), d.stats_reset, pg_postmaster_start_time()
+			FROM pg_stat_user_tables s CROSS JOIN pg_stat_database d
+			WHERE s.schemaname = %s AND d.datname = current_database()""", (self.DATA_CONNECT['schema'],))
+		stats = {row[0]: row[1:] for row in self.cur.fetchall()}
+		return {table: ('|'.join(map(str, stats[table])) if table in stats else None) for table in tables}
+	def catalog_f(self, q, r):
+		"""
+		Retrieve the version, all routines and all triggers of the database in one query.
+
+		The routines are read from pg_proc and the triggers from information_schema.triggers with a 
+		single UNION ALL statement instead of one round trip per database and per table.
+
+		Args:
+			q (str): The name of the database (schema) to query.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary with 'version', 'procedures' and 'functions' (name -> list of parameters, 
+				as SHOW_PROCEDURE and SHOW_FUNCTION return them) and 'triggers' (table -> trigger name -> 
+				dictionary with 'time' and 'event', as SHOW_TRIGGER returns them).
+
+		Raises:
+			Exception: If an error occurs during the execution of the query.
+		"""
+		try:
+			schema = self.DATA_CONNECT['schema']
+			self.cur.execute(f"""SELECT 'VERSION'::text, NULL::text, VERSION()::text, NULL::text, NULL::text
+				UNION ALL SELECT CASE p.prokind WHEN 'p' THEN 'PROCEDURE' ELSE 'FUNCTION' END, NULL, p.proname::text, pg_get_function_arguments(p.oid)::text, NULL
+					FROM pg_proc p JOIN pg_namespace n ON p.pronamespace = n.oid WHERE n.nspname = '{schema}' AND p.prokind IN ('p', 'f')
+				UNION ALL SELECT 'TRIGGER', event_object_table::text, trigger_name::text, action_timing::text, event_manipulation::text
+					FROM information_schema.triggers WHERE trigger_schema = '{schema}';""")
+			data = {'version': None, 'procedures': {}, 'functions': {}, 'triggers': {}}
+			for kind, table, name, first, second in self.cur.fetchall():
+				if kind == 'VERSION':
+					data['version'] = name
+				elif kind == 'TRIGGER':
+					data['triggers'].setdefault(table, {})[name] = {'time': first, 'event': second}
+				else:
+					data['procedures' if kind == 'PROCEDURE' else 'functions'].setdefault(name, []).append(first)
+			return data
+		except BaseException as e:
+			raise e
+	def capture_f(self, q, r):
+		"""
+		Install or remove the change capture triggers of tables.
+
+		The triggers append (table, key, op, seq) rows to a compact changelog table that is created if 
+		it does not exist. One PL/pgSQL trigger function per changelog serves all tables; the key columns 
+		are passed as trigger arguments. An update that changes the key is logged as a delete of the old 
+		key followed by an update of the new one.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key columns) and 'log' (the name of the changelog table).
+			r (dict): Additional options, including 'drop' to remove the triggers instead of installing them.
+
+		Returns:
+			bool: True if the triggers were successfully installed or removed.
+
+		Raises:
+			Exception: If an error occurs during the execution of the statements.
+		"""
+		try:
+			schema = self.DATA_CONNECT['schema']
+			for table, cols in q.items():
+				key, log = list(cols['key']), cols['log']
+				self.cur.execute(f"DROP TRIGGER IF EXISTS _tc_{table}_capture ON {schema}.{table}")
+				if r.get('drop', False):
+					continue
+				self.cur.execute(f"""CREATE TABLE IF NOT EXISTS {schema}.{log} (
+					seq BIGSERIAL PRIMARY KEY,
+					tbl TEXT NOT NULL,
+					pk TEXT NOT NULL,
+					op CHAR(1) NOT NULL
+				)""")
+				self.cur.execute(f"CREATE INDEX IF NOT EXISTS {log}_tbl_seq ON {schema}.{log} (tbl, seq)")
+				self.cur.execute(f"""CREATE OR REPLACE FUNCTION {schema}.{log}_capture() RETURNS trigger AS $$
+				DECLARE
+					new_key jsonb := '[]'::jsonb;
+					old_key jsonb := '[]'::jsonb;
+				BEGIN
+					FOR i IN 0..TG_NARGS-1 LOOP
+						IF TG_OP <> 'INSERT' THEN old_key := old_key || jsonb_build_array(to_jsonb(OLD) -> TG_ARGV[i]); END IF;
+						IF TG_OP <> 'DELETE' THEN new_key := new_key || jsonb_build_array(to_jsonb(NEW) -> TG_ARGV[i]); END IF;
+					END LOOP;
+					IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND old_key IS DISTINCT FROM new_key) THEN
+						INSERT INTO {schema}.{log} (tbl, pk, op) VALUES (TG_TABLE_NAME, old_key::text, 'D');
+					END IF;
+					IF TG_OP <> 'DELETE' THEN
+						INSERT INTO {schema}.{log} (tbl, pk, op) VALUES (TG_TABLE_NAME, new_key::text, left(TG_OP, 1));
+					END IF;
+					RETURN NULL;
+				END
+				$$ LANGUAGE plpgsql""")
+				self.cur.execute(f"""CREATE TRIGGER _tc_{table}_capture AFTER INSERT OR UPDATE OR DELETE ON {schema}.{table}
+					FOR EACH ROW EXECUTE PROCEDURE {schema}.{log}_capture({','.join(map(lambda x: f"'{x}'", key))})""")
+			return True
+		except BaseException as e:
+			raise e
+	def read_changes_f(self, q, r):
+		"""
+		Read entries of a changelog table in sequence order.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and 'tables' (the tables to read entries for).
+			r (dict): Additional options, including 'after' (read entries with a higher sequence number, default 0) 
+					and 'limit' (the maximum number of entries, default 10000).
+
+		Returns:
+			list: A list of (seq, table, key, op) tuples where key is a JSON array of the key values and op is 
+				'I', 'U' or 'D'.
+		"""
+		try:
+			tables = ','.join(map(lambda x: "'"+str(x).replace("'","''")+"'", q.get('tables',[])))
+			self.cur.execute(f"""SELECT seq, tbl, pk, op FROM {self.DATA_CONNECT['schema']}.{q['log']} WHERE tbl IN ({tables}) AND seq > {int(r.get('after',0))} ORDER BY seq LIMIT {int(r.get('limit',10000))}""")
+			return [tuple(row) for row in self.cur.fetchall()]
+		except BaseException as e:
+			raise e
+	def prune_changes_f(self, q, r):
+		"""
+		Delete consumed entries from a changelog table.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and either 'seq' (the sequence numbers 
+					to delete) or 'upto' (delete all entries up to and including this sequence number).
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			bool: True if the entries were successfully deleted.
+		"""
+		try:
+			if 'upto' in q:
+				self.cur.execute(f"""DELETE FROM {self.DATA_CONNECT['schema']}.{q['log']} WHERE seq <= {int(q['upto'])}""")
+				return True
+			seq = list(map(int, q.get('seq',[])))
+			for i in range(0, len(seq), 1000):
+				self.cur.execute(f"""DELETE FROM {self.DATA_CONNECT['schema']}.{q['log']} WHERE seq IN ({','.join(map(str, seq[i:i+1000]))})""")
+			return True
+		except BaseException as e:
+			raise e
 	def drop_f(self,q,r):
 		"""
 		Execute a DROP TABLE query to remove a specified table from the database.
@@ -416,11 +906,16 @@ class queryPY(psycopg2.extensions.connection):
 			Exception: If the provided table name is invalid or if there is an error during the query execution.
 		"""
 		ex = list(map(str,q))
-		show = f"""SELECT c.column_name, c.data_type AS column_type, c.is_nullable, c.column_default, k.constraint_name AS column_key 
+		show = f"""SELECT c.column_name, c.data_type AS column_type, c.is_nullable, c.column_default,
+				CASE WHEN EXISTS (
+					SELECT 1 FROM information_schema.table_constraints t
+						JOIN information_schema.key_column_usage k
+							ON t.constraint_name = k.constraint_name AND t.table_schema = k.table_schema AND t.table_name = k.table_name
+					WHERE t.constraint_type = 'PRIMARY KEY' AND k.table_schema = c.table_schema AND k.table_name = c.table_name AND k.column_name = c.column_name
+				) THEN 'PRI' ELSE '' END AS column_key
 			FROM information_schema.columns c
-				LEFT JOIN information_schema.key_column_usage k
-					ON c.column_name = k.column_name AND c.table_name = k.table_name
-			WHERE c.table_name = '{ex[0]}';"""
+			WHERE c.table_name = '{ex[0]}' AND c.table_schema = '{self.DATA_CONNECT['schema']}'
+			ORDER BY c.ordinal_position;"""
 		self.cur.execute(show)
 		result = list(self.cur.fetchall())
 		for i, elm in enumerate(result):
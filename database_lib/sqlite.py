@@ -38,6 +38,11 @@ class queryPY(sqlite3.Connection):
 		__str__() -> str:
 			Return a string representation of the procedure.
 	"""
+
+	MAX_PARAMETERS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+	PARALLEL_LOAD = False
+	NULLS_FIRST = True
+
 	def __init__(self, data, paramets):
 		"""
 		Initialize a connection to a SQLite database with specified parameters.
@@ -63,7 +68,7 @@ class queryPY(sqlite3.Connection):
 		self.DB_NAME_ORG = ".".join(data["dbFile"].split(os.sep)[-1].split('.')[:-1])
 		self.DB_NAME = "".join("_".join(data["dbFile"].split(os.sep)[-2:]).replace(" ","").split(".")[:-1])
 		try:
-			super(queryPY,self).__init__(data["dbFile"])
+			super(queryPY,self).__init__(data["dbFile"],check_same_thread=data.get("check_same_thread",True))
 			self.version = lambda : self.query_f("VERSION")
 		except BaseException as e:
 			self.close()
@@ -96,6 +101,17 @@ class queryPY(sqlite3.Connection):
 		"""
 		self.close_cur()
 		self.__init__(self.DATA_CONNECT,self.paramets)
+	def clone(self):
+		"""
+		Open a new connection with the same connection data and parameters.
+
+		This function is used by background workers that must not share the cursor state of the 
+		main connection. The new connection is independent and must be closed by the caller.
+
+		Returns:
+			queryPY: A new connection to the same database.
+		"""
+		return queryPY(dict(self.DATA_CONNECT, check_same_thread=False), dict(self.paramets, attempts=0))
 	def is_active(self):
 		"""
 		Check if the database connection is active.
@@ -164,9 +180,22 @@ class queryPY(sqlite3.Connection):
 			"VERSION":self.version_f,
 			"SELECT":self.selection_f,
 			"SELECT_DISTINCT":self.selection_distinct_f,
+			"STREAM":self.stream_f,
+			"JOIN":self.join_f,
 			"INSERT":self.insert_f,
+			"BULK_INSERT":self.bulk_insert_f,
+			"EXECUTE":self.execute_f,
 			"UPDATE":self.update_f,
 			"DELETE":self.delete_f,
+			"UPSERT":self.upsert_f,
+			"UPDATE_MANY":self.update_many_f,
+			"DELETE_KEYS":self.delete_keys_f,
+			"KEY_RANGE":self.key_range_f,
+			"CHANGE_MARKER":self.change_marker_f,
+			"CATALOG":self.catalog_f,
+			"CAPTURE":self.capture_f,
+			"READ_CHANGES":self.read_changes_f,
+			"PRUNE_CHANGES":self.prune_changes_f,
 			"DROP":self.drop_f,
 			"SHOW_TABLE":self.show_table_f,
 			"SHOW_COLUMNS":self.show_coll_f,
@@ -259,6 +288,67 @@ class queryPY(sqlite3.Connection):
 			self.cur.execute(select)
 			q[tab] = self.cur.fetchall()
 		return q
+	def stream_f(self, q, r):
+		"""
+		Read the rows of a SELECT in batches.
+
+		The rows are read with a cursor of its own, so the result is not held in memory as a whole. 
+		The returned generator must be exhausted or closed before the connection runs other queries.
+
+		Args:
+			q (dict): A dictionary with one table name as key and the list of columns to select as value.
+			r (dict): Additional options, including 'condition' (SQL clauses appended to the query, 
+					e.g. WHERE conditions) and 'size' (the number of rows per batch, default 1000).
+
+		Returns:
+			generator: A generator of lists of row tuples.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		tab, cols = list(q.items())[0]
+		columns = ','.join(map(lambda x: f'{tab}.{x}', cols)) if len(cols)>0 else f'{tab}.*'
+		size = int(r.get('size',1000))
+		def batches():
+			cur = self.cursor()
+			try:
+				cur.execute(f"""SELECT {columns} FROM {tab} {r.get('condition','')}""")
+				while True:
+					rows = cur.fetchmany(size)
+					if len(rows)==0:
+						break
+					yield [tuple(row) for row in rows]
+			finally:
+				cur.close()
+		return batches()
+	def join_f(self, q, r):
+		"""
+		Execute a SELECT over two tables joined on a common column.
+
+		RIGHT and FULL joins need SQLite 3.39 or newer; with an older library None is returned 
+		for them and the caller joins the tables itself.
+
+		Args:
+			q (dict): The join, with 'left' and 'right' (the table names), 'on' (the common column), 
+					'how' ('inner', 'left', 'right' or 'outer') and 'columns' (the select expressions).
+			r: Additional SQL clauses to append to the query (e.g., WHERE conditions).
+
+		Returns:
+			list: The joined rows as tuples, or None if the join cannot be run by the database.
+
+		Raises:
+			Exception: If the provided query parameter is not a dictionary.
+		"""
+		if not isinstance(q,dict):
+			raise ValueError('Data type must be dictionary')
+		left, right, on = q['left'], q['right'], q['on']
+		hows = {'inner':'INNER JOIN','left':'LEFT JOIN','right':'RIGHT JOIN','outer':'FULL OUTER JOIN'}
+		if q['how'] in ('right','outer') and sqlite3.sqlite_version_info < (3, 39, 0):
+			return None
+		self.cur.execute(f"""SELECT {','.join(q['columns'])} FROM {left} {hows[q['how']]} {right} ON {left}.{on}={right}.{on} {r}""")
+		return list(self.cur.fetchall())
 	def insert_f(self,q,r):
 		"""
 		Execute an INSERT query to add new records to the specified tables.
@@ -288,6 +378,58 @@ class queryPY(sqlite3.Connection):
 			return True
 		except BaseException as e:
 			raise e
+	def execute_f(self, q, r):
+		"""
+		Execute SQL statements as they are written, e.g. the statements of a script.
+
+		Args:
+			q (Union[str, list]): A single statement or a list of statements, each without its delimiter.
+			r: Not used.
+
+		Returns:
+			int: The number of rows changed by the statements, as far as the driver reports it.
+
+		Raises:
+			Exception: If an error occurs during the execution of a statement.
+		"""
+		try:
+			count = 0
+			for statement in ([q] if isinstance(q,str) else q):
+				self.cur.execute(statement)
+				count += max(self.cur.rowcount,0)
+			return count
+		except BaseException as e:
+			raise e
+	def bulk_insert_f(self, q, r):
+		"""
+		Execute chunked bulk INSERT statements with bound parameters.
+
+		This function writes the provided rows in chunks that stay within the parameter limit of 
+		the server, using the fastest batch path of the driver. It is the bulk counterpart of the 
+		INSERT method and does not render values into the statement text.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns' and 'values' (a list of rows) for the insert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per statement.
+
+		Returns:
+			bool: True if the rows were successfully inserted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the insert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,int(r.get('chunk',1000)))
+				insert = f"""INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join(['?']*len(columns))})"""
+				for i in range(0,len(values),chunk):
+					self.cur.executemany(insert,values[i:i+chunk])
+			return True
+		except BaseException as e:
+			raise e
 	def update_f(self,q,r):
 		"""
 		Execute an UPDATE query to modify existing records in the specified tables.
@@ -340,6 +482,293 @@ class queryPY(sqlite3.Connection):
 		except BaseException as e:
 			raise e
 		return True
+	def upsert_f(self, q, r):
+		"""
+		Execute INSERT ... ON CONFLICT DO UPDATE statements inside the current transaction.
+
+		This function writes the provided rows with executemany in chunks and lets SQLite resolve 
+		conflicts on the given key columns, which must be covered by a primary key or unique index. 
+		Columns listed in 'update_columns' are overwritten from excluded; when the list is empty 
+		conflicting rows are skipped with DO NOTHING. Requires SQLite 3.24 or newer.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values', 'key' and 'update_columns' for the upsert operation.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per batch.
+
+		Returns:
+			bool: True if the rows were successfully written.
+
+		Raises:
+			Exception: If an error occurs during the execution of the upsert statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				update = [f'{c}=excluded.{c}' for c in cols.get('update_columns',[])]
+				action = f"DO UPDATE SET {','.join(update)}" if len(update)>0 else 'DO NOTHING'
+				chunk = max(1,int(r.get('chunk',1000)))
+				upsert = f"""INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join(['?']*len(columns))}) ON CONFLICT ({','.join(key)}) {action}"""
+				for i in range(0,len(values),chunk):
+					self.cur.executemany(upsert,values[i:i+chunk])
+			return True
+		except BaseException as e:
+			raise e
+	def update_many_f(self, q, r):
+		"""
+		Execute an UPDATE joined to a temporary table of per-row values.
+
+		This function loads the rows into a temporary table keyed by the key columns in chunks 
+		and updates the target table from it in one statement. UPDATE ... FROM is used on 
+		SQLite 3.33 and newer, correlated subqueries over the indexed temporary table otherwise.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'columns', 'values' and 'key' for the update operation. The key columns are part of 'columns'.
+			r (dict): Additional options, including 'chunk' for the maximum number of rows per batch.
+
+		Returns:
+			bool: True if the rows were successfully updated.
+
+		Raises:
+			Exception: If an error occurs during the execution of the update statements.
+		"""
+		try:
+			for table, cols in q.items():
+				columns = list(cols.get('columns',[]))
+				values = list(cols.get('values',[]))
+				key = list(cols.get('key',[]))
+				chunk = max(1,int(r.get('chunk',1000)))
+				temp = f'_tc_update_{table}'
+				on = ' AND '.join([f'v.{k}={table}.{k}' for k in key])
+				self.cur.execute(f"""DROP TABLE IF EXISTS temp.{temp}""")
+				self.cur.execute(f"""CREATE TEMP TABLE {temp} ({','.join(columns)}, PRIMARY KEY ({','.join(key)}))""")
+				for i in range(0,len(values),chunk):
+					self.cur.executemany(f"""INSERT OR REPLACE INTO {temp} VALUES ({','.join(['?']*len(columns))})""",values[i:i+chunk])
+				if sqlite3.sqlite_version_info >= (3, 33, 0):
+					sets = ','.join([f'{c}=v.{c}' for c in columns if c not in key])
+					self.cur.execute(f"""UPDATE {table} SET {sets} FROM {temp} AS v WHERE {on}""")
+				else:
+					sets = ','.join([f'{c}=(SELECT v.{c} FROM {temp} AS v WHERE {on})' for c in columns if c not in key])
+					self.cur.execute(f"""UPDATE {table} SET {sets} WHERE EXISTS (SELECT 1 FROM {temp} AS v WHERE {on})""")
+				self.cur.execute(f"""DROP TABLE temp.{temp}""")
+			return True
+		except BaseException as e:
+			raise e
+	def delete_keys_f(self, q, r):
+		"""
+		Execute chunked DELETE statements for a list of key values.
+
+		This function deletes the rows whose key matches one of the given values with IN lists 
+		sized to stay within the parameter limit of the server. Lists longer than the 'temp' 
+		option are loaded into a temporary table first and removed with a single joined DELETE.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key column names) and 'values' (a list of key rows).
+			r (dict): Additional options, including 'chunk' for the maximum number of keys per statement 
+					and 'temp' for the number of keys above which a temporary table is used.
+
+		Returns:
+			bool: True if the records were successfully deleted.
+
+		Raises:
+			Exception: If an error occurs during the execution of the delete statements.
+		"""
+		try:
+			for table, cols in q.items():
+				key = list(cols.get('key',[]))
+				values = list(cols.get('values',[]))
+				chunk = max(1,min(int(r.get('chunk') or self.MAX_PARAMETERS),self.MAX_PARAMETERS//len(key)))
+				match = key[0] if len(key)==1 else f"({','.join(key)})"
+				row = '?' if len(key)==1 else f"({','.join(['?']*len(key))})"
+				if len(values)>int(r.get('temp',100000)):
+					temp = f'_tc_delete_{table}'
+					self.cur.execute(f"""DROP TABLE IF EXISTS temp.{temp}""")
+					self.cur.execute(f"""CREATE TEMP TABLE {temp} ({','.join(key)}, PRIMARY KEY ({','.join(key)}))""")
+					for i in range(0,len(values),chunk):
+						self.cur.executemany(f"""INSERT OR IGNORE INTO {temp} VALUES ({','.join(['?']*len(key))})""",values[i:i+chunk])
+					self.cur.execute(f"""DELETE FROM {table} WHERE {match} IN (SELECT {','.join(key)} FROM {temp})""")
+					self.cur.execute(f"""DROP TABLE temp.{temp}""")
+					continue
+				for i in range(0,len(values),chunk):
+					part = values[i:i+chunk]
+					self.cur.execute(f"""DELETE FROM {table} WHERE {match} IN ({','.join([row]*len(part))})""",[v for val in part for v in val])
+			return True
+		except BaseException as e:
+			raise e
+	def key_range_f(self, q, r):
+		"""
+		Retrieve the lowest and highest value of a key column and the number of rows of a table.
+
+		This function is used to split a table into key ranges that can be loaded over several 
+		connections at once.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are the key column.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary mapping each table name to a (min, max, count) tuple.
+		"""
+		for table, key in q.items():
+			self.cur.execute(f"""SELECT MIN({key}), MAX({key}), COUNT(*) FROM {table}""")
+			q[table] = tuple(self.cur.fetchone())
+		return q
+	def change_marker_f(self, q, r):
+		"""
+		Retrieve a cheap change marker for the specified tables.
+
+		SQLite has no per-table statistics, so every table receives the marker of the whole database 
+		file: the file change counter from the database header together with the size and 
+		modification time of the database and its WAL file. PRAGMA data_version is added when the 
+		marker is only compared within the same connection ('session' in r).
+
+		Args:
+			q: A list or tuple containing the names of the tables to check.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary mapping each table name to its change marker, or None if it is unknown.
+		"""
+		path = self.DATA_CONNECT['dbFile']
+		if not os.path.isfile(path):
+			return {table: None for table in map(str,q)}
+		with open(path, 'rb') as file:
+			header = file.read(28)
+		marker = [int.from_bytes(header[24:28], 'big') if len(header) >= 28 else 0]
+		for file in (path, path + '-wal'):
+			stat = os.stat(file) if os.path.isfile(file) else None
+			marker.extend([stat.st_size, stat.st_mtime_ns] if stat is not None else [0, 0])
+		if isinstance(r, dict) and r.get('session', False):
+			self.cur.execute("PRAGMA data_version")
+			marker.append(self.cur.fetchone()[0])
+		marker = '|'.join(map(str, marker))
+		return {table: marker for table in map(str,q)}
+	def catalog_f(self, q, r):
+		"""
+		Retrieve the version, all routines and all triggers of the database in one query.
+
+		SQLite has no stored routines; the triggers are read from sqlite_master in one statement and 
+		their timing and event are taken from the trigger definition.
+
+		Args:
+			q (str): The name of the database (schema) to query.
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			dict: A dictionary with 'version', 'procedures' and 'functions' (name -> list of parameters, 
+				as SHOW_PROCEDURE and SHOW_FUNCTION return them) and 'triggers' (table -> trigger name -> 
+				dictionary with 'time' and 'event', as SHOW_TRIGGER returns them).
+
+		Raises:
+			Exception: If an error occurs during the execution of the query.
+		"""
+		try:
+			self.cur.execute("SELECT sqlite_version()")
+			data = {'version': self.cur.fetchone()[0], 'procedures': {}, 'functions': {}, 'triggers': {}}
+			self.cur.execute("SELECT tbl_name, name, sql FROM sqlite_master WHERE type = 'trigger'")
+			for table, name, sql in self.cur.fetchall():
+				match = re.search(r'\b(BEFORE|AFTER|INSTEAD\s+OF)?\s*(INSERT|UPDATE|DELETE)\s+(OF\b.*?\s+)?ON\b', sql or '', re.IGNORECASE | re.DOTALL)
+				data['triggers'].setdefault(table, {})[name] = {
+					'time': (match.group(1) or 'BEFORE').upper() if match else None,
+					'event': match.group(2).upper() if match else None
+				}
+			return data
+		except BaseException as e:
+			raise e
+	def capture_f(self, q, r):
+		"""
+		Install or remove the change capture triggers of tables.
+
+		The triggers append (table, key, op, seq) rows to a compact changelog table that is created if 
+		it does not exist, using the SQLite trigger syntax and json_array() for the key. An update that 
+		changes the key is logged as a delete of the old key followed by an update of the new one.
+
+		Args:
+			q (dict): A dictionary where keys are table names and values are dictionaries containing 
+					'key' (the key columns) and 'log' (the name of the changelog table).
+			r (dict): Additional options, including 'drop' to remove the triggers instead of installing them.
+
+		Returns:
+			bool: True if the triggers were successfully installed or removed.
+
+		Raises:
+			Exception: If an error occurs during the execution of the statements.
+		"""
+		try:
+			for table, cols in q.items():
+				key, log = list(cols['key']), cols['log']
+				for suffix in ('i', 'u', 'd'):
+					self.cur.execute(f"DROP TRIGGER IF EXISTS _tc_{table}_{suffix}")
+				if r.get('drop', False):
+					continue
+				self.cur.execute(f"""CREATE TABLE IF NOT EXISTS {log} (
+					seq INTEGER PRIMARY KEY AUTOINCREMENT,
+					tbl TEXT NOT NULL,
+					pk TEXT NOT NULL,
+					op TEXT NOT NULL
+				)""")
+				self.cur.execute(f"CREATE INDEX IF NOT EXISTS {log}_tbl_seq ON {log} (tbl, seq)")
+				new = f"json_array({','.join(map(lambda x: f'NEW.{x}', key))})"
+				old = f"json_array({','.join(map(lambda x: f'OLD.{x}', key))})"
+				same = ' AND '.join(map(lambda x: f'OLD.{x} IS NEW.{x}', key))
+				self.cur.execute(f"""CREATE TRIGGER _tc_{table}_i AFTER INSERT ON {table} BEGIN
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {new}, 'I');
+				END""")
+				self.cur.execute(f"""CREATE TRIGGER _tc_{table}_u AFTER UPDATE ON {table} BEGIN
+					INSERT INTO {log} (tbl, pk, op) SELECT '{table}', {old}, 'D' WHERE NOT ({same});
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {new}, 'U');
+				END""")
+				self.cur.execute(f"""CREATE TRIGGER _tc_{table}_d AFTER DELETE ON {table} BEGIN
+					INSERT INTO {log} (tbl, pk, op) VALUES ('{table}', {old}, 'D');
+				END""")
+			return True
+		except BaseException as e:
+			raise e
+	def read_changes_f(self, q, r):
+		"""
+		Read entries of a changelog table in sequence order.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and 'tables' (the tables to read entries for).
+			r (dict): Additional options, including 'after' (read entries with a higher sequence number, default 0) 
+					and 'limit' (the maximum number of entries, default 10000).
+
+		Returns:
+			list: A list of (seq, table, key, op) tuples where key is a JSON array of the key values and op is 
+				'I', 'U' or 'D'.
+		"""
+		try:
+			tables = ','.join(map(lambda x: "'"+str(x).replace("'","''")+"'", q.get('tables',[])))
+			self.cur.execute(f"""SELECT seq, tbl, pk, op FROM {q['log']} WHERE tbl IN ({tables}) AND seq > {int(r.get('after',0))} ORDER BY seq LIMIT {int(r.get('limit',10000))}""")
+			return [tuple(row) for row in self.cur.fetchall()]
+		except BaseException as e:
+			raise e
+	def prune_changes_f(self, q, r):
+		"""
+		Delete consumed entries from a changelog table.
+
+		Args:
+			q (dict): A dictionary containing 'log' (the changelog table) and either 'seq' (the sequence numbers 
+					to delete) or 'upto' (delete all entries up to and including this sequence number).
+			r: Additional parameters for the query, not used in this function.
+
+		Returns:
+			bool: True if the entries were successfully deleted.
+		"""
+		try:
+			if 'upto' in q:
+				self.cur.execute(f"""DELETE FROM {q['log']} WHERE seq <= {int(q['upto'])}""")
+				return True
+			seq = list(map(int, q.get('seq',[])))
+			for i in range(0, len(seq), 1000):
+				self.cur.execute(f"""DELETE FROM {q['log']} WHERE seq IN ({','.join(map(str, seq[i:i+1000]))})""")
+			return True
+		except BaseException as e:
+			raise e
 	def drop_f(self,q,r):
 		"""
 		Execute a DROP TABLE query to remove a specified table from the database.
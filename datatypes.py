@@ -939,6 +939,129 @@ class DataTypes:
 		if self.__TC_DATANAME__.lower() in ['mysql']:
 			return 'SET'
 
+	# Преобразование типов
+
+	__FAMILIES__ = {
+		'BOOL':'bool', 'BOOLEAN':'bool',
+		'TINYINT':'tinyint', 'BIT':'tinyint',
+		'SMALLINT':'smallint', 'INT2':'smallint', 'SMALLSERIAL':'smallint',
+		'MEDIUMINT':'int', 'INT':'int', 'INTEGER':'int', 'INT4':'int', 'SERIAL':'int',
+		'BIGINT':'bigint', 'INT8':'bigint', 'BIGSERIAL':'bigint',
+		'REAL':'float', 'FLOAT':'float', 'FLOAT4':'float',
+		'DOUBLE':'double', 'DOUBLE PRECISION':'double', 'FLOAT8':'double',
+		'DECIMAL':'decimal', 'NUMERIC':'decimal',
+		'CHAR':'char', 'CHARACTER':'char', 'NCHAR':'char', 'BPCHAR':'char',
+		'VARCHAR':'varchar', 'CHARACTER VARYING':'varchar', 'NVARCHAR':'varchar', 'STRING':'varchar',
+		'TINYTEXT':'text', 'TEXT':'text', 'MEDIUMTEXT':'text', 'LONGTEXT':'text', 'CLOB':'text',
+		'ENUM':'text', 'SET':'text', 'UUID':'text',
+		'JSON':'json', 'JSONB':'json',
+		'DATE':'date',
+		'TIME':'time', 'TIME WITHOUT TIME ZONE':'time', 'TIME WITH TIME ZONE':'time', 'TIMETZ':'time',
+		'DATETIME':'datetime', 'TIMESTAMP':'datetime', 'TIMESTAMP WITHOUT TIME ZONE':'datetime', 'TIMESTAMP WITH TIME ZONE':'datetime', 'TIMESTAMPTZ':'datetime',
+		'YEAR':'year', 'INTERVAL':'interval',
+		'TINYBLOB':'blob', 'BLOB':'blob', 'MEDIUMBLOB':'blob', 'LONGBLOB':'blob', 'BYTEA':'blob', 'BINARY':'blob', 'VARBINARY':'blob'
+	}
+
+	__CANDIDATES__ = {
+		'bool':['BOOL'],
+		'tinyint':['TINYINT', 'SMALLINT', 'INTEGER'],
+		'smallint':['SMALLINT', 'INTEGER'],
+		'int':['INTEGER', 'INT'],
+		'bigint':['BIGINT', 'INTEGER'],
+		'float':['FLOAT'],
+		'double':['DOUBLE'],
+		'decimal':['NUMERIC', 'DECIMAL'],
+		'char':['CHAR', 'TEXT'],
+		'varchar':['VARCHAR', 'TEXT'],
+		'text':['LONGTEXT', 'TEXT'],
+		'json':['JSON', 'TEXT'],
+		'date':['DATE'],
+		'time':['TIME'],
+		'datetime':['DATETIME', 'TIMESTAMP'],
+		'year':['YEAR', 'INTEGER', 'INT'],
+		'interval':['INTERVAL', 'TEXT'],
+		'blob':['BYTEA', 'MEDIUMBLOB', 'BLOB']
+	}
+
+	def __parse__(self, source: str) -> tuple:
+		"""
+		Split a column type into its upper-case name and its integer arguments.
+		"""
+		match = re.match(r'^\s*([A-Za-z][A-Za-z0-9 ]*?)\s*(?:\(([^)]*)\))?\s*(?:UNSIGNED|ZEROFILL|\[\])*\s*$', str(source or ''), re.I)
+		name = match.group(1).upper() if match else str(source or '').upper()
+		args = [int(x) for x in match.group(2).split(',') if x.strip().isdigit()] if match and match.group(2) else []
+		return name, args
+
+	def family(self, source: str) -> str:
+		"""
+		Return the family of a column type reported by any supported DBMS.
+
+		Args:
+			source (str): The column type, e.g. 'INT(11)', 'CHARACTER VARYING' or 'NUMERIC(10,2)'.
+
+		Returns:
+			str: One of 'bool', 'tinyint', 'smallint', 'int', 'bigint', 'float', 'double', 'decimal', 'char', 
+				'varchar', 'text', 'json', 'date', 'time', 'datetime', 'year', 'interval' and 'blob'.
+		"""
+		name, args = self.__parse__(source)
+		family = self.__FAMILIES__.get(name)
+		if name in ['TINYINT', 'BIT'] and args == [1]:
+			family = 'bool'
+		elif family is None:
+			if 'INT' in name:
+				family = 'int'
+			elif any(x in name for x in ['CHAR', 'CLOB', 'TEXT']):
+				family = 'text'
+			elif 'BLOB' in name:
+				family = 'blob'
+			elif any(x in name for x in ['REAL', 'FLOA', 'DOUB']):
+				family = 'double'
+			else:
+				family = 'text'
+		# An unsigned integer needs the next larger signed type.
+		if family in ['smallint', 'int'] and 'UNSIGNED' in str(source).upper():
+			family = {'smallint':'int', 'int':'bigint'}[family]
+		return family
+
+	def convert(self, source: str, primary: bool = False) -> str:
+		"""
+		Map a column type reported by any supported DBMS to the data type of this database.
+
+		The type name is reduced to a family (integer, decimal, character, date and so on), and the 
+		methods of this class for that family are tried in order until one is supported by this 
+		database. Length, precision and scale are kept where the target type takes them. Unknown 
+		names are mapped by the SQLite affinity rules, and anything else becomes TEXT. Times and 
+		timestamps with a time zone keep it on PostgreSQL, the only supported DBMS with such types.
+
+		Args:
+			source (str): The column type, e.g. 'INT(11)', 'CHARACTER VARYING' or 'NUMERIC(10,2)'.
+			primary (bool, optional): If True, the column is a key column. MySQL cannot index TEXT, 
+									  so a text key becomes VARCHAR(255). Defaults to False.
+
+		Returns:
+			str: The SQL representation of the data type.
+		"""
+		name, args = self.__parse__(source)
+		family = self.family(source)
+		if name in ['TIMESTAMP WITH TIME ZONE', 'TIMESTAMPTZ', 'TIME WITH TIME ZONE', 'TIMETZ'] and self.__TC_DATANAME__.lower() in ['postgresql']:
+			return 'TIMESTAMPTZ' if family == 'datetime' else 'TIMETZ'
+		candidates = list(self.__CANDIDATES__[family])
+		# PostgreSQL has no DATETIME type.
+		if family == 'datetime' and self.__TC_DATANAME__.lower() in ['postgresql']:
+			candidates.reverse()
+		for candidate in candidates:
+			sized = family in ['decimal', 'char', 'varchar'] and len(args) > 0
+			try:
+				result = getattr(self, candidate)(*args[:2]) if sized and candidate not in ['TEXT'] else getattr(self, candidate)()
+			except TypeError:
+				continue
+			if result is None:
+				continue
+			if primary and result in ['TEXT', 'LONGTEXT'] and self.__TC_DATANAME__.lower() in ['mysql']:
+				return self.VARCHAR(255)
+			return result
+		return self.TEXT() or 'TEXT'
+
 class CollationMappings:
 	"""
 	A class to define and manage collation mappings for various database character sets.
@@ -0,0 +1,273 @@
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from decimal import Decimal
+from pandas import DataFrame
+from .condition import QueryException, Join
+
+class HashJoin:
+	"""
+	A class representing a streaming hash join of two tables, also across databases and DBMS.
+
+	Both tables are read from their databases with Items.stream rather than from the mirrors. The
+	rows of the build side, by default the smaller table, are collected into a hash table; the rows
+	of the probe side are then streamed through it batch by batch, so only the build side and one
+	probe batch are held in memory. When the build side exceeds the memory budget, both sides are
+	hash-partitioned on the join column into spill files and joined partition by partition (grace
+	hash join); a partition is expected to fit into memory once it is loaded.
+	As in SQL, rows with a NULL key never match; outer joins keep them as unmatched rows.
+
+	If the join drops the unmatched rows of the probe side, the distinct keys of the build side are
+	pushed down as 'IN (...)' filters of the probe stream, in chunks of up to 1000 keys, as long as
+	there are at most 'max_keys' of them. Otherwise the whole probe table is streamed.
+
+	Args:
+		join (Join): The tables, the join column, the type of join and the NaN option.
+		memory (int, optional): The memory budget of the build side in bytes. Defaults to 64 MiB.
+		partitions (int, optional): The number of spill partitions. Defaults to 16.
+		size (int, optional): The number of rows per streamed batch. Defaults to 10000.
+		build (str, optional): 'auto' for the table with fewer rows, 'left' for the first or 'right' for the second table. Defaults to 'auto'.
+		keys (bool, optional): If True, the keys of the build side are pushed down to the probe side. Defaults to True.
+		max_keys (int, optional): The largest number of distinct keys that is pushed down. Defaults to 10000.
+		conditions (tuple, optional): WHERE clauses of the first and the second table, e.g. ("WHERE users.age > 15", ""). Defaults to none.
+		path (str, optional): The directory of the spill files. Defaults to the system temporary directory.
+
+	Attributes:
+		build_rows (int): The number of rows read from the build side.
+		probe_rows (int): The number of rows read from the probe side.
+		rows (int): The number of joined rows.
+		spilled (bool): True if the build side exceeded the memory budget.
+		spilled_bytes (int): The number of bytes written to the spill files.
+		pushed_keys (int): The number of distinct keys pushed down to the probe side, 0 if none were.
+	"""
+
+	def __init__(self, join: Join, memory: int = 67108864, partitions: int = 16, size: int = 10000, build: str = 'auto', keys: bool = True, max_keys: int = 10000, conditions: tuple = ('', ''), path: str = None):
+		if not isinstance(join, Join):
+			raise QueryException(f'The data type must be "{Join}"')
+		if build not in ('auto', 'left', 'right'):
+			raise QueryException("The build side must be 'auto', 'left' or 'right'")
+		self.join = join
+		self.column = join.column
+		self.how = join.how
+		self.memory = max(int(memory), 1)
+		self.partitions = max(int(partitions), 1)
+		self.size = max(int(size), 1)
+		self.keys = keys
+		self.max_keys = max(int(max_keys), 0)
+		self.conditions = tuple(str(c).strip() if c is not None else '' for c in conditions)
+		self.path = path
+		if build == 'auto':
+			build = 'left' if join.table1.LENGTH <= join.table2.LENGTH else 'right'
+		self.build_left = build == 'left'
+		# The joined rows of a side without a partner are kept by outer joins of that side.
+		self.keep_build = self.how == 'outer' or self.how == build
+		self.keep_probe = self.how == 'outer' or self.how == ('right' if self.build_left else 'left')
+		self.build_rows = 0
+		self.probe_rows = 0
+		self.rows = 0
+		self.spilled = False
+		self.spilled_bytes = 0
+		self.pushed_keys = 0
+
+	def __str__(self):
+		tables = (self.join.table1.table, self.join.table2.table)
+		return f'HashJoin ({tables[0]} {self.how} {tables[1]} ON {self.column}) => build {tables[0 if self.build_left else 1]}'
+
+	def __iter__(self):
+		return self.stream()
+
+	def __sides__(self):
+		"""
+		Return the build and probe tables with their conditions.
+		"""
+		first = (self.join.table1, self.conditions[0])
+		second = (self.join.table2, self.conditions[1] if len(self.conditions) > 1 else '')
+		return (first, second) if self.build_left else (second, first)
+
+	def __merge__(self, build: DataFrame, probe: DataFrame, how: str) -> DataFrame:
+		"""
+		Merge build and probe rows with the first table on the left, as pandas.merge names the columns.
+		The build rows must not have NULL keys, which pandas.merge would match with each other unlike SQL.
+		"""
+		left, right = (build, probe) if self.build_left else (probe, build)
+		return pd.merge(left, right, on=self.column, how=how)
+
+	def __canonical__(self, x) -> str:
+		"""
+		Return the text a key is hashed by, equal for equal keys of any type, e.g. 5, 5.0 and Decimal('5').
+		"""
+		if isinstance(x, (bool, np.bool_)):
+			return str(int(x))
+		if isinstance(x, (int, np.integer)):
+			return str(int(x))
+		if isinstance(x, (float, np.floating, Decimal)) and np.isfinite(float(x)) and x == int(x):
+			return str(int(x))
+		if isinstance(x, (float, np.floating, Decimal)):
+			return repr(float(x))
+		return f'{type(x).__name__}:{x}'
+
+	def __partition__(self, frame: DataFrame) -> dict:
+		"""
+		Split a frame into the spill partitions by the hash of the join column.
+		"""
+		keys = frame[self.column]
+		# The dtype of a batch depends on its NULLs, so the keys are hashed by value; NULL keys never match and go to partition 0.
+		hashes = pd.util.hash_pandas_object(keys.astype(object).where(keys.notna(), None).map(lambda x: '' if x is None else self.__canonical__(x)), index=False).to_numpy()
+		parts = np.where(keys.notna().to_numpy(), hashes % self.partitions, 0)
+		return {int(part): frame[parts == part] for part in set(parts.tolist())}
+
+	def __spill__(self, folder: str, side: str, frame: DataFrame):
+		"""
+		Append the partitions of a frame to the spill files of one side.
+		"""
+		for part, rows in self.__partition__(frame).items():
+			with open(os.path.join(folder, f'{side}-{part}.pkl'), 'ab') as file:
+				start = file.tell()
+				pickle.dump(rows, file, protocol=pickle.HIGHEST_PROTOCOL)
+				self.spilled_bytes += file.tell() - start
+
+	def __read__(self, folder: str, side: str, part: int):
+		"""
+		Yield the frames of one spill file.
+		"""
+		name = os.path.join(folder, f'{side}-{part}.pkl')
+		if not os.path.isfile(name):
+			return
+		with open(name, 'rb') as file:
+			while True:
+				try:
+					yield pickle.load(file)
+				except EOFError:
+					break
+
+	def __probe__(self, items, condition: str, keys):
+		"""
+		Yield the batches of the probe side, filtered by the pushed-down keys if there are any.
+		"""
+		if keys is None:
+			yield from items.stream(condition=condition, size=self.size)
+			return
+		where = condition[5:].strip() if condition.upper().startswith('WHERE') else condition
+		if where != '' and not condition.upper().startswith('WHERE'):
+			raise QueryException('The conditions of a hash join must be WHERE clauses')
+		keys = list(keys)
+		for i in range(0, len(keys), 1000):
+			values = ','.join(items.to_str(items.to_value(k)) for k in keys[i:i+1000])
+			clause = f'WHERE {items.table}.{self.column} IN ({values})' + (f' AND ({where})' if where != '' else '')
+			yield from items.stream(condition=clause, size=self.size)
+
+	def __unmatched__(self, build: DataFrame, matched, probe_columns: list) -> DataFrame:
+		"""
+		Return the build rows without a partner, joined with an empty probe side.
+		"""
+		rows = build[~matched]
+		probe = DataFrame({col: pd.Series(dtype=build[self.column].dtype if col == self.column else object) for col in probe_columns})
+		return self.__merge__(rows, probe, 'left' if self.build_left else 'right')
+
+	def stream(self):
+		"""
+		Run the join and yield the joined rows in batches.
+
+		Yields:
+			DataFrame: The next batch of joined rows.
+		"""
+		(build_items, build_condition), (probe_items, probe_condition) = self.__sides__()
+		probe_columns = list(probe_items.ALL_COLUMNS)
+		probe_how = ('right' if self.build_left else 'left') if self.keep_probe else 'inner'
+		self.build_rows = self.probe_rows = self.rows = self.spilled_bytes = self.pushed_keys = 0
+		self.spilled = False
+		folder = None
+		try:
+			frames, used, keys = [], 0, set() if self.keys and not self.keep_probe else None
+			for batch in build_items.stream(condition=build_condition, size=self.size):
+				self.build_rows += len(batch)
+				if keys is not None:
+					keys.update(batch[self.column].dropna().tolist())
+					if len(keys) > self.max_keys:
+						keys = None
+				if folder is not None:
+					self.__spill__(folder, 'build', batch)
+					continue
+				frames.append(batch)
+				used += int(batch.memory_usage(deep=True).sum())
+				if used > self.memory:
+					# Over the budget the build side moves to disk, partitioned like the probe side will be.
+					self.spilled = True
+					folder = tempfile.mkdtemp(prefix='pytopconnect-join-', dir=self.path)
+					for frame in frames:
+						self.__spill__(folder, 'build', frame)
+					frames = []
+			if keys is not None:
+				self.pushed_keys = len(keys)
+				# Without build keys the join has no rows, so the probe side is not read at all.
+				if len(keys) == 0:
+					return
+			if folder is None:
+				build = pd.concat(frames, ignore_index=True) if len(frames) > 0 else DataFrame(columns=list(build_items.ALL_COLUMNS))
+				matched, keyed = pd.Series(False, index=build.index), build[build[self.column].notna()]
+				for batch in self.__probe__(probe_items, probe_condition, keys):
+					self.probe_rows += len(batch)
+					if self.keep_build:
+						matched |= build[self.column].isin(batch[self.column].dropna())
+					merge = self.__merge__(keyed, batch, probe_how)
+					if len(merge) > 0:
+						self.rows += len(merge)
+						yield merge
+				if self.keep_build and not matched.all():
+					merge = self.__unmatched__(build, matched, probe_columns)
+					self.rows += len(merge)
+					yield merge
+				return
+			for batch in self.__probe__(probe_items, probe_condition, keys):
+				self.probe_rows += len(batch)
+				self.__spill__(folder, 'probe', batch)
+			for part in range(self.partitions):
+				frames = list(self.__read__(folder, 'build', part))
+				build = pd.concat(frames, ignore_index=True) if len(frames) > 0 else DataFrame(columns=list(build_items.ALL_COLUMNS))
+				matched, keyed = pd.Series(False, index=build.index), build[build[self.column].notna()]
+				for batch in self.__read__(folder, 'probe', part):
+					if self.keep_build:
+						matched |= build[self.column].isin(batch[self.column].dropna())
+					merge = self.__merge__(keyed, batch, probe_how)
+					if len(merge) > 0:
+						self.rows += len(merge)
+						yield merge
+				if self.keep_build and len(build) > 0 and not matched.all():
+					merge = self.__unmatched__(build, matched, probe_columns)
+					self.rows += len(merge)
+					yield merge
+		finally:
+			if folder is not None:
+				shutil.rmtree(folder, ignore_errors=True)
+
+	def get(self):
+		"""
+		Run the join and return all joined rows.
+
+		Returns:
+			Items: An Items object of the first table with the joined rows, as returned by Join.get.
+		"""
+		frames = list(self.stream())
+		names = [name for name, _ in self.join.__columns__()]
+		merge = pd.concat(frames, ignore_index=True)[names] if len(frames) > 0 else DataFrame(columns=names)
+		return self.join.__items__(merge)
+
+	def metrics(self) -> dict:
+		"""
+		Return the metrics of the last run.
+
+		Returns:
+			dict: The build side, build_rows, probe_rows, rows, spilled, spilled_bytes and pushed_keys.
+		"""
+		return {
+			'build': self.join.table1.table if self.build_left else self.join.table2.table,
+			'build_rows': self.build_rows,
+			'probe_rows': self.probe_rows,
+			'rows': self.rows,
+			'spilled': self.spilled,
+			'spilled_bytes': self.spilled_bytes,
+			'pushed_keys': self.pushed_keys
+		}
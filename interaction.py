@@ -2,41 +2,608 @@ import os
 import re
 import sys
 import json
+import base64
 import codecs
+import mmap
+import csv
+import gzip
+import time as TM
 from glob import glob
+from datetime import date, time, datetime
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from .condition import *
 from .datatypes import *
 from .database import *
 from .storage import *
 
+__FORMATS__ = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.parquet': 'parquet'}
+
+__COMPRESSIONS__ = {'.gz': 'gzip', '.zst': 'zstd'}
+
+def __file_format__(path: str, format: str = None, compression: str = None) -> tuple:
+	"""
+	Return the format and the compression of a file, taken from its extension where they are not given.
+	"""
+	name, extension = os.path.splitext(path.lower())
+	if compression is None and extension in __COMPRESSIONS__:
+		compression = __COMPRESSIONS__[extension]
+	if extension in __COMPRESSIONS__:
+		extension = os.path.splitext(name)[1]
+	if format is None:
+		format = __FORMATS__.get(extension)
+	if format not in __FORMATS__.values():
+		raise QueryException(f"The format of '{path}' must be one of {sorted(set(__FORMATS__.values()))}")
+	if compression is not None and compression not in __COMPRESSIONS__.values():
+		raise QueryException(f"The compression must be one of {sorted(__COMPRESSIONS__.values())}")
+	return format, compression
+
+def __open__(path: str, mode: str, compression: str = None, charset: str = 'utf-8'):
+	"""
+	Open a text file, compressed with gzip or zstd or not at all.
+	"""
+	if compression == 'gzip':
+		return gzip.open(path, mode, encoding=charset, newline='')
+	if compression == 'zstd':
+		try:
+			import zstandard
+		except ImportError:
+			raise QueryException("The zstd compression requires the 'zstandard' package")
+		return zstandard.open(path, mode, encoding=charset, newline='')
+	return open(path, mode.replace('t', ''), encoding=charset, newline='')
+
+
+__TRIGGER__ = re.compile(r'\s*CREATE\s+(?:TEMP\w*\s+)?TRIGGER\b', re.I)
+
+def __statements__(lines, delimiter: str = ';', backslash: bool = False):
+	"""
+	Split SQL text, given line by line, into statements, yielding the line each statement starts on and the statement.
+	"""
+	tokens = lambda delimiter: re.compile(r'(?P<delimiter>' + re.escape(delimiter) + r")|(?P<quote>['\"`])|(?P<comment>--)|(?P<block>/\*)|(?P<dollar>\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$)|\b(?P<word>BEGIN|CASE|END)\b", re.I)
+	pattern = tokens(delimiter)
+	state, parts, start, head, depth = None, [], None, '', 0
+	for number, line in enumerate(lines, 1):
+		if state is None and start is None and line.strip()[:10].upper() == 'DELIMITER ':
+			pattern = tokens(line.strip()[10:].strip())
+			continue
+		position = 0
+		while position < len(line):
+			if state is not None:
+				# Inside a quote, a block comment or a dollar quote only its end matters.
+				end = re.compile((r'\\.|' if backslash and state in ("'", '"') else '') + re.escape('*/' if state == '/*' else state), re.S)
+				match = next((m for m in end.finditer(line, position) if not m.group().startswith('\\')), None)
+				stop = len(line) if match is None else match.end()
+				parts.append(line[position:stop])
+				position, state = stop, state if match is None else None
+				continue
+			match = pattern.search(line, position)
+			text = line[position:len(line) if match is None else match.start()]
+			parts.append(text)
+			if text.strip() != '':
+				start = number if start is None else start
+				head += text if len(head) < 100 else ''
+			if match is None:
+				break
+			position, kind = match.end(), match.lastgroup
+			if kind == 'delimiter' and not (depth > 0 and __TRIGGER__.match(head)):
+				if start is not None:
+					yield start, ''.join(parts).strip()
+				state, parts, start, head, depth = None, [], None, '', 0
+				continue
+			parts.append(match.group())
+			if kind == 'comment':
+				parts.append(line[position:])
+				break
+			if kind == 'block':
+				state = '/*'
+				continue
+			start = number if start is None else start
+			if kind == 'word':
+				head += match.group() if len(head) < 100 else ''
+				# Only the body of a trigger ends with END before its delimiter.
+				if __TRIGGER__.match(head):
+					depth += -1 if match.group().upper() == 'END' else 1
+			elif kind != 'delimiter':
+				state = match.group()
+	if start is not None:
+		yield start, ''.join(parts).strip()
 
 class Import:
 	"""
-	A class representing an import operation.
+	A class representing the bulk load of a CSV, JSON Lines or Parquet file into a table.
 
-	This class serves as a placeholder for functionality related to importing data or resources. 
-	Currently, it does not implement any specific behavior but can be extended in the future.
+	The file is parsed in batches of 'batch_size' rows, so the memory used stays the same whatever 
+	the size of the file. Every value is converted to the type of its column, as reported by types() 
+	of the table, and each batch is loaded over a connection of its own with the fastest bulk path of 
+	the driver (COPY on PostgreSQL, chunked executemany on MySQL and SQLite) and committed. Rows that 
+	cannot be parsed or converted are written to the reject file as JSON lines with their line number 
+	and error. BLOB values are read from CSV and JSON Lines files as base64 text, as Export writes them. If the database refuses a batch, e.g. for a duplicate key, the batch is loaded again 
+	row by row, so only the refused rows are rejected.
 
 	Args:
-		None
+		path (str): The path of the file. The format and the compression are taken from the extension 
+					if they are not given, e.g. 'users.csv.gz' or 'users.parquet'.
+		items (Items): The table to load into.
+		format (str, optional): 'csv', 'jsonl' or 'parquet'. Defaults to the extension of the path.
+		batch_size (int, optional): The number of rows per batch and commit. Defaults to 10000.
+		columns (list, optional): The column names of a CSV file without a header. Defaults to the header.
+		compression (str, optional): 'gzip' or 'zstd' for CSV and JSON Lines files. Defaults to the extension of the path.
+		charset (str, optional): The character set of CSV and JSON Lines files. Defaults to 'utf-8'.
+		delimiter (str, optional): The field delimiter of a CSV file. Defaults to ','.
+		chunk (int, optional): The maximum number of rows per insert statement. Defaults to 1000.
+		reject (str, optional): The reject file. Defaults to the path with '.rejected.jsonl' appended. 
+								It is only created if a row is rejected.
+		max_rejects (int, optional): The import stops with an error after more rejected rows. Defaults to no limit.
+		progress (callable, optional): Called as progress(metrics) after every batch, see metrics().
+
+	Attributes:
+		rows (int): The number of rows loaded by the last run.
+		rejected (int): The number of rows rejected by the last run.
+		read (int): The number of rows read from the file by the last run.
+		batches (int): The number of batches loaded by the last run.
+		duration (float): The seconds the last run took.
+
+	Raises:
+		QueryException: If the format or the compression is unknown, or the package a format 
+						or compression requires is not installed.
 	"""
 
-	def __init__(self):
-		pass
+	TRUE = {'1', 't', 'true', 'y', 'yes', 'on'}
+
+	FALSE = {'0', 'f', 'false', 'n', 'no', 'off'}
+
+	def __init__(self, path: str, items: Items, format: str = None, batch_size: int = 10000, columns: list = None, compression: str = None, charset: str = 'utf-8', delimiter: str = ',', chunk: int = 1000, reject: str = None, max_rejects: int = None, progress=None):
+		if not isinstance(items, Items):
+			raise QueryException(f'The data type must be "{Items}"')
+		self.path = os.path.abspath(path)
+		if not os.path.isfile(self.path):
+			raise QueryException(f'The file at this path "{self.path}" does not exist')
+		self.items = items
+		self.format, self.compression = __file_format__(self.path, format, compression)
+		self.batch_size = max(int(batch_size), 1)
+		self.columns = None if columns is None else list(columns)
+		self.charset = charset
+		self.delimiter = delimiter
+		self.chunk = max(int(chunk), 1)
+		self.reject = f'{self.path}.rejected.jsonl' if reject is None else os.path.abspath(reject)
+		self.max_rejects = max_rejects
+		self.progress = progress
+		self.method = None
+		self.rows = 0
+		self.rejected = 0
+		self.read = 0
+		self.batches = 0
+		self.duration = 0.0
+		self.__position = None
+		self.__rejects = None
+
+	def __str__(self):
+		return f'Import ({self.path}) => {self.items.table}'
+
+	def __converter__(self, family: str):
+		"""
+		Return the function converting a parsed value to a value of a column family.
+		"""
+		def integer(x):
+			if isinstance(x, float) and not x.is_integer():
+				raise ValueError(f'{x!r} is not an integer')
+			return int(x.strip()) if isinstance(x, str) else int(x)
+		def boolean(x):
+			if isinstance(x, str):
+				if x.strip().lower() in self.TRUE:
+					return True
+				if x.strip().lower() in self.FALSE:
+					return False
+				raise ValueError(f'{x!r} is not a boolean')
+			return bool(x)
+		def moment(kind):
+			def convert(x):
+				if isinstance(x, str):
+					return kind.fromisoformat(x.strip())
+				if kind is date and isinstance(x, datetime):
+					return x.date()
+				if kind is datetime and not isinstance(x, datetime) and isinstance(x, date):
+					return datetime.combine(x, time())
+				if isinstance(x, kind):
+					return x
+				raise ValueError(f'{x!r} is not a {kind.__name__}')
+			return convert
+		def document(x):
+			if isinstance(x, str):
+				json.loads(x)
+				return x
+			return json.dumps(x, ensure_ascii=False)
+		def blob(x):
+			# Export writes binary values to text files as base64.
+			return base64.b64decode(x, validate=True) if isinstance(x, str) else bytes(x)
+		def text(x):
+			return x if isinstance(x, str) else json.dumps(x, ensure_ascii=False) if isinstance(x, (list, dict)) else str(x)
+		return {
+			'bool': boolean,
+			'tinyint': integer, 'smallint': integer, 'int': integer, 'bigint': integer, 'year': integer,
+			'float': float, 'double': float,
+			# SQLite stores decimals as REAL and cannot bind Decimal values.
+			'decimal': float if self.items.parent.dataTypes.__TC_DATANAME__.lower() in ['sqlite'] else lambda x: Decimal(x.strip() if isinstance(x, str) else str(x)),
+			'json': document,
+			'date': moment(date), 'time': moment(time), 'datetime': moment(datetime),
+			'blob': blob
+		}.get(family, text)
+
+	def __records__(self):
+		"""
+		Yield the records of the file as (line, record) pairs; a record that cannot be parsed is an exception.
+		"""
+		if self.format == 'parquet':
+			try:
+				import pyarrow.parquet
+			except ImportError:
+				raise QueryException("The Parquet import requires the 'pyarrow' package")
+			file = pyarrow.parquet.ParquetFile(self.path)
+			self.__position = lambda: (self.read, file.metadata.num_rows)
+			line = 0
+			for batch in file.iter_batches(batch_size=self.batch_size):
+				for record in batch.to_pylist():
+					line += 1
+					yield line, record
+			return
+		with __open__(self.path, 'rt', self.compression, self.charset) as file:
+			size = os.path.getsize(self.path)
+			def position():
+				try:
+					return os.lseek(file.fileno(), 0, os.SEEK_CUR), size
+				except BaseException:
+					return None, size
+			self.__position = position
+			if self.format == 'jsonl':
+				for line, text in enumerate(file, 1):
+					if text.strip() == '':
+						continue
+					try:
+						record = json.loads(text)
+						if not isinstance(record, dict):
+							raise ValueError('The line is not a JSON object')
+					except ValueError as e:
+						record = QueryException(f'{e}: {text.strip()[:200]}')
+					yield line, record
+			else:
+				reader = csv.reader(file, delimiter=self.delimiter)
+				names = self.columns if self.columns is not None else next(reader, [])
+				for row in reader:
+					if len(row) == 0:
+						continue
+					if len(row) != len(names):
+						yield reader.line_num, QueryException(f'Expected {len(names)} fields, got {len(row)}: {row}')
+						continue
+					yield reader.line_num, {name: value for name, value in zip(names, row)}
+		self.__position = lambda: (size, size)
+
+	def __reject__(self, line: int, record, error: BaseException):
+		"""
+		Write a rejected row to the reject file.
+		"""
+		if self.__rejects is None:
+			self.__rejects = open(self.reject, 'w', encoding='utf-8')
+		self.__rejects.write(json.dumps({'line': line, 'error': str(error), 'row': record}, ensure_ascii=False, default=str) + '\n')
+		self.rejected += 1
+		if self.max_rejects is not None and self.rejected > self.max_rejects:
+			raise QueryException(f"More than {self.max_rejects} rows of '{self.path}' were rejected, see '{self.reject}'")
+
+	def __load__(self, connection, columns: list, batch: list):
+		"""
+		Load and commit a batch of (line, record, values) rows, row by row if the database refuses the batch.
+		"""
+		query = lambda rows: self.items._query_(self.method, {self.items.table: {'columns': columns, 'values': rows}}, {'chunk': self.chunk}, connection=connection)
+		try:
+			query([values for _, _, values in batch])
+			connection.commit()
+			self.rows += len(batch)
+			return
+		except BaseException:
+			connection.rollback()
+		for line, record, values in batch:
+			try:
+				query([values])
+				connection.commit()
+				self.rows += 1
+			except BaseException as e:
+				connection.rollback()
+				self.__reject__(line, record, e)
+
+	def run(self) -> dict:
+		"""
+		Load the file into the table.
+
+		Returns:
+			dict: The metrics of the import, see metrics().
+
+		Raises:
+			QueryException: If the file has a column the table does not have, more rows than max_rejects 
+							were rejected, or reading the file or the database fails. The batches loaded 
+							before the error stay committed.
+		"""
+		self.rows = self.rejected = self.read = self.batches = 0
+		self.__position = None
+		fields = self.items.types()
+		types = self.items.parent.dataTypes
+		converters = {column: self.__converter__(types.family(field['type'])) for column, field in fields.items()}
+		texts = {column for column, field in fields.items() if types.family(field['type']) in ['char', 'varchar', 'text']}
+		started = TM.perf_counter()
+		connection = self.items._connection_().clone()
+		try:
+			connection.functinon_list('COPY')
+			self.method = 'COPY'
+		except BaseException:
+			self.method = 'BULK_INSERT'
+		columns = None
+		batch = []
+		try:
+			for line, record in self.__records__():
+				self.read += 1
+				if isinstance(record, BaseException):
+					self.__reject__(line, None, record)
+					continue
+				if columns is None:
+					# The columns of the first record are the columns of the file.
+					columns = list(record.keys())
+					if not self.items.is_column(*columns):
+						raise QueryException(f"Column does not exist. Existing columns in your table {self.items.ALL_COLUMNS}")
+				try:
+					values = []
+					for column in columns:
+						value = record.get(column)
+						# An empty field of a CSV file is a missing value, except in text columns.
+						if value == '' and self.format == 'csv' and column not in texts:
+							value = None
+						values.append(None if value is None else converters[column](value))
+				except BaseException as e:
+					self.__reject__(line, record, e)
+					continue
+				batch.append((line, record, values))
+				if len(batch) >= self.batch_size:
+					self.__load__(connection, columns, batch)
+					self.batches += 1
+					batch = []
+					self.duration = TM.perf_counter() - started
+					if self.progress is not None:
+						self.progress(self.metrics())
+			if len(batch) > 0:
+				self.__load__(connection, columns, batch)
+				self.batches += 1
+		except BaseException as e:
+			try:
+				connection.rollback()
+			except BaseException:
+				pass
+			raise e
+		finally:
+			connection.close()
+			if self.__rejects is not None:
+				self.__rejects.close()
+				self.__rejects = None
+			self.duration = TM.perf_counter() - started
+		if self.progress is not None:
+			self.progress(self.metrics())
+		# The new rows become visible in the mirror with the next reload.
+		self.items._upgraded_()
+		return self.metrics()
+
+	def metrics(self) -> dict:
+		"""
+		Return the metrics of the running or the last run.
+
+		Returns:
+			dict: The table, path, format, method ('COPY' or 'BULK_INSERT'), rows, rejected, read, batches, 
+				done and total (bytes of a CSV or JSON Lines file, rows of a Parquet file, None if unknown), 
+				duration, rows_per_second and reject (the reject file, None if no row was rejected).
+		"""
+		done, total = self.__position() if self.__position is not None else (None, None)
+		return {
+			'table': self.items.table,
+			'path': self.path,
+			'format': self.format,
+			'method': self.method,
+			'rows': self.rows,
+			'rejected': self.rejected,
+			'read': self.read,
+			'batches': self.batches,
+			'done': done,
+			'total': total,
+			'duration': self.duration,
+			'rows_per_second': self.rows / self.duration if self.duration > 0 else 0.0,
+			'reject': self.reject if self.rejected > 0 else None
+		}
 
 class Export:
 	"""
-	A class representing an export operation.
+	A class representing the export of a table to a CSV, JSON Lines or Parquet file.
 
-	This class serves as a placeholder for functionality related to exporting data or resources. 
-	Currently, it does not implement any specific behavior but can be extended in the future.
+	The rows are read from the database with a server-side cursor over a connection of their own and 
+	are written batch by batch, as CSV lines, JSON lines or Parquet row groups, so the memory used 
+	stays the same whatever the size of the table. The file is written under a temporary name and 
+	renamed when the export is complete, so an interrupted export never leaves a partial file behind. 
+	CSV and JSON Lines files have no binary type, so BLOB values are written to them as base64 text, 
+	which Import decodes again; Parquet files keep them binary.
 
 	Args:
-		None
+		items (Items): The table to export.
+		path (str): The path of the file. The format and the compression are taken from the extension 
+					if they are not given, e.g. 'users.csv.gz' or 'users.parquet'.
+		format (str, optional): 'csv', 'jsonl' or 'parquet'. Defaults to the extension of the path.
+		condition (Condition or str, optional): The condition of the SELECT. Defaults to all rows.
+		columns (list, optional): The columns to export. Defaults to all columns.
+		compression (str, optional): 'gzip' or 'zstd'. Parquet files compress their column chunks with it, and 
+									 use the default of pyarrow if it is None. Defaults to the extension of the path.
+		size (int, optional): The number of rows per batch and Parquet row group. Defaults to 10000.
+		charset (str, optional): The character set of CSV and JSON Lines files. Defaults to 'utf-8'.
+		header (bool, optional): If True, the first line of a CSV file holds the column names. Defaults to True.
+
+	Attributes:
+		rows (int): The number of rows written by the last run.
+		batches (int): The number of batches written by the last run.
+		bytes (int): The size of the written file.
+		duration (float): The seconds the last run took.
+
+	Raises:
+		QueryException: If the format or the compression is unknown, a column does not exist, 
+						or the package a format or compression requires is not installed.
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, items: Items, path: str, format: str = None, condition: Union[Condition, str] = '', columns: list = None, compression: str = None, size: int = 10000, charset: str = 'utf-8', header: bool = True):
+		if not isinstance(items, Items):
+			raise QueryException(f'The data type must be "{Items}"')
+		self.items = items
+		self.path = os.path.abspath(path)
+		self.format, self.compression = __file_format__(self.path, format, compression)
+		self.condition = condition
+		self.columns = list(items.ALL_COLUMNS if columns is None else columns)
+		if not items.is_column(*self.columns):
+			raise QueryException(f"Column does not exist. Existing columns in your table {items.ALL_COLUMNS}")
+		self.size = max(int(size), 1)
+		self.charset = charset
+		self.header = header
+		self.rows = 0
+		self.batches = 0
+		self.bytes = 0
+		self.duration = 0.0
+
+	def __str__(self):
+		return f'Export ({self.items.table}) => {self.path}'
+
+	def __batches__(self):
+		"""
+		Yield the rows of the table in batches, each row a list of plain Python values.
+		"""
+		# The rows are not turned into DataFrames, which would make integer columns with NULLs floats.
+		to_value = self.items.to_value
+		connection = self.items._connection_().clone()
+		batches = None
+		try:
+			batches = connection.query_f('STREAM', {self.items.table: self.columns}, {'condition': self.condition, 'size': self.size})
+			for batch in batches:
+				yield [list(map(to_value, row)) for row in batch]
+		finally:
+			if batches is not None:
+				batches.close()
+			connection.close()
+
+	def __text__(self, file):
+		"""
+		Write the rows as CSV or JSON lines to an open text file.
+		"""
+		def encode(x):
+			return base64.b64encode(bytes(x)).decode('ascii') if isinstance(x, (bytes, bytearray, memoryview)) else x
+		if self.format == 'csv':
+			writer = csv.writer(file)
+			if self.header:
+				writer.writerow(self.columns)
+		for batch in self.__batches__():
+			batch = [list(map(encode, row)) for row in batch]
+			if self.format == 'csv':
+				writer.writerows(batch)
+			else:
+				file.writelines(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False, default=str) + '\n' for row in batch)
+			self.rows += len(batch)
+			self.batches += 1
+
+	def __parquet__(self, path: str):
+		"""
+		Write the rows as Parquet row groups, with the schema of the first batch.
+		"""
+		try:
+			import pyarrow
+			import pyarrow.parquet
+		except ImportError:
+			raise QueryException("The Parquet export requires the 'pyarrow' package")
+		writer = schema = None
+		try:
+			for batch in self.__batches__():
+				data = {column: [row[i] for row in batch] for i, column in enumerate(self.columns)}
+				if schema is None:
+					table = pyarrow.Table.from_pydict(data)
+					# A column without values in the first batch has no type yet, so it is written as text.
+					schema = pyarrow.schema([field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field for field in table.schema])
+					writer = pyarrow.parquet.ParquetWriter(path, schema, **({} if self.compression is None else {'compression': self.compression}))
+				try:
+					table = pyarrow.Table.from_pydict(data, schema=schema)
+				except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+					table = pyarrow.Table.from_pydict(data).cast(schema)
+				writer.write_table(table, row_group_size=self.size)
+				self.rows += len(batch)
+				self.batches += 1
+			if writer is None:
+				# An empty table still gets a file with its columns.
+				schema = pyarrow.schema([(column, pyarrow.string()) for column in self.columns])
+				writer = pyarrow.parquet.ParquetWriter(path, schema)
+		finally:
+			if writer is not None:
+				writer.close()
+
+	def run(self) -> dict:
+		"""
+		Export the table to the file.
+
+		Returns:
+			dict: The metrics of the export, see metrics().
+
+		Raises:
+			QueryException: If reading the table or writing the file fails. The file is not created in that case.
+		"""
+		self.rows = self.batches = self.bytes = 0
+		started = TM.perf_counter()
+		part = f'{self.path}.part'
+		try:
+			if self.format == 'parquet':
+				self.__parquet__(part)
+			else:
+				with __open__(part, 'wt', self.compression, self.charset) as file:
+					self.__text__(file)
+			os.replace(part, self.path)
+		except BaseException as e:
+			if os.path.isfile(part):
+				os.remove(part)
+			raise e
+		finally:
+			self.duration = TM.perf_counter() - started
+		self.bytes = os.path.getsize(self.path)
+		return self.metrics()
+
+	def metrics(self) -> dict:
+		"""
+		Return the metrics of the last run.
+
+		Returns:
+			dict: The table, path, format, compression, rows, batches, bytes, duration and rows_per_second.
+		"""
+		return {
+			'table': self.items.table,
+			'path': self.path,
+			'format': self.format,
+			'compression': self.compression,
+			'rows': self.rows,
+			'batches': self.batches,
+			'bytes': self.bytes,
+			'duration': self.duration,
+			'rows_per_second': self.rows / self.duration if self.duration > 0 else 0.0
+		}
+
+	@staticmethod
+	def parallel(exports: list, workers: int = 4) -> list:
+		"""
+		Run several exports at once, each on a thread and a connection of its own.
+
+		Args:
+			exports (list): The Export objects to run.
+			workers (int, optional): The number of exports running at the same time. Defaults to 4.
+
+		Returns:
+			list: The metrics of every export, in the order of 'exports'.
+
+		Raises:
+			QueryException: The first error of an export, after all other exports have finished.
+		"""
+		with ThreadPoolExecutor(max_workers=max(int(workers), 1), thread_name_prefix='pytopconnect-export') as executor:
+			futures = [executor.submit(export.run) for export in exports]
+		return [future.result() for future in futures]
 
 class File:
 	"""
@@ -51,30 +618,52 @@ class File:
 		mode (str, optional): The mode in which to open the file. Defaults to 'rb'.
 		charset (str, optional): The character set to use for encoding. Defaults to 'utf-8'.
 		_codecs (bool, optional): If True, uses codecs for file opening. Defaults to False.
+		lazy (bool, optional): If True, the file is opened by the first read or write rather than here. Defaults to False.
 		*args: Additional positional arguments.
 		**kwargs: Additional keyword arguments.
 
 	Attributes:
+		path (str): The path to the file.
 		charset (str): The character set used for encoding.
-		__file__: The file object for reading or writing.
+		__file__: The file object for reading or writing, None while it is not open.
 
 	Methods:
 		read(line: bool = False, decode: bool = False, _json: bool = False) -> Union[str, list, tuple, dict, bytes]:
 			Reads data from the file based on specified options.
 		write(data) -> bool:
 			Writes data to the file, supporting various data types.
+		lines():
+			Yields the lines of the file from a memory map, without opening the file object.
+		statements(delimiter: str = ';', backslash: bool = False):
+			Yields the SQL statements of the file.
 		close():
 			Closes the file.
 	"""
 
-	def __init__(self,file:str,mode:str='rb',charset:str='utf-8',_codecs:bool=False,*args,**kwargs):
+	def __init__(self,file:str,mode:str='rb',charset:str='utf-8',_codecs:bool=False,lazy:bool=False,*args,**kwargs):
 		if not os.path.isfile(file):
 			return Exception(f'The file at this path "{file}" does not exist')
+		self.path = file
+		self.mode = mode
 		self.charset = charset
-		if _codecs:
-			self.__file__ = codecs.open(file,mode,encoding=charset)
-		else:
-			self.__file__ = open(file,mode)
+		self._codecs = _codecs
+		self.__file__ = None
+		if not lazy:
+			self.__handle__()
+
+	def __str__(self):
+		return f'File ({self.path}) => {"open" if self.__file__ is not None else "closed"}'
+
+	def __handle__(self):
+		"""
+		Return the file object, opening the file on first use.
+		"""
+		if self.__file__ is None:
+			if self._codecs:
+				self.__file__ = codecs.open(self.path,self.mode,encoding=self.charset)
+			else:
+				self.__file__ = open(self.path,self.mode)
+		return self.__file__
 
 	def read(self, line: bool = False, decode: bool = False, _json: bool = False) -> Union[str, list, tuple, dict, bytes]:
 		"""
@@ -94,10 +683,10 @@ class File:
 													depending on the options selected.
 		"""
 		if line:
-			return self.__file__.readlines()
+			return self.__handle__().readlines()
 		if decode:
-			return self.__file__.read().decode(self.charset)
-		return json.load(self.__file__) if _json else self.__file__.read()
+			return self.__handle__().read().decode(self.charset)
+		return json.load(self.__handle__()) if _json else self.__handle__().read()
 
 	def write(self, data) -> bool:
 		"""
@@ -118,13 +707,46 @@ class File:
 		"""
 		try:
 			if isinstance(data,(list,tuple,dict)):
-				self.__file__.write(json.dumps(data, encoding=self.charset, ensure_ascii=False))
+				self.__handle__().write(json.dumps(data, encoding=self.charset, ensure_ascii=False))
 			else:
-				self.__file__.write(data)
+				self.__handle__().write(data)
 			return True
 		except Exception as e:
 			return False
 
+	def lines(self):
+		"""
+		Read the file line by line from a memory map.
+
+		The file is mapped read-only for the time of the iteration, independently of the file object, 
+		so even very large files are read without loading them into memory.
+
+		Yields:
+			str: The next line, decoded with the charset and with its line break.
+		"""
+		if os.path.getsize(self.path) == 0:
+			return
+		with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+			for line in iter(data.readline, b''):
+				yield line.decode(self.charset)
+
+	def statements(self, delimiter: str = ';', backslash: bool = False):
+		"""
+		Read the SQL statements of the file one by one.
+
+		The file is split while it is read, see lines(). Delimiters inside quotes, comments, PostgreSQL 
+		dollar quotes and the BEGIN ... END body of a CREATE TRIGGER do not end a statement, and 
+		a 'DELIMITER' line, as written by mysqldump, changes the delimiter.
+
+		Args:
+			delimiter (str, optional): The statement delimiter. Defaults to ';'.
+			backslash (bool, optional): If True, a backslash escapes the next character in quotes, as in MySQL. Defaults to False.
+
+		Yields:
+			tuple: The line the statement starts on and the statement without its delimiter.
+		"""
+		yield from __statements__(self.lines(), delimiter, backslash)
+
 	def close(self):
 		"""
 		Close the opened file.
@@ -135,7 +757,9 @@ class File:
 		Returns:
 			None
 		"""
-		self.__file__.close()
+		if self.__file__ is not None:
+			self.__file__.close()
+			self.__file__ = None
 
 class Files(dict):
 	"""
@@ -143,7 +767,8 @@ class Files(dict):
 
 	This class extends the dictionary to store and manage multiple file instances, allowing for 
 	easy access and manipulation of files based on specified criteria. It provides methods to 
-	retrieve files, close all open files, and manage file attributes.
+	retrieve files, close all open files, and manage file attributes. The files are only indexed 
+	by their paths here; each one is opened by its first read or write.
 
 	Args:
 		_path (str, optional): The directory path to search for files. Defaults to the current working directory.
@@ -155,7 +780,7 @@ class Files(dict):
 		**kwargs: Additional keyword arguments for the dictionary.
 
 	Attributes:
-		FILES (list): A list of File objects managed by the Files class.
+		FILES (list): A list of File objects managed by the Files class, sorted by path.
 
 	Methods:
 		get(file_path: str = '', default=None) -> Union[File, None, tuple]:
@@ -167,11 +792,13 @@ class Files(dict):
 	def __init__(self,_path:str=os.getcwd(),mode:str='r',_type='*.sql',charset:str='utf-8',_codecs:bool=False,*args,**kwargs):
 		super(Files,self).__init__(*args,**kwargs)
 		self.FILES = []
-		for file in glob(os.path.join(_path,'**',_type), recursive=True):
+		self.__names = {}
+		for file in sorted(glob(os.path.join(_path,'**',_type), recursive=True)):
 			file = os.path.abspath(file)
-			_file = File(file,mode,charset,_codecs)
+			_file = File(file,mode,charset,_codecs,lazy=True)
 			self.FILES.append(_file)
 			self.update({file:_file})
+			self.__names.setdefault(os.path.basename(file).lower(), []).append(file)
 
 	def get(self, file_path: str = '', default=None) -> Union[File, None, tuple]:
 		"""
@@ -179,7 +806,8 @@ class Files(dict):
 
 		This function searches for a file in the collection that matches the provided file path. 
 		If no path is specified, it returns all files as a tuple; if a matching file is found, 
-		it returns that file; otherwise, it returns a default value.
+		it returns that file; otherwise, it returns a default value. A full path or a path ending 
+		with a file name is looked up in the index, any other part of a path is searched for.
 
 		Args:
 			file_path (str, optional): The path of the file to retrieve. Defaults to an empty string.
@@ -191,11 +819,18 @@ class Files(dict):
 		"""
 		if not file_path.strip():
 			return tuple(self.values())
+		path = file_path.lower().strip()
+		file = super(Files,self).get(os.path.abspath(file_path.strip()))
+		if file is not None:
+			return file
+		for key in self.__names.get(os.path.basename(path), []):
+			if path in key.lower() and key in self:
+				return self[key]
 		return next(
 			(
 				file
 				for key, file in self.items()
-				if file_path.lower().strip() in key.lower().strip()
+				if path in key.lower().strip()
 			),
 			default,
 		)
@@ -215,3 +850,175 @@ class Files(dict):
 			if isinstance(file,File):
 				file.close()
 				del self[key]
+
+class ScriptRunner:
+	"""
+	A class representing the execution of SQL scripts against a database.
+
+	The scripts are run in the order of their paths, statement by statement, as File.statements 
+	splits them while they are read, so no script is held in memory as a whole. The statements run 
+	over a connection of their own and are committed every 'batch_size' statements and at the end of 
+	every script. BEGIN and START TRANSACTION statements of a script are skipped, and COMMIT ends the 
+	current batch. MySQL commits DDL statements implicitly, so a batch with DDL is not atomic there. 
+	After the run every table of the database is reloaded, since its change marker cannot tell which 
+	tables a script changed.
+
+	Args:
+		tables (Tables): The database the scripts are run against.
+		files (Union[Files, File, str, list]): The scripts: a Files object, a File, the path of a script 
+											   or of a directory searched for '*.sql' files, or a list of them.
+		batch_size (int, optional): The number of statements per transaction. Defaults to 100.
+		stop_on_error (bool, optional): If True, a failed statement stops the run after its batch is 
+										rolled back. Otherwise the statements before it in the batch are 
+										run again and the script continues. Defaults to True.
+		delimiter (str, optional): The statement delimiter. Defaults to ';'.
+		progress (callable, optional): Called as progress(metrics) after every committed batch, see metrics().
+
+	Attributes:
+		statements (int): The number of statements run by the last run.
+		batches (int): The number of committed batches of the last run.
+		errors (list): The failed statements of the last run, each a dictionary with the file, line, statement and error.
+		duration (float): The seconds the last run took.
+
+	Raises:
+		QueryException: If tables is not a database or a script does not exist.
+	"""
+
+	BEGIN = re.compile(r'^(BEGIN|START\s+TRANSACTION|BEGIN\s+(TRANSACTION|WORK|DEFERRED|IMMEDIATE|EXCLUSIVE)(\s+TRANSACTION)?)$', re.I)
+
+	COMMIT = re.compile(r'^(COMMIT|END)(\s+(TRANSACTION|WORK))?$', re.I)
+
+	def __init__(self, tables: Tables, files, batch_size: int = 100, stop_on_error: bool = True, delimiter: str = ';', progress=None):
+		if not isinstance(tables, Tables):
+			raise QueryException(f'The data type must be "{Tables}"')
+		self.tables = tables
+		self.files = self.__files__(files)
+		self.batch_size = max(int(batch_size), 1)
+		self.stop_on_error = stop_on_error
+		self.delimiter = delimiter
+		self.progress = progress
+		self.statements = 0
+		self.batches = 0
+		self.errors = []
+		self.duration = 0.0
+
+	def __str__(self):
+		return f'ScriptRunner ({self.tables.name}) => {len(self.files)} scripts'
+
+	def __files__(self, files) -> list:
+		"""
+		Return the scripts as File objects sorted by path.
+		"""
+		result = []
+		for file in (files if isinstance(files, (list, tuple)) else [files]):
+			if isinstance(file, Files):
+				result += file.FILES
+			elif isinstance(file, File):
+				result.append(file)
+			elif isinstance(file, str) and os.path.isdir(file):
+				result += Files(file).FILES
+			elif isinstance(file, str) and os.path.isfile(file):
+				result.append(File(os.path.abspath(file), 'r', lazy=True))
+			else:
+				raise QueryException(f'The file at this path "{file}" does not exist')
+		return sorted(result, key=lambda file: file.path)
+
+	def run(self) -> dict:
+		"""
+		Run the scripts.
+
+		Returns:
+			dict: The metrics of the run, see metrics().
+
+		Raises:
+			QueryException: If a statement fails and stop_on_error is True, with the script and the line of the 
+							statement. The batches committed before stay committed.
+		"""
+		self.statements = self.batches = 0
+		self.errors = []
+		backslash = self.tables.dataTypes.__TC_DATANAME__.lower() in ['mysql']
+		started = TM.perf_counter()
+		connection = self.tables._connection_().clone()
+		connection.paramets['auto_commit'] = False
+		execute = lambda statement: self.tables._query_('EXECUTE', statement, {}, connection=connection)
+		batch = []
+		def commit():
+			connection.commit()
+			if len(batch) > 0:
+				self.batches += 1
+				batch.clear()
+				self.duration = TM.perf_counter() - started
+				if self.progress is not None:
+					self.progress(self.metrics())
+		try:
+			for file in self.files:
+				for line, statement in file.statements(self.delimiter, backslash):
+					if self.BEGIN.match(statement):
+						continue
+					if self.COMMIT.match(statement):
+						commit()
+						continue
+					try:
+						execute(statement)
+					except BaseException as e:
+						connection.rollback()
+						self.errors.append({'file': file.path, 'line': line, 'statement': statement, 'error': str(e)})
+						if self.stop_on_error:
+							raise QueryException(f"{file.path}:{line}: {e}")
+						# The rollback undid the batch, so the statements before the failed one are run again.
+						for done in batch:
+							execute(done)
+						continue
+					self.statements += 1
+					batch.append(statement)
+					if len(batch) >= self.batch_size:
+						commit()
+				commit()
+		except BaseException as e:
+			try:
+				connection.rollback()
+			except BaseException:
+				pass
+			raise e
+		finally:
+			connection.close()
+			self.duration = TM.perf_counter() - started
+			# Scripts may change any table, so every table of the database is fetched again whatever its change marker.
+			self.tables._upgraded_()
+		return self.metrics()
+
+	def metrics(self) -> dict:
+		"""
+		Return the metrics of the running or the last run.
+
+		Returns:
+			dict: The database, scripts, statements, batches, errors, duration and statements_per_second.
+		"""
+		return {
+			'database': self.tables.name,
+			'scripts': len(self.files),
+			'statements': self.statements,
+			'batches': self.batches,
+			'errors': list(self.errors),
+			'duration': self.duration,
+			'statements_per_second': self.statements / self.duration if self.duration > 0 else 0.0
+		}
+
+	@staticmethod
+	def parallel(runners: list, workers: int = 4) -> list:
+		"""
+		Run several independent script sets at once, e.g. on several databases, each on a thread and a connection of its own.
+
+		Args:
+			runners (list): The ScriptRunner objects to run.
+			workers (int, optional): The number of runners running at the same time. Defaults to 4.
+
+		Returns:
+			list: The metrics of every runner, in the order of 'runners'.
+
+		Raises:
+			QueryException: The first error of a runner, after all other runners have finished.
+		"""
+		with ThreadPoolExecutor(max_workers=max(int(workers), 1), thread_name_prefix='pytopconnect-script') as executor:
+			futures = [executor.submit(runner.run) for runner in runners]
+		return [future.result() for future in futures]
@@ -0,0 +1,230 @@
+import os
+import json
+import queue
+import tempfile
+import threading
+import time as TM
+from .condition import QueryException
+from .database import Items, Tables
+
+def __schema__(source: Items, target: Tables, columns: list) -> dict:
+	"""
+	Build the column definitions of the target table from the field types of the source table.
+	"""
+	fields = source.types()
+	primary = [c for c in columns if fields.get(c, {}).get('is_primary')]
+	schema = {}
+	for column in sorted(columns, key=lambda c: fields.get(c, {}).get('number', 0)):
+		field = fields.get(column, {})
+		schema[column] = (
+			target.dataTypes.convert(field.get('type'), column in primary),
+			target.dataTypes.NULL(False) if field.get('required') or column in primary else None,
+			target.dataTypes.PRIMARY() if primary == [column] else None
+		)
+	# A composite key is declared after the columns.
+	if len(primary) > 1:
+		schema['PRIMARY KEY'] = f"({', '.join(primary)})"
+	return schema
+
+def __exists__(target: Tables, connection, name: str) -> bool:
+	"""
+	Check in the database, not in the mirror, whether a table exists.
+	"""
+	names = set()
+	# SQLite lists the names, MySQL and PostgreSQL a tuple of them.
+	for value in target._query_('SHOW_TABLE', connection=connection) or ():
+		names.update(value if isinstance(value, (list, tuple)) else [value])
+	return name in names
+
+def __ordered__(source: Items, key: list) -> bool:
+	"""
+	Check whether every key column sorts the same in any DBMS, which text under different collations does not.
+	"""
+	fields = source.types()
+	families = ['bool', 'tinyint', 'smallint', 'int', 'bigint', 'float', 'double', 'decimal', 'date', 'time', 'datetime', 'year']
+	return all(source.parent.dataTypes.family(fields.get(k, {}).get('type')) in families for k in key)
+
+def __last__(target: Tables, connection, name: str, key: list):
+	"""
+	Return the largest key of the target table, None if the table is empty.
+	"""
+	order = ', '.join(f'{name}.{k} DESC' for k in key)
+	batches = target._query_('STREAM', {name: key}, {'condition': f'ORDER BY {order} LIMIT 1', 'size': 1}, connection=connection)
+	try:
+		rows = next(batches, [])
+	finally:
+		batches.close()
+	return list(rows[0]) if len(rows) > 0 else None
+
+def copy_table(source: Items, target: Tables, table: str = None, columns: list = None, key=None, chunk: int = 1000, size: int = None, queue_size: int = 4, checkpoint: str = None, resume: bool = True, create: bool = True) -> dict:
+	"""
+	Copy a table to another database, also of another DBMS, without loading it into memory.
+
+	If the target table does not exist it is created, with the column types of the source mapped
+	through DataTypes.convert of the target. A reader thread streams the source in key order with a
+	server-side cursor over a connection of its own and hands the batches to the caller through a
+	bounded queue, so reading and writing overlap while at most 'queue_size' batches are held in
+	memory. Every batch is written with the bulk insert of the target over a connection of its own
+	and committed, and then the last key of the batch is saved in a checkpoint file. If a copy is
+	interrupted, the next call with the same arguments continues after the newer of that key and
+	the largest key already in the target table, since a batch may be committed without its
+	checkpoint. Text keys may sort differently in the target, so they resume from the checkpoint
+	only. Whether the target table exists is asked of the database, not of its mirror.
+
+	Args:
+		source (Items): The table to copy.
+		target (Tables): The database to copy to.
+		table (str, optional): The name of the target table. Defaults to the name of the source table.
+		columns (list, optional): The columns to copy. Defaults to all columns.
+		key (Union[str, list], optional): The key columns the copy is ordered and resumed by. Defaults to the
+										  primary key. A table without one is copied unordered when resume is False.
+		chunk (int, optional): The maximum number of rows per insert statement. Defaults to 1000.
+		size (int, optional): The number of rows per batch and commit. Defaults to chunk.
+		queue_size (int, optional): The number of batches the reader may be ahead of the writer. Defaults to 4.
+		checkpoint (str, optional): The checkpoint file. Defaults to a file in the temporary directory named
+									after the source and target tables.
+		resume (bool, optional): If True, a copy continues after the key saved in the checkpoint. Defaults to True.
+		create (bool, optional): If True, a missing target table is created. Defaults to True.
+
+	Returns:
+		dict: The table, rows (copied by this call), total_rows, batches, created, resumed, duration,
+			read_wait (seconds the writer waited for the reader) and write_time.
+
+	Raises:
+		QueryException: If the arguments are invalid, the target table is missing and create is False,
+						or reading or writing fails. The checkpoint is kept in that case.
+	"""
+	if not isinstance(source, Items) or not isinstance(target, Tables):
+		raise QueryException(f"Data types do not match")
+	name = source.table if table is None else table
+	columns = list(source.ALL_COLUMNS if columns is None else columns)
+	if not source.is_column(*columns):
+		raise QueryException(f"Column does not exist. Existing columns in your table {source.ALL_COLUMNS}")
+	try:
+		key = source.__key__(key)
+	except QueryException as e:
+		if resume:
+			raise e
+		key = []
+	columns += [k for k in key if k not in columns]
+	size = max(int(chunk if size is None else size), 1)
+	if checkpoint is None:
+		checkpoint = os.path.join(tempfile.gettempdir(), f'pytopconnect-copy-{source.parent.name}-{source.table}-{target.name}-{name}.json')
+	state = {'key': key, 'last': None, 'rows': 0}
+	restart = resume and len(key) > 0 and os.path.isfile(checkpoint)
+	if restart:
+		with open(checkpoint, 'r', encoding='utf-8') as file:
+			state = json.load(file)
+		if state.get('key') != key:
+			raise QueryException(f"The checkpoint '{checkpoint}' was written for the key {state.get('key')}")
+	def save(state):
+		with open(checkpoint + '.tmp', 'w', encoding='utf-8') as file:
+			json.dump(state, file, default=str)
+		os.replace(checkpoint + '.tmp', checkpoint)
+	metrics = {'table': name, 'rows': 0, 'total_rows': state['rows'], 'batches': 0, 'created': False, 'resumed': False, 'duration': 0.0, 'read_wait': 0.0, 'write_time': 0.0}
+	started = TM.perf_counter()
+	writer = target._connection_().clone()
+	try:
+		# The mirror of the target is only reloaded after a successful copy, so the database is asked.
+		if not __exists__(target, writer, name):
+			if not create:
+				raise QueryException(f"The '{name}' table does not exist in '{target.name}'")
+			target._query_('CREATE', {name: __schema__(source, target, columns)}, {}, connection=writer)
+			writer.commit()
+			metrics['created'] = True
+			# A checkpoint left for a table that no longer exists is not continued.
+			state, restart = {'key': key, 'last': None, 'rows': 0}, False
+		elif restart and __ordered__(source, key):
+			# A batch can be committed without its checkpoint, so the copy continues after the newer of both keys.
+			last = __last__(target, writer, name, key)
+			try:
+				newer = last is not None and (state['last'] is None or tuple(last) > tuple(state['last']))
+			except TypeError:
+				newer = last is not None
+			if newer:
+				state['last'] = [source.to_value(v) for v in last]
+		if len(key) > 0 and not restart:
+			# A copy interrupted before its first checkpoint is resumed as well.
+			save(state)
+	except BaseException as e:
+		writer.close()
+		raise e
+	resumed = state['last'] is not None
+	metrics['resumed'] = resumed
+	condition = ''
+	if len(key) > 0:
+		keys = ','.join(f'{source.table}.{k}' for k in key)
+		if resumed:
+			condition = f"WHERE ({keys}) > ({','.join(map(source.to_str, state['last']))}) "
+		condition += f'ORDER BY {keys}'
+	stop = threading.Event()
+	end = object()
+	channel = queue.Queue(maxsize=max(int(queue_size), 1))
+	def send(item):
+		# The writer stops emptying the queue after an error, so waiting ends with it.
+		while not stop.is_set():
+			try:
+				channel.put(item, timeout=0.1)
+				return True
+			except queue.Full:
+				pass
+		return False
+	def read():
+		connection = None
+		try:
+			connection = source._connection_().clone()
+			batches = connection.query_f('STREAM', {source.table: columns}, {'condition': condition, 'size': size})
+			try:
+				for batch in batches:
+					if not send(batch):
+						return
+			finally:
+				batches.close()
+			send(end)
+		except BaseException as e:
+			send(e)
+		finally:
+			if connection is not None:
+				connection.close()
+	reader = None
+	try:
+		reader = threading.Thread(target=read, name=f'pytopconnect-copy-{name}', daemon=True)
+		reader.start()
+		index = [columns.index(k) for k in key]
+		while True:
+			waited = TM.perf_counter()
+			batch = channel.get()
+			metrics['read_wait'] += TM.perf_counter() - waited
+			if batch is end:
+				break
+			if isinstance(batch, BaseException):
+				raise batch
+			written = TM.perf_counter()
+			target._query_('BULK_INSERT', {name: {
+				'columns': columns,
+				'values': [list(map(source.to_value, row)) for row in batch]
+			}}, {'chunk': chunk}, connection=writer)
+			writer.commit()
+			metrics['write_time'] += TM.perf_counter() - written
+			metrics['rows'] += len(batch)
+			metrics['total_rows'] += len(batch)
+			metrics['batches'] += 1
+			if len(key) > 0:
+				save({'key': key, 'last': [source.to_value(batch[-1][i]) for i in index], 'rows': metrics['total_rows']})
+	except BaseException as e:
+		try:
+			writer.rollback()
+		except BaseException:
+			pass
+		raise e
+	finally:
+		stop.set()
+		if reader is not None:
+			reader.join()
+		writer.close()
+		metrics['duration'] = TM.perf_counter() - started
+	if os.path.isfile(checkpoint):
+		os.remove(checkpoint)
+	# The new rows and tables become visible in the mirrors with the next reload.
+	target._upgraded_()
+	return metrics
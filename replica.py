@@ -0,0 +1,326 @@
+import threading
+import time as TM
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pandas import Series
+from .condition import QueryException, Condition
+from .scheduler import get_scheduler
+
+class Replica:
+	"""
+	A class representing one secondary target of a ReplicatedTable and its queue of pending writes.
+
+	Args:
+		items (Items): The secondary table.
+
+	Attributes:
+		applied (int): The number of writes applied.
+		errors (int): The number of failed attempts.
+		retries (int): The number of attempts that repeated a failed write.
+		dropped (int): The number of writes given up after max_retries.
+		last_error (BaseException): The exception of the last failed attempt.
+		last_applied (float): The time of the last applied write as a UNIX timestamp.
+	"""
+
+	def __init__(self, items):
+		self.items = items
+		self.applied = 0
+		self.errors = 0
+		self.retries = 0
+		self.dropped = 0
+		self.last_error = None
+		self.last_applied = None
+		self.pending = deque()
+		self.lock = threading.Lock()
+		self.draining = False
+		self.attempts = 0
+		self.connection = None
+		self.fields = None
+		self.keys = {}
+
+	def __str__(self):
+		return f'Replica ({self.items.table}) => {len(self.pending)} pending'
+
+	def lag(self) -> float:
+		"""
+		Return how far the target is behind the primary.
+
+		Returns:
+			float: The seconds the oldest pending write has been waiting, 0 if nothing is pending.
+		"""
+		with self.lock:
+			return TM.time() - self.pending[0][0] if len(self.pending) > 0 else 0.0
+
+	def metrics(self) -> dict:
+		"""
+		Return the replication metrics of the target.
+
+		Returns:
+			dict: The table, database, pending, lag, applied, errors, retries, dropped, last_error and last_applied.
+		"""
+		return {
+			'table': self.items.table,
+			'database': getattr(self.items.parent, 'name', None),
+			'pending': len(self.pending),
+			'lag': self.lag(),
+			'applied': self.applied,
+			'errors': self.errors,
+			'retries': self.retries,
+			'dropped': self.dropped,
+			'last_error': None if self.last_error is None else str(self.last_error),
+			'last_applied': self.last_applied
+		}
+
+class ReplicatedTable:
+	"""
+	A class representing a table written to several databases at once, e.g. during a migration.
+
+	Every add, update and delete is run on the primary table first, in the calling thread and with
+	its normal result and exceptions. It is then queued for every secondary table, and the
+	secondaries are written concurrently by a pool of worker threads, so the caller waits for the
+	primary only. Each secondary applies its writes in order, over a connection of its own, and
+	commits every write. A failed write stays at the head of the queue of its target and is retried
+	on the shared scheduler, while later writes wait behind it and the primary keeps working.
+
+	Keys generated by add() are generated per target, after the largest key in its database; pass the
+	key columns with the rows where the targets must hold identical keys. Conditions are sent to every
+	target as SQL, so the tables must have the same name and columns. The worker threads do not change
+	the mirrors of the secondaries, which are refreshed by a reload after the writes instead.
+
+	Args:
+		primary (Items): The table whose result is returned.
+		*secondaries (Items): The tables the writes are replicated to.
+		workers (int, optional): The number of threads applying the writes to the secondaries. Defaults to 4.
+		retry (float, optional): The seconds before a failed write is tried again. Defaults to 5.
+		max_retries (int, optional): A write that failed this many times more is dropped. Defaults to retrying forever.
+		on_error (callable, optional): Called as on_error(exception, items, method) on every failed attempt.
+
+	Raises:
+		QueryException: If a secondary table has another name or misses a column of the primary.
+	"""
+
+	def __init__(self, primary, *secondaries, workers: int = 4, retry: float = 5.0, max_retries: int = None, on_error=None):
+		for items in secondaries:
+			if items.table != primary.table:
+				raise QueryException(f"The '{items.table}' table cannot replicate '{primary.table}', the table names must be equal")
+			if not items.is_column(*primary.ALL_COLUMNS):
+				raise QueryException(f"The '{items.table}' table of '{items.parent.name}' does not have all columns {primary.ALL_COLUMNS}")
+		self.primary = primary
+		self.replicas = [Replica(items) for items in secondaries]
+		self.retry = max(float(retry), 0.0)
+		self.max_retries = max_retries
+		self.on_error = on_error
+		self.closed = False
+		self.__executor = ThreadPoolExecutor(max_workers=max(int(workers), 1), thread_name_prefix='pytopconnect-replica')
+		self.__idle = threading.Condition()
+
+	def __str__(self):
+		return f'ReplicatedTable ({self.primary.table}) => {len(self.replicas)} secondaries, {sum(len(r.pending) for r in self.replicas)} pending'
+
+	def add(self, values: list, columns: list) -> bool:
+		"""
+		Add rows to the primary table and queue them for the secondary tables.
+
+		Args:
+			values (list): A list of rows, each a list of values in the order of 'columns'.
+			columns (list): A list of column names corresponding to the values.
+
+		Returns:
+			bool: The result of add() on the primary table.
+		"""
+		# add() turns the rows into dictionaries in place, so every target gets a copy of the original rows.
+		rows = [list(value) for value in values]
+		if not self.primary.add(values, columns):
+			return False
+		self.__publish__('add', lambda: ([list(row) for row in rows], list(columns)))
+		return True
+
+	def update(self, items: dict, condition: Condition = Condition()) -> bool:
+		"""
+		Update rows of the primary table and queue the update for the secondary tables.
+
+		Args:
+			items (dict): A dictionary containing the fields and their new values to be updated.
+			condition (Condition, optional): A condition object to filter which records to update.
+
+		Returns:
+			bool: The result of update() on the primary table.
+		"""
+		if not self.primary.update(items, condition):
+			return False
+		items = dict(items)
+		self.__publish__('update', lambda: (items, condition))
+		return True
+
+	def delete(self, condition: Condition = Condition()) -> bool:
+		"""
+		Delete rows of the primary table and queue the delete for the secondary tables.
+
+		Args:
+			condition (Condition, optional): A condition object to filter which records to delete.
+
+		Returns:
+			bool: The result of delete() on the primary table.
+		"""
+		if not self.primary.delete(condition):
+			return False
+		self.__publish__('delete', lambda: (condition,))
+		return True
+
+	def __publish__(self, method: str, args):
+		"""
+		Queue a write for every secondary and start draining the idle ones.
+		"""
+		if self.closed:
+			raise QueryException('The replicated table is closed')
+		now = TM.time()
+		for replica in self.replicas:
+			with replica.lock:
+				replica.pending.append((now, method, args()))
+				start = not replica.draining
+				replica.draining = True
+			if start:
+				self.__executor.submit(self.__drain__, replica)
+
+	def __write__(self, replica: Replica, method: str, args: tuple):
+		"""
+		Apply one write to a secondary over its own connection and commit it.
+		"""
+		items = replica.items
+		if replica.connection is None:
+			replica.connection = items._connection_().clone()
+			replica.fields, replica.keys = None, {}
+		query = lambda *a: items._query_(*a, connection=replica.connection)
+		if method == 'add':
+			values, columns = args
+			if replica.fields is None:
+				replica.fields = items.__types__(query('FIELDS', [items.table]))
+			generated = [k for k, v in replica.fields.items() if v.get('is_primary') and k not in columns]
+			for column in generated:
+				# The mirror is not changed here, so new keys follow the largest key in the database.
+				if column not in replica.keys:
+					replica.keys[column] = tuple(query('KEY_RANGE', {items.table: column}).values())[0][1]
+				replica.fields[column]['values'] = Series([] if replica.keys[column] is None else [replica.keys[column]], dtype=object)
+			# added() turns the rows into dictionaries in place, so a retry starts from the queued rows again.
+			values = items.added([list(value) for value in values], columns, replica.fields)
+			if not query('INSERT', items.__add_query__(values, columns)):
+				raise QueryException(f"The rows were not added to '{items.table}' of '{items.parent.name}'")
+			replica.connection.commit()
+			for column in generated:
+				replica.keys[column] = max(value[column] for value in values)
+		elif method == 'update':
+			values, condition = args
+			if not query('UPDATE', {items.table: {k: items.to_str(v) for k, v in values.items() if k in items.ALL_COLUMNS}}, condition):
+				raise QueryException(f"The rows of '{items.table}' of '{items.parent.name}' were not updated")
+			replica.connection.commit()
+		else:
+			condition, = args
+			if not query('DELETE', [items.table], condition):
+				raise QueryException(f"The rows of '{items.table}' of '{items.parent.name}' were not deleted")
+			replica.connection.commit()
+		# Only the thread owning the mirror changes it, by the coalesced reload of the database.
+		items._upgraded_()
+
+	def __drain__(self, replica: Replica):
+		"""
+		Apply the pending writes of a secondary in order until its queue is empty or a write fails.
+		"""
+		while True:
+			with replica.lock:
+				if len(replica.pending) == 0:
+					replica.draining = False
+					break
+				_, method, args = replica.pending[0]
+			try:
+				self.__write__(replica, method, args)
+			except BaseException as e:
+				replica.errors += 1
+				replica.last_error = e
+				if replica.attempts > 0:
+					replica.retries += 1
+				replica.attempts += 1
+				if replica.connection is not None:
+					# A broken connection is opened again by the next attempt.
+					try:
+						replica.connection.rollback()
+						replica.connection.close()
+					except BaseException:
+						pass
+					replica.connection = None
+				if self.on_error is not None:
+					try:
+						self.on_error(e, replica.items, method)
+					except BaseException:
+						pass
+				if self.max_retries is None or replica.attempts <= self.max_retries:
+					get_scheduler().once(self.retry, self.__retry__, args=(replica,), name=f'replica.{replica.items.table}')
+					break
+				replica.dropped += 1
+			else:
+				replica.applied += 1
+				replica.last_applied = TM.time()
+			with replica.lock:
+				replica.pending.popleft()
+				replica.attempts = 0
+		with self.__idle:
+			self.__idle.notify_all()
+
+	def __retry__(self, replica: Replica):
+		"""
+		Drain a secondary again after a failed write, unless the table has been closed.
+		"""
+		if self.closed:
+			with replica.lock:
+				replica.draining = False
+			return
+		self.__executor.submit(self.__drain__, replica)
+
+	def flush(self, timeout: float = None) -> bool:
+		"""
+		Wait until every secondary has applied its pending writes.
+
+		Args:
+			timeout (float, optional): The maximum time in seconds to wait. Defaults to no limit.
+
+		Returns:
+			bool: True if nothing is pending, False if the wait timed out.
+		"""
+		with self.__idle:
+			return self.__idle.wait_for(lambda: all(len(r.pending) == 0 for r in self.replicas), timeout)
+
+	def lag(self) -> dict:
+		"""
+		Return how far every secondary is behind the primary.
+
+		Returns:
+			dict: The seconds the oldest pending write has been waiting, keyed by database name.
+		"""
+		return {getattr(r.items.parent, 'name', i): r.lag() for i, r in enumerate(self.replicas)}
+
+	def metrics(self) -> list:
+		"""
+		Return the replication metrics of every secondary.
+
+		Returns:
+			list: One dictionary per secondary, see Replica.metrics.
+		"""
+		return [replica.metrics() for replica in self.replicas]
+
+	def close(self, timeout: float = None) -> bool:
+		"""
+		Wait for the pending writes, stop the worker threads and close the connections of the secondaries.
+
+		Args:
+			timeout (float, optional): The maximum time in seconds to wait for the pending writes. Defaults to no limit.
+
+		Returns:
+			bool: True if every pending write was applied, False if writes were left in the queues.
+		"""
+		done = self.flush(timeout)
+		self.closed = True
+		self.__executor.shutdown(wait=True)
+		for replica in self.replicas:
+			if replica.connection is not None:
+				replica.connection.close()
+				replica.connection = None
+		return done
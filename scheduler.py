@@ -0,0 +1,393 @@
+import heapq
+import random
+import threading
+import traceback
+import time as TM
+
+class Job:
+	"""
+	A class representing one job of a Scheduler.
+
+	A job runs a function once after a delay or every 'interval' seconds. A job is never run twice at
+	the same time: when a periodic job is due while its previous run is still going on, the run is
+	skipped and counted.
+
+	Args:
+		scheduler (Scheduler): The scheduler that runs the job.
+		func (callable): The function to run.
+		args (tuple, optional): Positional arguments of the function.
+		kwargs (dict, optional): Keyword arguments of the function.
+		interval (float, optional): The time between runs in seconds, None for a job that runs once.
+		jitter (float, optional): Up to this many seconds are added at random to every wait. Defaults to 0.
+		timeout (float, optional): A run that takes longer is reported to on_error as TimeoutError. Defaults to no limit.
+		on_error (callable, optional): Called as on_error(exception) when a run fails or times out.
+		name (str, optional): The name shown in metrics(). Defaults to the function name.
+
+	Attributes:
+		runs (int): The number of completed runs.
+		failures (int): The number of runs that raised an exception.
+		skipped (int): The number of runs skipped because the previous run was still going on.
+		coalesced (int): The number of requests merged into a run that was already pending.
+		timeouts (int): The number of runs that took longer than 'timeout'.
+		duration (float): The time the last run took in seconds.
+		last_run (float): The time the last run finished as a UNIX timestamp.
+		last_error (BaseException): The exception of the last failed run.
+	"""
+
+	def __init__(self, scheduler, func, args=None, kwargs=None, interval: float = None, jitter: float = 0.0, timeout: float = None, on_error=None, name: str = None):
+		self.scheduler = scheduler
+		self.func = func
+		self.args = tuple(args or ())
+		self.kwargs = dict(kwargs or {})
+		self.interval = None if interval is None else max(float(interval), 0.0)
+		self.jitter = max(float(jitter), 0.0)
+		self.timeout = timeout
+		self.on_error = on_error
+		self.name = name or getattr(func, '__name__', None) or repr(func)
+		self.key = None
+		self.runs = 0
+		self.failures = 0
+		self.skipped = 0
+		self.coalesced = 0
+		self.timeouts = 0
+		self.duration = 0.0
+		self.last_run = None
+		self.last_error = None
+		self.cancelled = False
+		self.pending = False
+		self.running = False
+		self.again = False
+		self.started = None
+		self.timed_out = False
+
+	def __str__(self):
+		return f'Job ({self.name}) => {"cancelled" if self.cancelled else "running" if self.running else "pending" if self.pending else "done"}'
+
+	def delay(self) -> float:
+		"""
+		Return the wait before the next run, including the jitter.
+		"""
+		return (self.interval or 0.0) + (random.uniform(0.0, self.jitter) if self.jitter > 0 else 0.0)
+
+	def is_active(self) -> bool:
+		"""
+		Check if the job will run again or is running.
+
+		Returns:
+			bool: True if the job is pending or running and was not cancelled.
+		"""
+		return not self.cancelled and (self.pending or self.running)
+
+	def cancel(self):
+		"""
+		Stop the job. A run that is going on is finished, no further run is started.
+		"""
+		self.scheduler.cancel(self)
+
+	def metrics(self) -> dict:
+		"""
+		Return the run metrics of the job.
+
+		Returns:
+			dict: The name, interval, runs, failures, skipped, coalesced, timeouts, duration, last_run and running.
+		"""
+		return {
+			'name': self.name,
+			'interval': self.interval,
+			'runs': self.runs,
+			'failures': self.failures,
+			'skipped': self.skipped,
+			'coalesced': self.coalesced,
+			'timeouts': self.timeouts,
+			'duration': self.duration,
+			'last_run': self.last_run,
+			'running': self.running
+		}
+
+class Scheduler:
+	"""
+	A class representing one scheduler for all periodic and deferred work of the module.
+
+	One dispatcher thread keeps the jobs in a heap ordered by their next run and hands due jobs to a
+	fixed number of worker threads, so any number of table refreshes, buffer flushes and health
+	checks share 'workers' threads instead of holding one thread each. Threads are started on the
+	first job and are daemon threads, so a hanging job does not keep the interpreter alive.
+
+	Args:
+		workers (int, optional): The maximum number of jobs that run at the same time. Defaults to 4.
+	"""
+
+	def __init__(self, workers: int = 4):
+		self.workers = max(int(workers), 1)
+		self.__heap = []
+		self.__ready = []
+		self.__keys = {}
+		self.__jobs = []
+		self.__count = 0
+		self.__threads = []
+		self.__closed = False
+		self.__cond = threading.Condition()
+
+	def __str__(self):
+		return f'Scheduler ({self.workers} workers) => {len(self.jobs())} jobs'
+
+	def every(self, interval: float, func, args=None, kwargs=None, jitter: float = 0.0, timeout: float = None, on_error=None, name: str = None, delay: float = None) -> Job:
+		"""
+		Run a function every 'interval' seconds.
+
+		Args:
+			interval (float): The time between the runs in seconds.
+			func (callable): The function to run.
+			args (tuple, optional): Positional arguments of the function.
+			kwargs (dict, optional): Keyword arguments of the function.
+			jitter (float, optional): Up to this many seconds are added at random to every wait, so that
+									  jobs started together do not run together. Defaults to 0.
+			timeout (float, optional): A run that takes longer is reported to on_error as TimeoutError. Defaults to no limit.
+			on_error (callable, optional): Called as on_error(exception) when a run fails or times out.
+			name (str, optional): The name shown in metrics(). Defaults to the function name.
+			delay (float, optional): The time before the first run. Defaults to the interval.
+
+		Returns:
+			Job: The scheduled job.
+		"""
+		job = Job(self, func, args, kwargs, interval, jitter, timeout, on_error, name)
+		with self.__cond:
+			self.__push__(job, job.delay() if delay is None else delay)
+			self.__jobs.append(job)
+		return job
+
+	def once(self, delay: float, func, args=None, kwargs=None, timeout: float = None, on_error=None, name: str = None) -> Job:
+		"""
+		Run a function once after 'delay' seconds.
+
+		Args:
+			delay (float): The time before the run in seconds.
+			func (callable): The function to run.
+			args (tuple, optional): Positional arguments of the function.
+			kwargs (dict, optional): Keyword arguments of the function.
+			timeout (float, optional): A run that takes longer is reported to on_error as TimeoutError. Defaults to no limit.
+			on_error (callable, optional): Called as on_error(exception) when the run fails or times out.
+			name (str, optional): The name shown in metrics(). Defaults to the function name.
+
+		Returns:
+			Job: The scheduled job.
+		"""
+		job = Job(self, func, args, kwargs, None, 0.0, timeout, on_error, name)
+		with self.__cond:
+			self.__push__(job, delay)
+			self.__jobs.append(job)
+		return job
+
+	def submit(self, key, func, args=None, kwargs=None, timeout: float = None, on_error=None, name: str = None) -> Job:
+		"""
+		Run a function as soon as a worker is free, merging repeated requests with the same key.
+
+		A request made while the job of the key is still waiting is merged into it. A request made
+		while it is running makes it run once more after it finishes, so a burst of requests results
+		in at most two runs and the last run always starts after the last request.
+
+		Args:
+			key: Any hashable value identifying the work, e.g. ('reload', id(obj)).
+			func (callable): The function to run.
+			args (tuple, optional): Positional arguments of the function.
+			kwargs (dict, optional): Keyword arguments of the function.
+			timeout (float, optional): A run that takes longer is reported to on_error as TimeoutError. Defaults to no limit.
+			on_error (callable, optional): Called as on_error(exception) when the run fails or times out.
+			name (str, optional): The name shown in metrics(). Defaults to the function name.
+
+		Returns:
+			Job: The job of the key.
+		"""
+		with self.__cond:
+			job = self.__keys.get(key)
+			if job is not None and not job.cancelled and (job.pending or job.running):
+				job.coalesced += 1
+				if not job.pending:
+					job.again = True
+				return job
+			job = Job(self, func, args, kwargs, None, 0.0, timeout, on_error, name)
+			job.key = key
+			self.__keys[key] = job
+			self.__push__(job, 0.0)
+			self.__jobs.append(job)
+			return job
+
+	def cancel(self, job: Job):
+		"""
+		Stop a job. A run that is going on is finished, no further run is started.
+
+		Args:
+			job (Job): The job to stop.
+		"""
+		with self.__cond:
+			job.cancelled = True
+			job.pending = False
+			job.again = False
+			if job.key is not None and self.__keys.get(job.key) is job:
+				del self.__keys[job.key]
+			self.__cond.notify_all()
+
+	def jobs(self) -> list:
+		"""
+		Return the jobs that are pending or running.
+
+		Returns:
+			list: The active Job objects.
+		"""
+		with self.__cond:
+			self.__jobs = [job for job in self.__jobs if job.is_active()]
+			return list(self.__jobs)
+
+	def metrics(self) -> list:
+		"""
+		Return the metrics of the active jobs.
+
+		Returns:
+			list: One dictionary per job, see Job.metrics().
+		"""
+		return [job.metrics() for job in self.jobs()]
+
+	def shutdown(self, wait: float = None):
+		"""
+		Cancel all jobs and stop the threads.
+
+		Args:
+			wait (float, optional): The maximum time in seconds to wait for running jobs. Defaults to not waiting.
+		"""
+		with self.__cond:
+			self.__closed = True
+			for job in self.__jobs:
+				job.cancelled = True
+			self.__heap, self.__ready, self.__keys = [], [], {}
+			self.__cond.notify_all()
+		if wait is not None:
+			deadline = TM.monotonic() + wait
+			for thread in self.__threads:
+				thread.join(max(deadline - TM.monotonic(), 0.0))
+
+	def __push__(self, job: Job, delay: float):
+		"""
+		Put a job into the heap. The condition must be held by the caller.
+		"""
+		if self.__closed:
+			raise RuntimeError('The scheduler has been shut down')
+		job.pending = True
+		self.__count += 1
+		heapq.heappush(self.__heap, (TM.monotonic() + max(float(delay), 0.0), self.__count, job))
+		if len(self.__threads) == 0:
+			self.__threads.append(threading.Thread(target=self.__dispatch__, name='pytopconnect-scheduler', daemon=True))
+			for i in range(self.workers):
+				self.__threads.append(threading.Thread(target=self.__work__, name=f'pytopconnect-worker-{i}', daemon=True))
+			for thread in self.__threads:
+				thread.start()
+		self.__cond.notify_all()
+
+	def __dispatch__(self):
+		"""
+		Dispatcher loop that moves due jobs to the workers and reports jobs that exceed their timeout.
+		"""
+		while True:
+			late = []
+			with self.__cond:
+				if self.__closed:
+					return
+				now = TM.monotonic()
+				wake = []
+				self.__jobs = [job for job in self.__jobs if job.is_active()]
+				for job in self.__jobs:
+					# Jobs waiting for a free worker have not started yet and cannot be late.
+					if job.running and job.started is not None and job.timeout is not None and not job.timed_out:
+						if now - job.started >= job.timeout:
+							job.timed_out = True
+							job.timeouts += 1
+							late.append(job)
+						else:
+							wake.append(job.started + job.timeout)
+				while len(self.__heap) > 0 and self.__heap[0][0] <= now:
+					_, _, job = heapq.heappop(self.__heap)
+					if job.cancelled or not job.pending:
+						continue
+					job.pending = False
+					if job.running:
+						job.skipped += 1
+					else:
+						job.running = True
+						job.started = None
+						self.__ready.append(job)
+					if job.interval is not None:
+						self.__push__(job, job.delay())
+				if len(self.__heap) > 0:
+					wake.append(self.__heap[0][0])
+				self.__cond.notify_all()
+				if len(late) == 0:
+					self.__cond.wait(max(min(wake) - TM.monotonic(), 0.0) if len(wake) > 0 else None)
+			# Callbacks run outside of the lock so that they may use the scheduler.
+			for job in late:
+				self.__report__(job, TimeoutError(f"'{job.name}' has been running for more than {job.timeout} seconds"))
+
+	def __work__(self):
+		"""
+		Worker loop that runs the jobs handed over by the dispatcher.
+		"""
+		while True:
+			with self.__cond:
+				while len(self.__ready) == 0 and not self.__closed:
+					self.__cond.wait()
+				if self.__closed:
+					return
+				job = self.__ready.pop(0)
+				job.started = TM.monotonic()
+				job.timed_out = False
+				self.__cond.notify_all()
+			error = None
+			try:
+				job.func(*job.args, **job.kwargs)
+			except BaseException as e:
+				error = e
+			with self.__cond:
+				job.running = False
+				job.runs += 1
+				job.duration = TM.monotonic() - job.started
+				job.last_run = TM.time()
+				if error is not None:
+					job.failures += 1
+					job.last_error = error
+				if job.again and not job.cancelled:
+					job.again = False
+					self.__push__(job, 0.0)
+				elif job.key is not None and not job.pending and self.__keys.get(job.key) is job:
+					del self.__keys[job.key]
+				self.__cond.notify_all()
+			if error is not None:
+				self.__report__(job, error)
+
+	def __report__(self, job: Job, error: BaseException):
+		"""
+		Pass an error to the on_error callback of a job, or print it like an uncaught thread exception.
+		"""
+		try:
+			if job.on_error is not None:
+				job.on_error(error)
+			else:
+				traceback.print_exception(type(error), error, error.__traceback__)
+		except BaseException:
+			traceback.print_exc()
+
+__SCHEDULER__ = []
+
+__LOCK__ = threading.Lock()
+
+def get_scheduler(workers: int = None) -> Scheduler:
+	"""
+	Return the scheduler shared by the whole process, creating it on first use.
+
+	Args:
+		workers (int, optional): The number of worker threads, only used when the scheduler is created. Defaults to 4.
+
+	Returns:
+		Scheduler: The shared scheduler.
+	"""
+	with __LOCK__:
+		if len(__SCHEDULER__) == 0:
+			__SCHEDULER__.append(Scheduler(4 if workers is None else workers))
+		return __SCHEDULER__[0]
@@ -0,0 +1,243 @@
+import os
+import json
+import shutil
+import time as TM
+from functools import partial
+from pandas import Series, DataFrame
+from .condition import QueryException, NoneValue
+from .database import DataBase, Items
+
+class SharedConnection:
+	"""
+	A class representing the read-only connection of an attached shared mirror.
+
+	It answers the metadata requests that DataBase, Tables and Items make while they are built
+	from the published schema, and rejects every statement that would read from or write to the
+	database, so worker processes never open a connection of their own.
+
+	Args:
+		name (str): The database name used for the attributes (DB_NAME).
+		meta (dict): The published description of the database.
+	"""
+
+	READ_ONLY = ('SHOW_PROCEDURE', 'SHOW_FUNCTION', 'SHOW_TRIGGER', 'SHOW_INDEX', 'SHOW_FOREIGN')
+
+	SHARED = True
+
+	def __init__(self, name: str, meta: dict):
+		self.DB_NAME = name
+		self.DB_NAME_ORG = meta.get('name', name)
+		self.meta = meta
+		self.version = lambda : self.meta.get('version')
+
+	def __str__(self):
+		return f'SharedConnection ({self.DB_NAME_ORG})'
+
+	def query_f(self, method: str, que={}, req={}):
+		"""
+		Answer a metadata request from the published schema.
+
+		Args:
+			method (str): The method to be executed.
+			que (optional): The query parameters. For FIELDS a list with the table name.
+			req (optional): Additional request options, not used.
+
+		Returns:
+			The published field description for FIELDS, an empty catalog for CATALOG and an empty 
+			dictionary for SHOW_* requests.
+
+		Raises:
+			QueryException: For any other method, because a shared mirror is read-only.
+		"""
+		if method == 'VERSION':
+			return self.version()
+		if method == 'CATALOG':
+			return {'version': self.version(), 'procedures': {}, 'functions': {}, 'triggers': {}}
+		if method == 'FIELDS':
+			return self.meta['tables'].get(str(list(que)[0]), {}).get('fields', [])
+		if method in self.READ_ONLY:
+			return {}
+		raise QueryException(f"The shared mirror of '{self.DB_NAME_ORG}' is read-only, '{method}' is not available")
+
+	def is_active(self) -> bool:
+		return True
+
+	def open(self):
+		pass
+
+	def close(self):
+		pass
+
+	def commit(self):
+		pass
+
+	def rollback(self):
+		pass
+
+class SharedMirror:
+	"""
+	A class representing table mirrors shared between processes through memory-mapped Arrow files.
+
+	One loader process publishes the mirrors of a QueryRead object; every table is written as an
+	uncompressed Arrow IPC file into a new generation directory, and a manifest naming the current
+	generation is replaced atomically afterwards. Worker processes attach to the newest generation
+	and map the files read-only, so no worker queries the database. Numeric columns without NULLs
+	live once in the page cache (by default in /dev/shm) instead of once per process: the DataFrame
+	and the Column objects of an attached table are views of the mapped files. Text columns and
+	columns with NULLs become Python objects in every worker. The previous generation is kept until
+	the next publish so that workers still mapping it are not disturbed.
+
+	Args:
+		path (str, optional): The directory of the shared mirror. Defaults to '/dev/shm/pytopconnect'.
+
+	Attributes:
+		generation (int): The generation the mirror is attached to, 0 if it is not attached.
+
+	Raises:
+		QueryException: If pyarrow is not installed.
+	"""
+
+	def __init__(self, path: str = '/dev/shm/pytopconnect'):
+		try:
+			import pyarrow
+			import pyarrow.ipc
+		except ImportError:
+			raise QueryException("The shared mirror requires the 'pyarrow' package")
+		self.pa = pyarrow
+		self.path = os.path.abspath(path)
+		self.generation = 0
+		self.methods = []
+
+	def __str__(self):
+		return f'SharedMirror ({self.path}) => generation {self.generation}'
+
+	def __manifest__(self) -> dict:
+		"""
+		Read the manifest of the newest published generation.
+		"""
+		manifest = os.path.join(self.path, 'manifest.json')
+		if not os.path.isfile(manifest):
+			return {'generation': 0, 'methods': {}}
+		with open(manifest, 'r', encoding='utf-8') as file:
+			return json.load(file)
+
+	def published(self) -> int:
+		"""
+		Return the newest published generation.
+
+		Returns:
+			int: The generation number, 0 if nothing has been published yet.
+		"""
+		return int(self.__manifest__().get('generation', 0))
+
+	def publish(self, query_read) -> int:
+		"""
+		Publish the mirrors of a QueryRead object as a new generation.
+
+		Args:
+			query_read (QueryRead): The loaded databases to publish.
+
+		Returns:
+			int: The number of the published generation.
+
+		Raises:
+			QueryException: If a table cannot be converted to Arrow.
+		"""
+		generation = self.published() + 1
+		folder = f'gen-{generation:08d}'
+		root = os.path.join(self.path, folder)
+		os.makedirs(root, exist_ok=True)
+		methods = {}
+		try:
+			for method, data_base in vars(query_read).items():
+				if not isinstance(data_base, DataBase):
+					continue
+				methods[method] = {}
+				for name, tables in zip(data_base.names, data_base.data_bases):
+					os.makedirs(os.path.join(root, method, name), exist_ok=True)
+					meta = {'name': tables.db_name, 'version': tables.version, 'tables': {}}
+					for table in tables.get_tables():
+						items = getattr(tables, f'tc_{table}', None)
+						if not isinstance(items, Items):
+							continue
+						file = os.path.join(method, name, f'{table}.arrow')
+						try:
+							arrow = self.pa.Table.from_pandas(DataFrame(items), preserve_index=False)
+						except BaseException as e:
+							raise QueryException(f"The '{table}' table cannot be shared: {e}")
+						with self.pa.OSFile(os.path.join(root, file), 'wb') as sink:
+							with self.pa.ipc.new_file(sink, arrow.schema) as writer:
+								writer.write_table(arrow)
+						meta['tables'][table] = {
+							'file': file,
+							'columns': list(items.ALL_COLUMNS),
+							'fields': items._query_('FIELDS', [table])
+						}
+					methods[method][name] = meta
+			manifest = os.path.join(self.path, 'manifest.json')
+			with open(manifest + f'.{os.getpid()}.tmp', 'w', encoding='utf-8') as file:
+				json.dump({'generation': generation, 'folder': folder, 'time': TM.time(), 'methods': methods}, file, default=str)
+			os.replace(manifest + f'.{os.getpid()}.tmp', manifest)
+		except BaseException as e:
+			shutil.rmtree(root, ignore_errors=True)
+			raise e
+		for old in os.listdir(self.path):
+			if old.startswith('gen-') and old < f'gen-{generation - 1:08d}':
+				shutil.rmtree(os.path.join(self.path, old), ignore_errors=True)
+		return generation
+
+	def attach(self):
+		"""
+		Attach to the newest published generation.
+
+		The databases become attributes of this object under their DBMS names, in the same shape
+		as on QueryRead. The Items objects are read-only: any method that would query or change
+		the database raises QueryException.
+
+		Returns:
+			SharedMirror: This object.
+
+		Raises:
+			QueryException: If nothing has been published yet.
+		"""
+		manifest = self.__manifest__()
+		if int(manifest.get('generation', 0)) == 0:
+			raise QueryException(f"Nothing has been published to '{self.path}'")
+		root = os.path.join(self.path, manifest['folder'])
+		for method in self.methods:
+			delattr(self, method)
+		self.methods = []
+		for method, bases in manifest['methods'].items():
+			obj = Series(dtype=object)
+			for name, meta in bases.items():
+				connect = SharedConnection(name, meta)
+				cqr = ['_query_', '_upgraded_', '_connection_']
+				vqr = [connect.query_f, lambda *args, **kwargs: None, partial(lambda: connect)]
+				data_base = Series(dtype=object)
+				for table, info in meta['tables'].items():
+					source = self.pa.memory_map(os.path.join(root, info['file']), 'r')
+					data = self.pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+					if len(data) == 0:
+						data = DataFrame([dict(zip(info['columns'], [NoneValue()] * len(info['columns'])))])
+					for c, v in zip(cqr, vqr):
+						data[c] = [v] * len(data)
+					data_base[table] = data
+				for c, v in zip(cqr, vqr):
+					data_base[c] = v
+				obj[name] = data_base
+			setattr(self, method, DataBase(method, obj))
+			self.methods.append(method)
+		self.generation = int(manifest['generation'])
+		return self
+
+	def refresh(self) -> bool:
+		"""
+		Attach to a newer generation if one has been published.
+
+		Returns:
+			bool: True if a newer generation was attached, False if the mirror is up to date.
+		"""
+		if self.published() <= self.generation:
+			return False
+		self.attach()
+		return True
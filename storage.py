@@ -84,6 +84,8 @@ class Trigger:
 		if not self.db._query_('CREATE_TRIGGER',self):
 			return 
 		setattr(self.table,f'ttc_{self.name}',self)
+		if getattr(self.db,'catalog',None) is not None:
+			self.db.catalog['triggers'].setdefault(self.table.table,{})[self.name] = {'time':self.time,'event':self.event}
 		return self
 
 	def remove(self, if_exists: bool = True) -> bool:
@@ -104,6 +106,8 @@ class Trigger:
 		if not self.db._query_('DROP_TRIGGER',self.name,{'if_exists':if_exists}):
 			return False
 		delattr(self.table,f'ttc_{self.name}')
+		if getattr(self.db,'catalog',None) is not None:
+			self.db.catalog['triggers'].get(self.table.table,{}).pop(self.name,None)
 		del self
 		return True
 
@@ -225,6 +229,32 @@ class Function:
 		},self.list_paramets)
 		return result.get(self.name,None)
 
+	async def arun(self, *args, **kwargs):
+		"""
+		Execute the registered function like run() from a coroutine.
+
+		The call runs on the asyncio pool of the database (see Items.pool), so the event loop is 
+		not blocked while the database works.
+
+		Args:
+			*args: Positional arguments to be passed to the function.
+			**kwargs: Keyword arguments to be passed to the function.
+
+		Returns:
+			The result of the function execution, or None if the function does not return a value.
+
+		Raises:
+			Exception: If the number of provided arguments does not match the expected count.
+		"""
+		from .aio import get_pool
+		if len(args)!=self.count():
+			raise ValueError('Parameter lengths do not match')
+		result = await get_pool(self.db._query_, self.db._connection_()).query('RUN_FUNCTION',{
+			'function':self.name,
+			'parameters':list(map(self.to_str,args))
+		},self.list_paramets)
+		return result.get(self.name,None)
+
 	def remove(self, if_exists: bool = True) -> bool:
 		"""
 		Remove the registered function from the database.
@@ -367,6 +397,34 @@ class Procedure:
 			'call':kwargs.get('call',False)
 		},self.list_paramets)
 
+	async def arun(self, *args, **kwargs):
+		"""
+		Execute the registered stored procedure like run() from a coroutine.
+
+		The call runs on the asyncio pool of the database (see Items.pool), so the event loop is 
+		not blocked while the database works.
+
+		Args:
+			*args: Positional arguments to be passed to the stored procedure.
+			**kwargs: Keyword arguments to be passed to the stored procedure.
+
+		Returns:
+			The result of the stored procedure execution.
+
+		Raises:
+			ValueError: If the number of provided arguments does not match the expected count.
+		"""
+		from .aio import get_pool
+		if len(args)!=self.count():
+			raise ValueError('Parameter lengths do not match')
+		return await get_pool(self.db._query_, self.db._connection_()).query('RUN_PROCEDURE',{
+			'procedure':self.name,
+			'parameters_org':args,
+			'parameters':list(map(self.to_str,args)),
+			'params': list(map(lambda x: x[1].annotation(self.db.dataTypes),self.parameters.items())),
+			'call':kwargs.get('call',False)
+		},self.list_paramets)
+
 	def remove(self, if_exists: bool = True) -> bool:
 		"""
 		Remove the registered stored procedure from the database.
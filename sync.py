@@ -0,0 +1,329 @@
+import abc
+import json
+import threading
+import time as TM
+from datetime import datetime, date
+from pandas import DataFrame
+from .condition import QueryException, NoneValue
+from .scheduler import get_scheduler
+
+class SyncPolicy(abc.ABC):
+	"""
+	A class representing an incremental sync policy of one table mirror.
+
+	Subclasses must implement the abstract __apply__(query), which brings the mirror up to date and
+	returns the number of applied rows; this class serialises the syncs, keeps the metrics and runs
+	them in the background on request.
+
+	Args:
+		items (Items): The table mirror to keep in sync.
+		key (list, optional): The key columns used for the merge. Defaults to the primary key.
+
+	Attributes:
+		syncs (int): The number of completed syncs.
+		rows (int): The number of rows applied by the last sync.
+		total_rows (int): The number of rows applied by all syncs.
+		duration (float): The time the last sync took in seconds.
+		last_sync (float): The time of the last completed sync as a UNIX timestamp.
+	"""
+
+	def __init__(self, items, key: list = None):
+		self.items = items
+		self.key = items.__key__(key)
+		self.syncs = 0
+		self.rows = 0
+		self.total_rows = 0
+		self.duration = 0.0
+		self.last_sync = None
+		self.__lock = threading.Lock()
+		self.__job = None
+		self.__connection = None
+
+	def lag(self):
+		"""
+		Return how far the mirror is behind.
+
+		Returns:
+			float: The seconds since the last completed sync, or None before the first one.
+		"""
+		return TM.time() - self.last_sync if self.last_sync is not None else None
+
+	def metrics(self) -> dict:
+		"""
+		Return the sync metrics of the table.
+
+		Returns:
+			dict: The table, lag, syncs, rows, total_rows, duration and last_sync.
+		"""
+		return {
+			'table': self.items.table,
+			'lag': self.lag(),
+			'syncs': self.syncs,
+			'rows': self.rows,
+			'total_rows': self.total_rows,
+			'duration': self.duration,
+			'last_sync': self.last_sync
+		}
+
+	@abc.abstractmethod
+	def __apply__(self, query) -> int:
+		"""
+		Bring the mirror up to date with the rows read through query.
+
+		Args:
+			query (callable): The query function to read with.
+
+		Returns:
+			int: The number of applied rows.
+		"""
+
+	def sync(self, query=None) -> int:
+		"""
+		Bring the mirror up to date.
+
+		Args:
+			query (callable, optional): The query function to read with. Defaults to the connection of the table.
+
+		Returns:
+			int: The number of applied rows.
+		"""
+		with self.__lock:
+			started = TM.perf_counter()
+			try:
+				rows = self.__apply__(self.items._query_ if query is None else query)
+			except BaseException as e:
+				raise e
+			self.rows = rows
+			self.total_rows += rows
+			self.syncs += 1
+			self.duration = TM.perf_counter() - started
+			self.last_sync = TM.time()
+			return rows
+
+	def start(self, interval: float = 60.0, on_error=None, jitter: float = 0.0, timeout: float = None):
+		"""
+		Run sync() every 'interval' seconds on the shared scheduler until stop() is called.
+
+		The syncs read over their own connection so they never share the cursor of the main connection,
+		and a sync is skipped while the previous one is still running. The fetched rows are merged
+		under the LOCK of the table, which its write methods take as well.
+
+		Args:
+			interval (float, optional): The time between syncs in seconds. Defaults to 60.
+			on_error (callable, optional): Called as on_error(exception) when a sync fails or times out.
+			jitter (float, optional): Up to this many seconds are added at random to every wait. Defaults to 0.
+			timeout (float, optional): A sync that takes longer is reported to on_error as TimeoutError. Defaults to no limit.
+
+		Returns:
+			Job: The scheduled job.
+		"""
+		self.stop()
+		self.__job = get_scheduler().every(interval, self.__background__, jitter=jitter, timeout=timeout, on_error=on_error, name=f'sync.{self.items.table}')
+		return self.__job
+
+	def __background__(self):
+		"""
+		Run one scheduled sync over the connection of the background syncs.
+		"""
+		if self.__connection is None:
+			self.__connection = self.items._connection_().clone()
+		self.sync(self.__connection.query_f)
+
+	def stop(self):
+		"""
+		Stop the background syncs started with start().
+		"""
+		if self.__job is not None:
+			self.__job.cancel()
+			self.__job = None
+		# A sync that is still running holds the lock, so the connection is closed after it.
+		with self.__lock:
+			if self.__connection is not None:
+				self.__connection.close()
+				self.__connection = None
+
+class WatermarkSync(SyncPolicy):
+	"""
+	A class representing a delta sync policy of one table based on a high-watermark column.
+
+	The policy remembers the highest value of a monotonically growing column, such as an
+	auto-increment id or an 'updated_at' timestamp. Every sync() fetches only the rows at or past
+	that value and merges them into the mirror by primary key. Rows equal to the watermark are
+	fetched again so that rows committed later with the same value are not missed; the merge by
+	key makes this idempotent. Deletes and updates that do not move the column are not seen.
+
+	Args:
+		items (Items): The table mirror to keep in sync.
+		column (str): The watermark column.
+		key (list, optional): The key columns used for the merge. Defaults to the primary key.
+
+	Attributes:
+		watermark: The highest value of the column seen so far, None before the first sync of an empty table.
+	"""
+
+	def __init__(self, items, column: str, key: list = None):
+		if not items.is_column(column):
+			raise QueryException(f"Column does not exist. Existing columns in your table {items.ALL_COLUMNS}")
+		super().__init__(items, key)
+		self.column = column
+		self.watermark = self.__highest__(DataFrame(items))
+
+	def __str__(self):
+		return f'WatermarkSync ({self.items.table}.{self.column}) => {self.watermark}'
+
+	def __highest__(self, frame: DataFrame):
+		"""
+		Return the highest value of the watermark column in a frame as a plain Python value.
+		"""
+		if len(frame) == 0 or self.column not in frame.columns:
+			return None
+		values = frame[self.column][~frame[self.column].apply(lambda x: isinstance(x, NoneValue))].dropna()
+		return self.items.to_value(values.max()) if len(values) > 0 else None
+
+	def lag(self):
+		"""
+		Return how far the mirror is behind.
+
+		Returns:
+			float: For a date or time watermark, the seconds between now and the watermark.
+				Otherwise the seconds since the last completed sync, or None before the first one.
+		"""
+		if isinstance(self.watermark, datetime):
+			now = datetime.now(self.watermark.tzinfo) if self.watermark.tzinfo is not None else datetime.now()
+			return max((now - self.watermark).total_seconds(), 0.0)
+		if isinstance(self.watermark, date):
+			return max((datetime.now() - datetime.combine(self.watermark, datetime.min.time())).total_seconds(), 0.0)
+		return super().lag()
+
+	def metrics(self) -> dict:
+		"""
+		Return the sync metrics of the table.
+
+		Returns:
+			dict: The table, column, watermark, lag, syncs, rows, total_rows, duration and last_sync.
+		"""
+		return dict(super().metrics(), column=self.column, watermark=self.watermark)
+
+	def __apply__(self, query) -> int:
+		"""
+		Fetch the rows at or past the watermark and merge them into the mirror.
+		"""
+		items = self.items
+		columns = list(items.ALL_COLUMNS)
+		condition = '' if self.watermark is None else f'WHERE {items.table}.{self.column} >= {items.to_str(self.watermark)}'
+		rows = tuple(query('SELECT', {items.table: columns}, condition).values())[0]
+		frame = DataFrame(list(rows), columns=columns)
+		if len(frame) > 0:
+			with items.LOCK:
+				items.__merge_rows__(frame, self.key)
+				items.enjoin()
+			highest = self.__highest__(frame)
+			if highest is not None and (self.watermark is None or highest > self.watermark):
+				self.watermark = highest
+		return len(frame)
+
+class ChangeCapture(SyncPolicy):
+	"""
+	A class representing an exact incremental sync of one table from a trigger-backed changelog.
+
+	install() adds AFTER INSERT, UPDATE and DELETE triggers to the table that append (table, key,
+	op, seq) entries to a compact changelog table. Every sync() reads the new entries of the table,
+	fetches the current rows of the changed keys in chunks, merges the rows that still exist into the
+	mirror, drops the rows that were deleted and prunes the consumed entries. Because the rows are
+	read from the table rather than from the log, entries that commit out of sequence order are
+	applied correctly on the next sync.
+
+	Args:
+		items (Items): The table mirror to keep in sync.
+		key (list, optional): The key columns logged by the triggers. Defaults to the primary key.
+		log (str, optional): The name of the changelog table. Defaults to '_tc_changelog'.
+		prune (bool, optional): If True, consumed entries are deleted from the changelog. Set it to False 
+								when several processes read the same log and prune it with prune(). Defaults to True.
+		limit (int, optional): The maximum number of entries applied per sync. Defaults to 10000.
+
+	Attributes:
+		last_seq (int): The highest sequence number applied so far.
+	"""
+
+	def __init__(self, items, key: list = None, log: str = '_tc_changelog', prune: bool = True, limit: int = 10000):
+		super().__init__(items, key)
+		self.log = log
+		self.prune_log = prune
+		self.limit = max(int(limit), 1)
+		self.last_seq = 0
+
+	def __str__(self):
+		return f'ChangeCapture ({self.items.table}) => {self.log}#{self.last_seq}'
+
+	def install(self) -> bool:
+		"""
+		Create the changelog table if needed and install the capture triggers on the table.
+
+		Returns:
+			bool: True if the triggers were installed.
+		"""
+		return self.items._query_('CAPTURE', {self.items.table: {'key': self.key, 'log': self.log}}, {})
+
+	def remove(self) -> bool:
+		"""
+		Remove the capture triggers from the table. The changelog table is kept.
+
+		Returns:
+			bool: True if the triggers were removed.
+		"""
+		return self.items._query_('CAPTURE', {self.items.table: {'key': self.key, 'log': self.log}}, {'drop': True})
+
+	def prune(self, upto: int = None) -> bool:
+		"""
+		Delete changelog entries up to a sequence number, by default up to the last applied one.
+
+		Args:
+			upto (int, optional): The highest sequence number to delete. Defaults to last_seq.
+
+		Returns:
+			bool: True if the entries were deleted.
+		"""
+		return self.items._query_('PRUNE_CHANGES', {'log': self.log, 'upto': self.last_seq if upto is None else upto}, {})
+
+	def metrics(self) -> dict:
+		"""
+		Return the sync metrics of the table.
+
+		Returns:
+			dict: The table, changelog, last_seq, lag, syncs, rows, total_rows, duration and last_sync.
+		"""
+		return dict(super().metrics(), log=self.log, last_seq=self.last_seq)
+
+	def __apply__(self, query) -> int:
+		"""
+		Apply the changelog entries of the table to the mirror and return the number of changed keys.
+		"""
+		items = self.items
+		columns = list(items.ALL_COLUMNS)
+		# With pruning every entry still in the log is unapplied, so late commits below last_seq are read too.
+		entries = query('READ_CHANGES', {'log': self.log, 'tables': [items.table]}, {'after': 0 if self.prune_log else self.last_seq, 'limit': self.limit})
+		keys = list(dict.fromkeys(tuple(json.loads(entry[2])) for entry in entries))
+		rows = []
+		for i in range(0, len(keys), 1000):
+			chunk = keys[i:i+1000]
+			if len(self.key) == 1:
+				values = ','.join(items.to_str(k[0]) for k in chunk)
+				condition = f'WHERE {items.table}.{self.key[0]} IN ({values})'
+			else:
+				values = ','.join('(' + ','.join(map(items.to_str, k)) + ')' for k in chunk)
+				condition = f"WHERE ({','.join(map(lambda x: f'{items.table}.{x}', self.key))}) IN ({values})"
+			rows.extend(tuple(query('SELECT', {items.table: columns}, condition).values())[0])
+		frame = DataFrame(list(rows), columns=columns)
+		if len(keys) > 0:
+			current = set(items.__key_index__(frame, self.key).tolist()) if len(frame) > 0 else set()
+			gone = [k for k in keys if (k if len(self.key) > 1 else k[0]) not in current]
+			with items.LOCK:
+				if len(gone) > 0:
+					items.__drop_keys__(DataFrame(gone, columns=self.key), self.key)
+				items.__merge_rows__(frame, self.key)
+				items.enjoin()
+		if len(entries) > 0:
+			self.last_seq = max(self.last_seq, max(entry[0] for entry in entries))
+			if self.prune_log:
+				query('PRUNE_CHANGES', {'log': self.log, 'seq': [entry[0] for entry in entries]}, {})
+		return len(keys)
@@ -0,0 +1,44 @@
+import os
+import sys
+import sqlite3
+import importlib
+import warnings
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(PACKAGE_DIR))
+warnings.filterwarnings('ignore')
+
+@pytest.fixture(scope='session')
+def ptc():
+	"""
+	The package, imported by the name of its directory.
+	"""
+	return importlib.import_module(os.path.basename(PACKAGE_DIR))
+
+@pytest.fixture
+def sqlite_databases(ptc, tmp_path):
+	"""
+	Create SQLite databases from lists of SQL statements and open them with QueryRead.
+
+	Returns:
+		callable: Called as sqlite_databases(statements, ...) with one list of statements per database,
+				  returns the Tables of every database and their file paths. The connections may be 
+				  used by any thread unless check_same_thread=True is passed.
+	"""
+	def create(*databases, check_same_thread: bool = False, **kwargs):
+		paths = []
+		for i, statements in enumerate(databases):
+			path = str(tmp_path / f'db{i}.db')
+			connection = sqlite3.connect(path)
+			for statement in statements:
+				if isinstance(statement, tuple):
+					connection.executemany(*statement)
+				else:
+					connection.execute(statement)
+			connection.commit()
+			connection.close()
+			paths.append(path)
+		query = ptc.QueryRead({'sqlite': [{'dbFile': path, 'check_same_thread': check_same_thread} for path in paths]}, **kwargs)
+		return query.sqlite.data_bases, paths
+	return create
@@ -0,0 +1,41 @@
+import asyncio
+
+SCHEMA = [
+	'CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)',
+	('INSERT INTO notes VALUES (?, ?)', [(i, f'n{i}') for i in range(1, 11)])
+]
+
+def test_aget_and_astream_inside_a_running_loop(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	notes = data_base.tc_notes
+
+	async def main():
+		ticks = []
+		async def ticker():
+			while True:
+				ticks.append(1)
+				await asyncio.sleep(0)
+		task = asyncio.create_task(ticker())
+		try:
+			local, *selected = await asyncio.gather(
+				notes.aget(['id']),
+				*(notes.aget(['id', 'body'], sql=True) for _ in range(3))
+			)
+			batches = []
+			async for batch in notes.astream(['id'], size=4):
+				batches.append(list(batch['id']))
+			first = None
+			async for batch in notes.astream(size=3):
+				first = list(batch['id'])
+				break
+		finally:
+			task.cancel()
+		return local, selected, batches, first, ticks
+
+	local, selected, batches, first, ticks = asyncio.run(main())
+	assert list(local['id']) == list(range(1, 11))
+	assert all(rows == [{'id': i, 'body': f'n{i}'} for i in range(1, 11)] for rows in selected)
+	assert batches == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+	assert first == [1, 2, 3]
+	# The loop kept running other tasks while the queries ran on the pool threads.
+	assert len(ticks) > 1
@@ -0,0 +1,31 @@
+import sqlite3
+
+SCHEMA = ['CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL)', "INSERT INTO users VALUES (1, 'Ann')"]
+
+def rows(path) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return connection.execute('SELECT id, name FROM users ORDER BY id').fetchall()
+	finally:
+		connection.close()
+
+def test_buffered_keys_follow_the_database(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA, check_same_thread=True)
+	users = data_base.tc_users
+	# A row written by someone else is not in the mirror yet.
+	connection = sqlite3.connect(paths[0])
+	connection.execute("INSERT INTO users VALUES (2, 'Bob')")
+	connection.commit()
+	connection.close()
+	errors = []
+	buffer = users.buffer(rows=100, interval=60, on_error=lambda e, batch: errors.append(e))
+	try:
+		users.add([['Cid'], ['Dan']], ['name'])
+		assert buffer.flush(timeout=10)
+		assert errors == []
+		# The flushed rows reach the object the caller holds, as with an unbuffered insert.
+		assert list(users['id']) == [1, 3, 4]
+		assert list(users['name'])[-2:] == ['Cid', 'Dan']
+		assert rows(paths[0]) == [(1, 'Ann'), (2, 'Bob'), (3, 'Cid'), (4, 'Dan')]
+	finally:
+		buffer.close()
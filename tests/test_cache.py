@@ -0,0 +1,15 @@
+import os
+import importlib
+import pandas as pd
+
+def test_cached_tables_are_reused_only_while_unchanged(ptc, tmp_path):
+	cache = importlib.import_module(ptc.__name__ + '.cache').TableCache(str(tmp_path))
+	frame = pd.DataFrame({'id': range(100000), 'name': ['x'] * 100000})
+	assert cache.save('sqlite', 'db', 'users', frame, 'schema', 'marker')
+	data = os.path.join(str(tmp_path), 'sqlite', 'db', 'users.arrow')
+	# The default file is not compressed, so it can be read through the memory map as it is.
+	assert os.path.getsize(data) > 100000 * 8
+	pd.testing.assert_frame_equal(cache.load('sqlite', 'db', 'users', 'schema', 'marker'), frame, check_dtype=False)
+	assert cache.load('sqlite', 'db', 'users', 'schema', 'moved') is None
+	assert cache.load('sqlite', 'db', 'users', 'altered', 'marker') is None
+	assert cache.load('sqlite', 'db', 'users', 'schema', None) is None
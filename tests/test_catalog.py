@@ -0,0 +1,32 @@
+import sqlite3
+
+SCHEMA = [
+	'CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)',
+	'CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT)',
+	'CREATE TABLE audit (note INT)',
+	'CREATE TRIGGER notes_added AFTER INSERT ON notes BEGIN INSERT INTO audit VALUES (new.id); END',
+	'CREATE TRIGGER notes_changed BEFORE UPDATE OF body ON notes BEGIN SELECT 1; END',
+	'CREATE TRIGGER tags_removed DELETE ON tags BEGIN SELECT 1; END'
+]
+
+def test_catalog_is_read_once_per_database(ptc, sqlite_databases, monkeypatch):
+	driver = ptc.get_driver('sqlite')
+	catalog_f = driver.catalog_f
+	calls = []
+	monkeypatch.setattr(driver, 'catalog_f', lambda self, q, r: calls.append(q) or catalog_f(self, q, r))
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	assert len(calls) == 1
+	assert data_base.catalog['version'] == sqlite3.sqlite_version
+	assert data_base.catalog['triggers'] == {
+		'notes': {'notes_added': {'time': 'AFTER', 'event': 'INSERT'}, 'notes_changed': {'time': 'BEFORE', 'event': 'UPDATE'}},
+		'tags': {'tags_removed': {'time': 'BEFORE', 'event': 'DELETE'}}
+	}
+	connection = sqlite3.connect(paths[0])
+	connection.execute('DROP TRIGGER tags_removed')
+	connection.execute('CREATE TRIGGER tags_added AFTER INSERT ON tags BEGIN SELECT 1; END')
+	connection.commit()
+	connection.close()
+	# Triggers changed outside of the module are only seen after refresh_catalog().
+	assert 'tags_removed' in data_base.catalog['triggers']['tags']
+	assert data_base.refresh_catalog()['triggers']['tags'] == {'tags_added': {'time': 'AFTER', 'event': 'INSERT'}}
+	assert len(calls) == 2
@@ -0,0 +1,15 @@
+import pandas as pd
+import pytest
+from test_upsert import SCHEMA, rows, mirror
+
+@pytest.mark.parametrize('options', [{'chunk': 1}, {'temp': 1}])
+def test_delete_keys_with_a_composite_key(ptc, sqlite_databases, options):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	stock = data_base.tc_stock
+	# Tuples, a DataFrame and unknown keys are all accepted.
+	assert stock.delete_keys([(1, 'b'), (9, 'z')], **options)
+	assert rows(paths[0]) == [(1, 'a', 1, 'x'), (2, 'a', 3, 'z')]
+	assert stock.delete_keys(pd.DataFrame({'item': ['a'], 'shop': [2]}), **options)
+	assert rows(paths[0]) == [(1, 'a', 1, 'x')]
+	assert len(stock) == 1
+	assert mirror(stock) == rows(paths[0])
@@ -0,0 +1,29 @@
+import importlib
+import sqlite3
+import pytest
+
+def test_drivers_are_cached_and_registrable(ptc, tmp_path, monkeypatch):
+	registry = importlib.import_module(ptc.__name__ + '.database_lib')
+	monkeypatch.setattr(registry, '__DRIVERS__', dict(registry.__DRIVERS__))
+	sqlite = ptc.get_driver('sqlite')
+	assert ptc.get_driver(' SQLite ') is sqlite
+	assert sqlite is importlib.import_module(ptc.__name__ + '.database_lib.sqlite').queryPY
+	opened = []
+	class Lite(sqlite):
+		def __init__(self, *args, **kwargs):
+			opened.append(self)
+			super().__init__(*args, **kwargs)
+	ptc.register_driver('Lite', Lite)
+	assert 'lite' in ptc.drivers() and ptc.get_driver('lite') is Lite
+	path = str(tmp_path / 'db.db')
+	connection = sqlite3.connect(path)
+	connection.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY)')
+	connection.commit()
+	connection.close()
+	query = ptc.QueryRead({'lite': [{'dbFile': path, 'check_same_thread': False}]})
+	assert query.lite.data_bases[0].is_table('notes')
+	assert len(opened) > 0
+	with pytest.raises(ptc.QueryException):
+		ptc.get_driver('nosuchdbms')
+	with pytest.raises(ptc.QueryException):
+		ptc.register_driver('broken', None)
@@ -0,0 +1,35 @@
+import math
+import sqlite3
+import pytest
+
+def points(path, order: str) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return [row[0] for row in connection.execute(f'SELECT points FROM scores ORDER BY points {order}')]
+	finally:
+		connection.close()
+
+@pytest.mark.parametrize('nulls_first', [True, False])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_merge_places_nulls_like_the_dbms(ptc, tmp_path, monkeypatch, nulls_first, reverse):
+	paths = [str(tmp_path / f'db{i}.db') for i in range(3)]
+	rows = [(i, None if i % 3 == 0 else (i * 7) % 5) for i in range(24)]
+	for n, path in enumerate(paths):
+		connection = sqlite3.connect(path)
+		connection.execute('CREATE TABLE scores (id INTEGER PRIMARY KEY, points INT)')
+		# The last database holds every row, its own ORDER BY is the expected order.
+		connection.executemany('INSERT INTO scores VALUES (?, ?)', rows if n == 2 else rows[n::2])
+		connection.commit()
+		connection.close()
+	query = ptc.QueryRead({'sqlite': [{'dbFile': path, 'check_same_thread': False} for path in paths[:2]]})
+	data_base = query.sqlite
+	items = data_base.data_bases[0].tc_scores
+	# PostgreSQL sorts NULLs last in an ascending order, SQLite does so when asked with NULLS LAST.
+	monkeypatch.setattr(type(items._connection_()), 'NULLS_FIRST', nulls_first)
+	order = ptc.OrderBy('points', reverse)
+	nulls = ('LAST' if not reverse else 'FIRST') if not nulls_first else ('FIRST' if not reverse else 'LAST')
+	order.params += f' NULLS {nulls}'
+	condition = ptc.Condition(items)
+	condition.orderBy(order)
+	merged = [None if math.isnan(v) else int(v) for v in data_base.fan_out('scores', ['id', 'points'], condition)['points']]
+	assert merged == points(paths[2], f"{'DESC' if reverse else 'ASC'} NULLS {nulls}")
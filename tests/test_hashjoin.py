@@ -0,0 +1,37 @@
+import random
+import sqlite3
+import pandas as pd
+import pytest
+
+JOINS = {'inner': 'JOIN', 'left': 'LEFT JOIN', 'right': 'RIGHT JOIN', 'outer': 'FULL JOIN'}
+
+@pytest.fixture
+def tables(sqlite_databases):
+	rand = random.Random(1)
+	first = [(i, None if i % 10 == 0 else rand.randint(0, 300), f'a{i}') for i in range(1, 1501)]
+	second = [(i, None if i % 7 == 0 else rand.randint(0, 400), f'b{i}') for i in range(1, 2001)]
+	(one, two), paths = sqlite_databases(
+		['CREATE TABLE a (id INTEGER PRIMARY KEY, k INT, x TEXT)', ('INSERT INTO a VALUES (?,?,?)', first)],
+		['CREATE TABLE b (bid INTEGER PRIMARY KEY, k INT, y TEXT)', ('INSERT INTO b VALUES (?,?,?)', second)]
+	)
+	return one.tc_a, two.tc_b, paths
+
+def pairs(rows) -> list:
+	return sorted((((None if pd.isna(a) else int(a)), (None if pd.isna(b) else int(b))) for a, b in rows), key=str)
+
+@pytest.mark.skipif(sqlite3.sqlite_version_info < (3, 39), reason='RIGHT and FULL JOIN need SQLite 3.39')
+@pytest.mark.parametrize('how', list(JOINS))
+@pytest.mark.parametrize('options', [{}, {'keys': False}, {'build': 'right'}, {'build': 'right', 'keys': False}])
+def test_spill_matches_in_memory_with_nullable_keys(tables, how, options):
+	a, b, paths = tables
+	connection = sqlite3.connect(paths[0])
+	connection.execute(f"ATTACH '{paths[1]}' AS other")
+	expected = pairs(connection.execute(f'SELECT a.id, b.bid FROM a {JOINS[how]} other.b AS b ON a.k = b.k').fetchall())
+	connection.close()
+	memory = a.hash_join(b, 'k', how, size=300, **options)
+	spill = a.hash_join(b, 'k', how, size=300, memory=2000, **options)
+	in_memory = pairs(row for frame in memory for row in frame[['id', 'bid']].itertuples(index=False))
+	spilled = pairs(row for frame in spill for row in frame[['id', 'bid']].itertuples(index=False))
+	assert not memory.spilled and spill.spilled
+	assert in_memory == expected
+	assert spilled == expected
@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+LAZY = ['tqdm', 'fuzzywuzzy', 'asyncio', 'pymysql', 'psycopg2']
+
+def test_import_leaves_optional_modules_unloaded(ptc):
+	package = os.path.dirname(os.path.abspath(ptc.__file__))
+	code = (
+		f'import sys; import {ptc.__name__}; '
+		f'print(sorted(m for m in {LAZY + [ptc.__name__ + ".database_lib.sqlite"]!r} if m in sys.modules))'
+	)
+	result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(package), capture_output=True, text=True, check=True)
+	assert result.stdout.strip() == '[]'
@@ -0,0 +1,39 @@
+import csv
+import sqlite3
+import json
+import importlib
+import pytest
+
+SCHEMA = [
+	'CREATE TABLE files (id INTEGER PRIMARY KEY, size INT, name TEXT NOT NULL, data BLOB)',
+	('INSERT INTO files VALUES (?, ?, ?, ?)', [(1, 2, 'a', b'\x00\x01'), (2, None, '', b'\xff'), (3, 7, 'c', None)])
+]
+
+@pytest.fixture
+def interaction(ptc):
+	return importlib.import_module(ptc.__name__ + '.interaction')
+
+def test_export_writes_blobs_as_base64(interaction, sqlite_databases, tmp_path):
+	(data_base,), _ = sqlite_databases(SCHEMA)
+	path = str(tmp_path / 'files.csv')
+	interaction.Export(data_base.tc_files, path).run()
+	with open(path, newline='', encoding='utf-8') as file:
+		assert [row['data'] for row in csv.DictReader(file)] == ['AAE=', '/w==', '']
+	path = str(tmp_path / 'files.jsonl')
+	interaction.Export(data_base.tc_files, path).run()
+	with open(path, encoding='utf-8') as file:
+		assert [json.loads(line)['data'] for line in file] == ['AAE=', '/w==', None]
+
+@pytest.mark.parametrize('name', ['files.csv', 'files.jsonl', 'files.parquet'])
+def test_export_import_round_trip(interaction, sqlite_databases, tmp_path, name):
+	(source, target), paths = sqlite_databases(SCHEMA, SCHEMA[:1])
+	path = str(tmp_path / name)
+	assert interaction.Export(source.tc_files, path).run()['rows'] == 3
+	metrics = interaction.Import(path, target.tc_files).run()
+	assert (metrics['rows'], metrics['rejected']) == (3, 0)
+	rows = []
+	for file in paths:
+		connection = sqlite3.connect(file)
+		rows.append(connection.execute('SELECT id, size, name, data, typeof(data) FROM files ORDER BY id').fetchall())
+		connection.close()
+	assert rows[1] == rows[0]
@@ -0,0 +1,48 @@
+import importlib
+import sqlite3
+import pandas as pd
+import pytest
+
+JOINS = {'inner': 'JOIN', 'left': 'LEFT JOIN', 'right': 'RIGHT JOIN', 'outer': 'FULL JOIN'}
+
+SCHEMA = [
+	'CREATE TABLE users (user_id INTEGER PRIMARY KEY, name TEXT, note TEXT)',
+	('INSERT INTO users VALUES (?, ?, ?)', [(1, 'ann', 'u1'), (2, 'bob', None), (3, 'cid', 'u3')]),
+	'CREATE TABLE orders (order_id INTEGER PRIMARY KEY, user_id INT, total INT, note TEXT)',
+	('INSERT INTO orders VALUES (?, ?, ?, ?)', [(10, 1, 5, 'o10'), (11, 1, 7, None), (12, 3, None, 'o12'), (13, 4, 9, 'o13'), (14, None, 1, 'o14')])
+]
+
+def plain(value):
+	if value is None or isinstance(value, str):
+		return value
+	if pd.isna(value):
+		return None
+	return int(value) if float(value).is_integer() else value
+
+def normal(rows) -> list:
+	return sorted((tuple(map(plain, row)) for row in rows), key=str)
+
+def expected(path, how) -> list:
+	key = {'right': 'orders.user_id', 'outer': 'COALESCE(users.user_id, orders.user_id)'}.get(how, 'users.user_id')
+	connection = sqlite3.connect(path)
+	try:
+		return normal(connection.execute(
+			f'SELECT {key}, users.name, users.note, orders.order_id, orders.total, orders.note FROM users {JOINS[how]} orders ON users.user_id = orders.user_id'
+		).fetchall())
+	finally:
+		connection.close()
+
+@pytest.mark.skipif(sqlite3.sqlite_version_info < (3, 39), reason='RIGHT and FULL JOIN need SQLite 3.39')
+@pytest.mark.parametrize('how', list(JOINS))
+@pytest.mark.parametrize('local', [False, True])
+def test_join_matches_sqlite(ptc, sqlite_databases, monkeypatch, how, local):
+	Join = importlib.import_module(ptc.__name__ + '.condition').Join
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	if local:
+		# The mirrors are merged as for tables of different databases.
+		monkeypatch.setattr(Join, 'fetch', lambda self, columns=None, condition=None: None)
+	join = Join(data_base.tc_users, data_base.tc_orders, 'user_id', how)
+	result = pd.DataFrame(join.get())
+	assert list(result.columns[:6]) == ['user_id', 'name', 'note_x', 'order_id', 'total', 'note_y']
+	assert normal(result[['user_id', 'name', 'note_x', 'order_id', 'total', 'note_y']].itertuples(index=False, name=None)) == expected(paths[0], how)
+	assert normal(pd.DataFrame(join.get(['order_id', 'name'])).itertuples(index=False, name=None)) == normal((row[3], row[1]) for row in expected(paths[0], how))
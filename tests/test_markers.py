@@ -0,0 +1,49 @@
+import sqlite3
+import time
+
+def execute(path, *statements):
+	connection = sqlite3.connect(path)
+	try:
+		for statement in statements:
+			connection.execute(statement)
+		connection.commit()
+	finally:
+		connection.close()
+
+def load(ptc, tmp_path, monkeypatch):
+	path = str(tmp_path / 'db.db')
+	execute(path, 'CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)', "INSERT INTO notes VALUES (1, 'a')")
+	# A marker that does not move, so only the marker decides whether a table is read.
+	monkeypatch.setattr(ptc.get_driver('sqlite'), 'change_marker_f', lambda self, q, r: {table: 'same' for table in q})
+	query = ptc.QueryRead({'sqlite': [{'dbFile': path, 'check_same_thread': False}]})
+	return query, path
+
+def settle(job, timeout=10):
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline and job.is_active():
+		time.sleep(0.05)
+	assert not job.is_active()
+
+def test_unchanged_marker_skips_the_table(ptc, tmp_path, monkeypatch):
+	query, path = load(ptc, tmp_path, monkeypatch)
+	notes = query.sqlite.data_bases[0].tc_notes
+	execute(path, "INSERT INTO notes VALUES (2, 'b')")
+	settle(notes._upgraded_())
+	# The reload keeps the rows of the mirror instead of reading the table again.
+	assert list(query.sqlite.data_bases[0].tc_notes['id']) == [1]
+	notes = query.sqlite.data_bases[0].tc_notes
+	assert notes.refresh() == 0
+	assert list(notes['id']) == [1]
+	assert notes.refresh(force=True) == 2
+	assert list(notes['id']) == [1, 2]
+
+def test_tables_written_through_the_object_are_read_again(ptc, tmp_path, monkeypatch):
+	query, path = load(ptc, tmp_path, monkeypatch)
+	notes = query.sqlite.data_bases[0].tc_notes
+	execute(path, "INSERT INTO notes VALUES (3, 'c')")
+	assert notes.add([[2, 'b']], ['id', 'body'])
+	deadline = time.monotonic() + 10
+	while time.monotonic() < deadline and len(query.sqlite.data_bases[0].tc_notes) < 3:
+		time.sleep(0.05)
+	# The marker is unchanged, but the table was written, so the reload reads the row added by someone else.
+	assert sorted(query.sqlite.data_bases[0].tc_notes['id']) == [1, 2, 3]
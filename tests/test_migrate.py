@@ -0,0 +1,64 @@
+import os
+import json
+import sqlite3
+import importlib
+
+SOURCE = ['CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)', ('INSERT INTO users VALUES (?, ?)', [(i, f'user{i}') for i in range(1, 8)])]
+
+def rows(path) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return connection.execute('SELECT id, name FROM users ORDER BY id').fetchall()
+	finally:
+		connection.close()
+
+def test_resumes_after_a_batch_committed_without_its_checkpoint(ptc, sqlite_databases, tmp_path, monkeypatch):
+	(source, target), paths = sqlite_databases(SOURCE, [])
+	migrate = importlib.import_module(ptc.__name__ + '.migrate')
+	checkpoint = str(tmp_path / 'users.json')
+	replace, calls = os.replace, []
+	def crash(src, dst):
+		# The first checkpoint is written before the copy, the second after the first batch.
+		calls.append(dst)
+		if len(calls) == 2:
+			raise OSError('crashed before the checkpoint')
+		replace(src, dst)
+	monkeypatch.setattr(migrate.os, 'replace', crash)
+	try:
+		migrate.copy_table(source.tc_users, target, key='id', size=3, chunk=3, checkpoint=checkpoint)
+		assert False, 'the copy did not fail'
+	except OSError:
+		pass
+	assert [r[0] for r in rows(paths[1])] == [1, 2, 3]
+	monkeypatch.setattr(migrate.os, 'replace', replace)
+	# The mirror of the target has not been reloaded, the retry must neither create the table nor copy rows twice.
+	metrics = migrate.copy_table(source.tc_users, target, key='id', size=3, chunk=3, checkpoint=checkpoint)
+	assert metrics['created'] is False and metrics['resumed'] is True
+	assert metrics['rows'] == 4
+	assert rows(paths[1]) == rows(paths[0])
+	assert not os.path.isfile(checkpoint)
+
+def test_time_zones_are_kept_on_postgresql(ptc):
+	datatypes = importlib.import_module(ptc.__name__ + '.datatypes')
+	postgresql, mysql = datatypes.DataTypes('postgresql'), datatypes.DataTypes('mysql')
+	assert postgresql.convert('timestamp with time zone') == 'TIMESTAMPTZ'
+	assert postgresql.convert('timestamptz') == 'TIMESTAMPTZ'
+	assert postgresql.convert('time with time zone') == 'TIMETZ'
+	assert postgresql.convert('timestamp without time zone') == 'TIMESTAMP'
+	assert mysql.convert('timestamptz') == mysql.convert('timestamp with time zone')
+
+def test_text_keys_resume_from_the_checkpoint(ptc, sqlite_databases, tmp_path):
+	source_schema = ['CREATE TABLE codes (code TEXT PRIMARY KEY, n INT)', ('INSERT INTO codes VALUES (?, ?)', [(c, i) for i, c in enumerate('abcd')])]
+	target_schema = ['CREATE TABLE codes (code TEXT PRIMARY KEY, n INT)', "INSERT INTO codes VALUES ('a', 0), ('b', 1), ('zzz', 9)"]
+	(source, target), paths = sqlite_databases(source_schema, target_schema)
+	migrate = importlib.import_module(ptc.__name__ + '.migrate')
+	checkpoint = tmp_path / 'codes.json'
+	checkpoint.write_text(json.dumps({'key': ['code'], 'last': ['b'], 'rows': 2}), encoding='utf-8')
+	# The largest key of the target says nothing about the order of the source.
+	metrics = migrate.copy_table(source.tc_codes, target, key='code', checkpoint=str(checkpoint))
+	assert metrics['resumed'] is True and metrics['rows'] == 2
+	connection = sqlite3.connect(paths[1])
+	try:
+		assert connection.execute('SELECT code FROM codes ORDER BY code').fetchall() == [('a',), ('b',), ('c',), ('d',), ('zzz',)]
+	finally:
+		connection.close()
@@ -0,0 +1,45 @@
+import pytest
+
+SCHEMA = [
+	'CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)',
+	('INSERT INTO notes VALUES (?, ?)', [(i, f'n{i}') for i in range(1, 101)])
+]
+
+@pytest.fixture
+def calls(ptc, monkeypatch):
+	driver = ptc.get_driver('sqlite')
+	query_f = driver.query_f
+	calls = {'snapshots': [], 'ranges': 0, 'fail': False}
+	def record(self, method, que={}, req={}):
+		# SQLite has no shared snapshots, the calls of a DBMS that has them are recorded instead.
+		if method == 'SNAPSHOT':
+			calls['snapshots'].append((que, dict(req)))
+			if calls['fail'] and que is None:
+				raise PermissionError('no RELOAD privilege')
+			return None if req.get('release') else 'snapshot'
+		if method == 'SELECT' and isinstance(req, str) and '>=' in req:
+			calls['ranges'] += 1
+		return query_f(self, method, que, req)
+	monkeypatch.setattr(driver, 'PARALLEL_LOAD', True)
+	monkeypatch.setattr(driver, 'query_f', record)
+	return calls
+
+def test_large_tables_load_in_key_ranges_over_one_snapshot(ptc, sqlite_databases, calls):
+	(data_base,), paths = sqlite_databases(SCHEMA, parallel=3, split=50)
+	assert list(data_base.tc_notes['id']) == list(range(1, 101))
+	assert calls['ranges'] == 3
+	# The coordinator takes the snapshot, every range connection starts it, then the coordinator releases it.
+	assert calls['snapshots'] == [(None, {})] + [('snapshot', {})] * 3 + [('snapshot', {'release': True})]
+
+def test_snapshot_failure_falls_back_to_one_query(ptc, sqlite_databases, calls):
+	calls['fail'] = True
+	(data_base,), paths = sqlite_databases(SCHEMA, parallel=3, split=50)
+	assert list(data_base.tc_notes['id']) == list(range(1, 101))
+	assert calls['ranges'] == 0
+	assert calls['snapshots'] == [(None, {})]
+
+def test_small_tables_load_with_one_query(ptc, sqlite_databases, calls):
+	(data_base,), paths = sqlite_databases(SCHEMA, parallel=3, split=1000)
+	assert list(data_base.tc_notes['id']) == list(range(1, 101))
+	assert calls['ranges'] == 0
+	assert calls['snapshots'] == []
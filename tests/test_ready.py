@@ -0,0 +1,29 @@
+import asyncio
+import sqlite3
+import pytest
+
+@pytest.fixture
+def path(tmp_path):
+	path = str(tmp_path / 'db.db')
+	connection = sqlite3.connect(path)
+	connection.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)')
+	connection.execute("INSERT INTO notes VALUES (1, 'a')")
+	connection.commit()
+	connection.close()
+	return path
+
+@pytest.mark.parametrize('thread', [False, True])
+def test_unknown_tables_fail_once_loaded(ptc, path, thread):
+	query = ptc.QueryRead({'sqlite': [{'dbFile': path, 'check_same_thread': False}]}, thread=thread)
+	# Futures requested before and after the load both end, the unknown table with an error instead of waiting forever.
+	missing = query.future('sqlite', 'missing')
+	assert list(query.wait('sqlite', 'notes', timeout=10)['id']) == [1]
+	with pytest.raises(ptc.QueryException, match="'missing' table does not exist"):
+		missing.result(10)
+	with pytest.raises(ptc.QueryException, match="'other' table does not exist"):
+		query.wait('sqlite', 'other', timeout=10)
+	with pytest.raises(ptc.QueryException, match="'other' table does not exist"):
+		asyncio.run(asyncio.wait_for(query.ready('sqlite', 'other'), 10))
+	with pytest.raises(ptc.QueryException):
+		query.wait('mysql', timeout=10)
+	assert query.wait(timeout=10) is query
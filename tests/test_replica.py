@@ -0,0 +1,36 @@
+import sqlite3
+
+SCHEMA = ['CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL, age INT)', "INSERT INTO users VALUES (1, 'Ann', 30)"]
+
+def where(ptc, items, test: str):
+	condition = ptc.Condition(items)
+	condition.where({'name': lambda col, **kwargs: ptc.Where(col, f'{col.column} {test}')})
+	return condition
+
+def rows(path) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return connection.execute('SELECT id, name, age FROM users ORDER BY id').fetchall()
+	finally:
+		connection.close()
+
+def test_writes_reach_sqlite_secondaries(ptc, sqlite_databases):
+	(primary, secondary), paths = sqlite_databases(SCHEMA, SCHEMA, check_same_thread=True)
+	errors = []
+	users = primary.tc_users.replicate(secondary.tc_users, retry=0.1, max_retries=0, on_error=lambda e, items, method: errors.append(e))
+	try:
+		assert users.add([['Bob', 41], ['Cid', 52]], ['name', 'age'])
+		assert users.add([[10, 'Dan', 20]], ['id', 'name', 'age'])
+		assert users.add([['Eve', 33]], ['name', 'age'])
+		assert users.flush(timeout=10)
+		assert errors == []
+		assert [m['applied'] for m in users.metrics()] == [3]
+		assert [r[1:] for r in rows(paths[1])] == [r[1:] for r in rows(paths[0])]
+		assert [r[0] for r in rows(paths[1])][-2:] == [10, 11]
+		users.update({'age': 99}, where(ptc, primary.tc_users, "= 'Bob'"))
+		users.delete(where(ptc, primary.tc_users, "= 'Cid'"))
+		assert users.flush(timeout=10)
+		assert errors == []
+		assert [r[1:] for r in rows(paths[1])] == [r[1:] for r in rows(paths[0])]
+	finally:
+		users.close()
@@ -0,0 +1,64 @@
+import importlib
+import threading
+import time
+import pytest
+
+@pytest.fixture
+def scheduler(ptc):
+	scheduler = importlib.import_module(ptc.__name__ + '.scheduler').Scheduler(workers=2)
+	yield scheduler
+	scheduler.shutdown(wait=5)
+
+def until(condition, timeout=10):
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline and not condition():
+		time.sleep(0.01)
+	return condition()
+
+def test_submit_coalesces_requests_for_the_same_key(scheduler):
+	release = threading.Event()
+	calls = []
+	def work():
+		calls.append(time.monotonic())
+		release.wait(10)
+	job = scheduler.submit('key', work)
+	assert until(lambda: len(calls) == 1)
+	# Requests made while the job runs are merged into a single run after it.
+	assert scheduler.submit('key', work) is job
+	assert scheduler.submit('key', work) is job
+	assert job.coalesced == 2
+	release.set()
+	assert until(lambda: not job.is_active())
+	assert job.runs == 2
+	assert len(calls) == 2
+	assert scheduler.submit('key', work) is not job
+
+def test_periodic_job_never_overlaps_itself(scheduler):
+	lock = threading.Lock()
+	state = {'running': 0, 'most': 0}
+	def work():
+		with lock:
+			state['running'] += 1
+			state['most'] = max(state['most'], state['running'])
+		time.sleep(0.2)
+		with lock:
+			state['running'] -= 1
+	job = scheduler.every(0.02, work, delay=0)
+	assert until(lambda: job.runs >= 2)
+	job.cancel()
+	assert state['most'] == 1
+	assert job.skipped > 0
+
+def test_timeout_is_reported_to_on_error(scheduler):
+	errors = []
+	release = threading.Event()
+	job = scheduler.once(0, release.wait, args=(10,), timeout=0.1, on_error=errors.append)
+	assert until(lambda: len(errors) == 1)
+	assert isinstance(errors[0], TimeoutError)
+	assert job.timeouts == 1
+	# The late run is reported once and still finishes normally.
+	release.set()
+	assert until(lambda: not job.is_active())
+	assert job.runs == 1
+	assert job.failures == 0
+	assert len(errors) == 1
@@ -0,0 +1,68 @@
+import time
+import sqlite3
+import importlib
+import pytest
+
+SCRIPT = """-- a comment; not a statement
+INSERT INTO notes VALUES (1, 'a;b');
+INSERT INTO notes VALUES (2, /* ; */ 'it''s');
+SELECT $$ ; $$, $tag$ $$ ; $tag$;
+CREATE TRIGGER notes_ai AFTER INSERT ON notes
+BEGIN
+	UPDATE notes SET body = body || ';' WHERE id = NEW.id;
+END;
+DELIMITER //
+CREATE PROCEDURE p() BEGIN SELECT 1; END//
+DELIMITER ;
+SELECT "x;y" -- trailing; comment
+;
+"""
+
+@pytest.fixture
+def interaction(ptc):
+	return importlib.import_module(ptc.__name__ + '.interaction')
+
+def test_statements_respect_quotes_comments_and_bodies(interaction, tmp_path):
+	path = tmp_path / 'script.sql'
+	path.write_text(SCRIPT, encoding='utf-8')
+	statements = list(interaction.File(str(path), 'r', lazy=True).statements())
+	assert statements == [
+		(2, "-- a comment; not a statement\nINSERT INTO notes VALUES (1, 'a;b')"),
+		(3, "INSERT INTO notes VALUES (2, /* ; */ 'it''s')"),
+		(4, "SELECT $$ ; $$, $tag$ $$ ; $tag$"),
+		(5, "CREATE TRIGGER notes_ai AFTER INSERT ON notes\nBEGIN\n\tUPDATE notes SET body = body || ';' WHERE id = NEW.id;\nEND"),
+		(10, "CREATE PROCEDURE p() BEGIN SELECT 1; END"),
+		(12, 'SELECT "x;y" -- trailing; comment')
+	]
+
+def test_failed_statement_replays_its_batch(ptc, interaction, sqlite_databases, tmp_path):
+	(data_base,), paths = sqlite_databases(['CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)'])
+	path = tmp_path / 'seed.sql'
+	path.write_text("INSERT INTO notes VALUES (1, 'a');\nINSERT INTO notes VALUES (2, 'b');\nINSERT INTO notes VALUES (1, 'duplicate');\nINSERT INTO notes VALUES (3, 'c');\n", encoding='utf-8')
+	metrics = interaction.ScriptRunner(data_base, str(path), batch_size=10, stop_on_error=False).run()
+	assert metrics['statements'] == 3
+	assert [(error['line'], error['statement']) for error in metrics['errors']] == [(3, "INSERT INTO notes VALUES (1, 'duplicate')")]
+	connection = sqlite3.connect(paths[0])
+	try:
+		assert connection.execute('SELECT id, body FROM notes ORDER BY id').fetchall() == [(1, 'a'), (2, 'b'), (3, 'c')]
+	finally:
+		connection.close()
+
+def test_scripts_reload_tables_whatever_their_marker(ptc, interaction, tmp_path, monkeypatch):
+	path = str(tmp_path / 'db.db')
+	connection = sqlite3.connect(path)
+	connection.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)')
+	connection.execute("INSERT INTO notes VALUES (1, 'a')")
+	connection.commit()
+	connection.close()
+	# A marker that does not move, as the statistics of PostgreSQL can right after a commit.
+	monkeypatch.setattr(ptc.get_driver('sqlite'), 'change_marker_f', lambda self, q, r: {table: 'same' for table in q})
+	query = ptc.QueryRead({'sqlite': [{'dbFile': path, 'check_same_thread': False}]})
+	data_base = query.sqlite.data_bases[0]
+	script = tmp_path / 'change.sql'
+	script.write_text("INSERT INTO notes VALUES (2, 'b');\n", encoding='utf-8')
+	interaction.ScriptRunner(data_base, str(script)).run()
+	deadline = time.monotonic() + 10
+	while time.monotonic() < deadline and len(query.sqlite.data_bases[0].tc_notes) < 2:
+		time.sleep(0.05)
+	assert list(query.sqlite.data_bases[0].tc_notes['id']) == [1, 2]
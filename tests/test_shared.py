@@ -0,0 +1,39 @@
+import os
+import sqlite3
+import numpy as np
+import pytest
+
+pytest.importorskip('pyarrow')
+
+def mapped(array, folder: str) -> bool:
+	"""
+	Return True if the data of an array lies in a memory map of a file in the folder.
+	"""
+	address = array.__array_interface__['data'][0]
+	with open('/proc/self/maps') as maps:
+		for line in maps:
+			fields = line.split()
+			if len(fields) >= 6 and fields[5].startswith(folder):
+				start, stop = (int(x, 16) for x in fields[0].split('-'))
+				if start <= address < stop:
+					return True
+	return False
+
+@pytest.mark.skipif(not os.path.isfile('/proc/self/maps'), reason='needs /proc/self/maps')
+def test_attached_numeric_columns_are_views_of_the_mapped_files(ptc, tmp_path):
+	path, folder = str(tmp_path / 'db.db'), str(tmp_path / 'shm')
+	connection = sqlite3.connect(path)
+	connection.execute('CREATE TABLE t (id INTEGER PRIMARY KEY, v REAL, s TEXT)')
+	connection.executemany('INSERT INTO t VALUES (?,?,?)', [(i, i / 2, f's{i}') for i in range(1, 10001)])
+	connection.commit()
+	connection.close()
+	ptc.SharedMirror(folder).publish(ptc.QueryRead({'sqlite': [{'dbFile': path}]}))
+	items = ptc.SharedMirror(folder).attach().sqlite.data_bases[0].tc_t
+	for column in ('id', 'v'):
+		data = items.get_column(column)
+		assert mapped(data.to_numpy(), folder)
+		assert mapped(items[column].to_numpy(), folder)
+		assert np.shares_memory(data.to_numpy(), items[column].to_numpy())
+		assert data.__copy_data__ is data
+	assert items.tc_v.sum() == sum(i / 2 for i in range(1, 10001))
+	assert list(items.tc_s[:2]) == ['s1', 's2']
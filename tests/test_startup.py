@@ -0,0 +1,34 @@
+import json
+import time
+
+SCHEMA = [
+	'CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)',
+	('INSERT INTO notes VALUES (?, ?)', [(1, 'a'), (2, 'b')])
+]
+
+def test_startup_report_per_database_and_table(ptc, sqlite_databases, tmp_path):
+	report = tmp_path / 'startup.jsonl'
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	query = ptc.QueryRead({'sqlite': [{'dbFile': paths[0], 'check_same_thread': False}]}, report=str(report))
+	(base,) = query.STARTUP['databases'].values()
+	assert base['method'] == 'sqlite'
+	notes = base['tables']['notes']
+	assert notes['rows'] == 2 and notes['bytes'] > 0 and notes['memory'] > 0 and not notes['cached']
+	assert all(base[phase] >= 0 for phase in ('connect', 'catalog', 'fetch', 'build', 'enjoin', 'introspection'))
+	assert base['rows'] == sum(table['rows'] for table in base['tables'].values())
+	assert query.STARTUP['total'] >= base['connect']
+	lines = [json.loads(line) for line in report.read_text(encoding='utf-8').splitlines()]
+	# One line per table and one per database.
+	assert len(lines) == len(base['tables']) + 1
+	assert {line['table'] for line in lines} == set(base['tables']) | {None}
+	# Reloads after writes are not reported.
+	assert query.sqlite.data_bases[0].tc_notes.add([[3, 'c']], ['id', 'body'])
+	deadline = time.monotonic() + 10
+	while time.monotonic() < deadline and len(query.sqlite.data_bases[0].tc_notes) < 3:
+		time.sleep(0.05)
+	assert len(report.read_text(encoding='utf-8').splitlines()) == len(lines)
+
+def test_no_report_by_default(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	query = ptc.QueryRead({'sqlite': [{'dbFile': paths[0], 'check_same_thread': False}]})
+	assert query.STARTUP is None
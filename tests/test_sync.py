@@ -0,0 +1,64 @@
+import sqlite3
+import threading
+
+SCHEMA = ['CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL)', "INSERT INTO users VALUES (1, 'Ann')"]
+
+def execute(path, *statements):
+	connection = sqlite3.connect(path)
+	try:
+		for statement in statements:
+			connection.execute(statement)
+		connection.commit()
+	finally:
+		connection.close()
+
+def test_background_sync_merges_under_the_table_lock(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	users = data_base.tc_users
+	policy = users.sync_policy('id')
+	execute(paths[0], "INSERT INTO users VALUES (2, 'Bob')")
+	worker = threading.Thread(target=policy.__background__)
+	with users.LOCK:
+		worker.start()
+		worker.join(0.5)
+		# The scheduler thread waits for the owner of the lock before it changes the mirror.
+		assert worker.is_alive()
+		assert list(users['id']) == [1]
+	worker.join(10)
+	policy.stop()
+	assert not worker.is_alive()
+	assert list(users['id']) == [1, 2]
+
+def test_watermark_sync_merges_new_and_updated_rows(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases([
+		'CREATE TABLE events (id INTEGER PRIMARY KEY, state TEXT NOT NULL, version INT NOT NULL)',
+		"INSERT INTO events VALUES (1, 'new', 1), (2, 'new', 2)"
+	])
+	events = data_base.tc_events
+	policy = events.sync_policy('version')
+	execute(paths[0], "UPDATE events SET state = 'done', version = 3 WHERE id = 1", "INSERT INTO events VALUES (3, 'new', 4)")
+	# The row at the watermark is read again, the updated and the new row are merged by key.
+	assert events.refresh() == 3
+	assert sorted(events[['id', 'state', 'version']].itertuples(index=False, name=None)) == [(1, 'done', 3), (2, 'new', 2), (3, 'new', 4)]
+	assert policy.metrics()['watermark'] == 4
+	assert policy.syncs == 1
+	assert events.refresh() == 1
+	assert len(events) == 3
+
+def test_change_capture_follows_a_key_change(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA + ["INSERT INTO users VALUES (2, 'Bob'), (3, 'Cid')"])
+	users = data_base.tc_users
+	capture = users.capture_changes()
+	execute(paths[0], "UPDATE users SET id = 5, name = 'Eve' WHERE id = 1", 'DELETE FROM users WHERE id = 3', "UPDATE users SET name = 'Bo' WHERE id = 2")
+	# The old key of the moved row is dropped like the deleted one, the new key is merged.
+	assert users.refresh() == 4
+	assert sorted(users[['id', 'name']].itertuples(index=False, name=None)) == [(2, 'Bo'), (5, 'Eve')]
+	# The consumed entries are pruned, so the next sync has nothing to apply.
+	connection = sqlite3.connect(paths[0])
+	assert connection.execute('SELECT COUNT(*) FROM _tc_changelog').fetchone() == (0,)
+	connection.close()
+	assert users.refresh() == 0
+	assert capture.remove()
+	execute(paths[0], "INSERT INTO users VALUES (6, 'Fay')")
+	assert users.refresh() == 0
+	assert len(users) == 2
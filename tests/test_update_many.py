@@ -0,0 +1,28 @@
+import sqlite3
+import pandas as pd
+
+SCHEMA = [
+	'CREATE TABLE stock (shop INT NOT NULL, item TEXT NOT NULL, qty INT, note TEXT, PRIMARY KEY (shop, item))',
+	('INSERT INTO stock VALUES (?, ?, ?, ?)', [(1, 'a', 1, 'x'), (1, 'b', 2, 'y'), (2, 'a', 3, 'z')])
+]
+
+def rows(path) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return connection.execute('SELECT shop, item, qty, note FROM stock ORDER BY shop, item').fetchall()
+	finally:
+		connection.close()
+
+def mirror(items) -> list:
+	return sorted(pd.DataFrame(items)[['shop', 'item', 'qty', 'note']].itertuples(index=False, name=None))
+
+def test_update_many_with_a_composite_key(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	stock = data_base.tc_stock
+	# Every row carries its own values, rows with an unknown key are ignored.
+	assert stock.update_many([[1, 'b', 20, 'p'], [2, 'a', 30, 'q'], [9, 'z', 1, 'none']], columns=['shop', 'item', 'qty', 'note'])
+	assert rows(paths[0]) == [(1, 'a', 1, 'x'), (1, 'b', 20, 'p'), (2, 'a', 30, 'q')]
+	assert stock.update_many([{'shop': 1, 'item': 'a', 'qty': None}])
+	assert rows(paths[0]) == [(1, 'a', None, 'x'), (1, 'b', 20, 'p'), (2, 'a', 30, 'q')]
+	assert len(stock) == 3
+	assert [(s, i, None if pd.isna(q) else q, n) for s, i, q, n in mirror(stock)] == rows(paths[0])
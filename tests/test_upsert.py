@@ -0,0 +1,34 @@
+import sqlite3
+import pandas as pd
+
+SCHEMA = [
+	'CREATE TABLE stock (shop INT NOT NULL, item TEXT NOT NULL, qty INT, note TEXT, PRIMARY KEY (shop, item))',
+	('INSERT INTO stock VALUES (?, ?, ?, ?)', [(1, 'a', 1, 'x'), (1, 'b', 2, 'y'), (2, 'a', 3, 'z')])
+]
+
+def rows(path) -> list:
+	connection = sqlite3.connect(path)
+	try:
+		return connection.execute('SELECT shop, item, qty, note FROM stock ORDER BY shop, item').fetchall()
+	finally:
+		connection.close()
+
+def mirror(items) -> list:
+	return sorted(pd.DataFrame(items)[['shop', 'item', 'qty', 'note']].itertuples(index=False, name=None))
+
+def test_upsert_with_a_composite_key(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	stock = data_base.tc_stock
+	assert stock.upsert([[1, 'a', 10, 'new'], [3, 'c', 5, 'w']], columns=['shop', 'item', 'qty', 'note'])
+	assert rows(paths[0]) == [(1, 'a', 10, 'new'), (1, 'b', 2, 'y'), (2, 'a', 3, 'z'), (3, 'c', 5, 'w')]
+	# Only the update columns change on a conflict.
+	assert stock.upsert([{'shop': 1, 'item': 'b', 'qty': 20, 'note': 'kept'}, {'shop': 2, 'item': 'b', 'qty': 7, 'note': 'v'}], update_columns=['qty'])
+	assert rows(paths[0]) == [(1, 'a', 10, 'new'), (1, 'b', 20, 'y'), (2, 'a', 3, 'z'), (2, 'b', 7, 'v'), (3, 'c', 5, 'w')]
+	assert mirror(stock) == rows(paths[0])
+
+def test_upsert_writes_nulls_into_integer_columns(ptc, sqlite_databases):
+	(data_base,), paths = sqlite_databases(SCHEMA)
+	stock = data_base.tc_stock
+	assert stock.upsert([{'shop': 2, 'item': 'a', 'qty': None, 'note': None}])
+	assert rows(paths[0])[-1] == (2, 'a', None, None)
+	assert [(s, i, None if pd.isna(q) else q, None if pd.isna(n) else n) for s, i, q, n in mirror(stock)] == rows(paths[0])
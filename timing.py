@@ -0,0 +1,127 @@
+import json
+import time as TM
+import contextlib
+
+class StartupReport:
+	"""
+	A class representing a per-phase timing breakdown of a QueryRead start.
+
+	Times are collected per database and per table for the phases connect, catalog (table and
+	column lists, change markers), fetch (rows from the database or the snapshot cache), build
+	(DataFrame construction), enjoin (Tables and Items construction) and introspection (version,
+	procedures, functions and triggers), together with the number of rows, the fetched bytes and
+	the memory of the resulting mirror.
+
+	Args:
+		path (str, optional): A file the report is appended to as JSON lines by write(). Defaults to None.
+
+	Attributes:
+		total (float): The wall-clock time of the whole start in seconds.
+		databases (dict): The collected values, keyed by 'method.database'.
+	"""
+
+	PHASES = ('connect', 'catalog', 'fetch', 'build', 'enjoin', 'introspection')
+
+	def __init__(self, path: str = None):
+		self.path = path
+		self.total = 0.0
+		self.databases = {}
+		self.__started = TM.perf_counter()
+
+	def __str__(self):
+		return json.dumps(self.as_dict(), indent=4, default=str)
+
+	def entry(self, method: str, name: str, table: str = None) -> dict:
+		"""
+		Return the dictionary of a database or of one of its tables, creating it on first use.
+
+		Args:
+			method (str): The DBMS name.
+			name (str): The database name.
+			table (str, optional): The table name. Defaults to the database itself.
+
+		Returns:
+			dict: The collected values.
+		"""
+		base = self.databases.setdefault(f'{method}.{name}', dict({'method': method, 'database': name, 'tables': {}}, **dict.fromkeys(self.PHASES, 0.0)))
+		if table is None:
+			return base
+		return base['tables'].setdefault(table, dict({'rows': 0, 'bytes': 0, 'memory': 0, 'cached': False}, **dict.fromkeys(self.PHASES[2:], 0.0)))
+
+	@contextlib.contextmanager
+	def phase(self, method: str, name: str, phase: str, table: str = None):
+		"""
+		Measure the time spent in the body of a with statement and add it to a phase.
+
+		Args:
+			method (str): The DBMS name.
+			name (str): The database name.
+			phase (str): One of PHASES.
+			table (str, optional): The table name. Defaults to the database itself.
+		"""
+		start = TM.perf_counter()
+		try:
+			yield
+		finally:
+			entry = self.entry(method, name, table)
+			entry[phase] = entry.get(phase, 0.0) + TM.perf_counter() - start
+
+	def count(self, method: str, name: str, table: str = None, **values):
+		"""
+		Record rows, bytes, memory or other values of a database or table.
+
+		Args:
+			method (str): The DBMS name.
+			name (str): The database name.
+			table (str, optional): The table name. Defaults to the database itself.
+			**values: The values to store.
+		"""
+		self.entry(method, name, table).update(values)
+
+	def finish(self):
+		"""
+		Stop the wall-clock time of the start and write the report if a path was given.
+		"""
+		self.total = TM.perf_counter() - self.__started
+		if self.path is not None:
+			self.write()
+
+	def as_dict(self) -> dict:
+		"""
+		Return the report with the table phases summed up per database.
+
+		Returns:
+			dict: {'total': seconds, 'databases': {...}}.
+		"""
+		databases = {}
+		for key, base in self.databases.items():
+			base = dict(base)
+			tables = base['tables']
+			for phase in self.PHASES[2:]:
+				base[phase] += sum(table[phase] for table in tables.values())
+			for value in ('rows', 'bytes', 'memory'):
+				base[value] = sum(table[value] for table in tables.values())
+			databases[key] = base
+		return {'total': self.total, 'databases': databases}
+
+	def write(self, path: str = None):
+		"""
+		Append the report as JSON lines, one line per table followed by one line per database.
+
+		Args:
+			path (str, optional): The file to append to. Defaults to the path of the report.
+		"""
+		report = self.as_dict()
+		with open(path or self.path, 'a', encoding='utf-8') as file:
+			for base in report['databases'].values():
+				for table, values in base['tables'].items():
+					file.write(json.dumps(dict(values, method=base['method'], database=base['database'], table=table), default=str) + '\n')
+				file.write(json.dumps(dict({k: v for k, v in base.items() if k != 'tables'}, table=None, total=report['total']), default=str) + '\n')
+
+def phase(report, method: str, name: str, phase: str, table: str = None):
+	"""
+	Return report.phase(...) or a context that does nothing when no report is collected.
+	"""
+	if report is None:
+		return contextlib.nullcontext()
+	return report.phase(method, name, phase, table)